@@ -0,0 +1,148 @@
+"""
+Benchmark ``BcolzMinuteBarReader.load_raw_arrays`` for wide universes.
+
+Writes synthetic minute bars for the largest requested number of sids to a
+temporary directory, then times a multi-day window load, which crosses an
+early close, for each universe size. The current implementation is compared
+against the previous per-sid implementation, which is reproduced below.
+
+Usage::
+
+    $ python etc/bench_minute_load_raw_arrays.py --sids 500 2000 5000
+"""
+from __future__ import print_function
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.testing import tmp_dir
+from zipline.utils.calendars import get_calendar
+
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def per_sid_load_raw_arrays(reader, fields, start_dt, end_dt, sids):
+    """The per-sid implementation of ``load_raw_arrays``, for reference.
+    """
+    start_idx = reader._find_position_of_minute(start_dt)
+    end_idx = reader._find_position_of_minute(end_dt)
+
+    num_minutes = (end_idx - start_idx + 1)
+
+    results = []
+
+    indices_to_exclude = reader._exclusion_indices_for_range(
+        start_idx, end_idx)
+    if indices_to_exclude is not None:
+        for excl_start, excl_stop in indices_to_exclude:
+            length = excl_stop - excl_start + 1
+            num_minutes -= length
+
+    shape = num_minutes, len(sids)
+
+    for field in fields:
+        if field != 'volume':
+            out = np.full(shape, np.nan)
+        else:
+            out = np.zeros(shape, dtype=np.uint32)
+
+        for i, sid in enumerate(sids):
+            carray = reader._open_minute_file(field, sid)
+            values = carray[start_idx:end_idx + 1]
+            if indices_to_exclude is not None:
+                for excl_start, excl_stop in indices_to_exclude[::-1]:
+                    excl_slice = np.s_[
+                        excl_start - start_idx:excl_stop - start_idx + 1]
+                    values = np.delete(values, excl_slice)
+
+            where = values != 0
+            if field != 'volume':
+                out[:len(where), i][where] = (
+                    values[where] * reader._ohlc_ratio_inverse_for_sid(sid))
+            else:
+                out[:len(where), i][where] = values[where]
+
+        results.append(out)
+    return results
+
+
+def write_data(path, calendar, start, end, num_sids):
+    writer = BcolzMinuteBarWriter(
+        path,
+        calendar,
+        start,
+        end,
+        US_EQUITIES_MINUTES_PER_DAY,
+    )
+    minutes = calendar.minutes_for_sessions_in_range(start, end)
+    values = np.arange(1, len(minutes) + 1, dtype=np.float64)
+    frame = pd.DataFrame(
+        {
+            'open': values,
+            'high': values + 1,
+            'low': values,
+            'close': values,
+            'volume': values,
+        },
+        index=minutes,
+    )
+    writer.write((sid, frame) for sid in range(num_sids))
+    return minutes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sids', type=int, nargs='+', default=[500, 2000, 5000],
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    calendar = get_calendar('NYSE')
+    # Includes the early close on 2015-11-27.
+    start = pd.Timestamp('2015-11-23', tz='UTC')
+    end = pd.Timestamp('2015-12-01', tz='UTC')
+
+    with tmp_dir() as d:
+        minutes = write_data(d.path, calendar, start, end, max(args.sids))
+        for num_sids in sorted(args.sids):
+            sids = list(range(num_sids))
+            timings = {}
+            for name, f in [('per-sid', per_sid_load_raw_arrays),
+                            ('batched', None)]:
+                # Use a fresh reader so that both start with a cold carray
+                # cache, then warm it before timing.
+                reader = BcolzMinuteBarReader(d.path, sid_cache_size=num_sids)
+                if f is None:
+                    def load(reader=reader):
+                        return reader.load_raw_arrays(
+                            FIELDS, minutes[0], minutes[-1], sids,
+                        )
+                else:
+                    def load(reader=reader, f=f):
+                        return f(reader, FIELDS, minutes[0], minutes[-1], sids)
+                load()
+                timings[name] = min(
+                    timeit.repeat(load, number=1, repeat=args.repeat),
+                )
+            print(
+                '{0:>6} sids: per-sid {1:.3f}s, batched {2:.3f}s, '
+                'speedup {3:.2f}x'.format(
+                    num_sids,
+                    timings['per-sid'],
+                    timings['batched'],
+                    timings['per-sid'] / timings['batched'],
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,38 @@
+from functools import partial
 import os
+import stat
+import warnings
 
 from nose_parameterized import parameterized
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
-from toolz import valmap
+from toolz import curry, valmap
 import toolz.curried.operator as op
 from zipline.assets import ASSET_DB_VERSION
 
 from zipline.assets.asset_writer import check_version_info
 from zipline.assets.synthetic import make_simple_equity_info
-from zipline.data.bundles import UnknownBundle, from_bundle_ingest_dirname, \
-    ingestions_for_bundle
+from zipline.data.bundles import InMemoryBundle, UnknownBundle, \
+    from_bundle_ingest_dirname, ingestions_for_bundle
 from zipline.data.bundles.core import _make_bundle_core, BadClean, \
-    to_bundle_ingest_dirname, asset_db_path
+    to_bundle_ingest_dirname, asset_db_path, ingest_map, minute_equity_path, \
+    BundleData
+from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+)
+from zipline.data.mmap_minute_bars import (
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
+)
+from zipline.data.parquet_daily_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+)
+from zipline.data.resample import MinuteResampleSessionBarReader
+from zipline.errors import SymbolNotFound
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -264,6 +284,197 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_ingest_mmap_minute_bars(self):
+        calendar = get_calendar('NYSE')
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        minute_bar_data = make_bar_data(equities, minutes)
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+            minute_bar_format='mmap',
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            assert_is_instance(minute_bar_writer, MmapMinuteBarWriter)
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(minute_bar_data)
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+
+        assert_is_instance(bundle.equity_minute_bar_reader,
+                           MmapMinuteBarReader)
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, equities, colname),
+                msg=colname,
+            )
+
+    def test_ingest_minute_bars_only(self):
+        calendar = get_calendar('NYSE')
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        minute_bar_data = make_bar_data(equities, minutes)
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(minute_bar_data)
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+
+        # Without daily data, the sessions are resampled from the minutes.
+        assert_is_instance(bundle.equity_daily_bar_reader,
+                           MinuteResampleSessionBarReader)
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        expected = MinuteResampleSessionBarReader(
+            calendar,
+            bundle.equity_minute_bar_reader,
+        ).load_raw_arrays(columns, self.START_DATE, self.END_DATE, sids)
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, expected_column, colname in zip(actual,
+                                                           expected,
+                                                           columns):
+            assert_equal(actual_column, expected_column, msg=colname)
+
+        # The resampled sessions are persisted inside the bundle directory.
+        ingestion = pth.data_path(
+            ['bundle', to_bundle_ingest_dirname(
+                ingestions_for_bundle('bundle', self.environ)[0],
+            )],
+            environ=self.environ,
+        )
+        assert_in('daily_equities_resampled.bcolz', os.listdir(ingestion))
+
+    def test_register_unknown_minute_bar_format(self):
+        with assert_raises(ValueError):
+            @self.register('bundle', minute_bar_format='ayy')
+            def bundle_ingest(*args):
+                pass
+
+    def test_ingest_parquet_daily_bars(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        daily_bar_data = make_bar_data(equities, sessions)
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+            daily_bar_format='parquet',
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            assert_is_instance(daily_bar_writer, ParquetDailyBarWriter)
+            asset_db_writer.write(equities=equities)
+            daily_bar_writer.write(daily_bar_data)
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+
+        assert_is_instance(bundle.equity_daily_bar_reader,
+                           ParquetDailyBarReader)
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, equities, colname),
+                msg=colname,
+            )
+
+    def test_register_unknown_daily_bar_format(self):
+        with assert_raises(ValueError):
+            @self.register('bundle', daily_bar_format='ayy')
+            def bundle_ingest(*args):
+                pass
+
     def test_ingest_assets_versions(self):
         versions = (1, 2)
 
@@ -330,6 +541,607 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             version_table = metadata.tables['version_info']
             check_version_info(eng, version_table, version)
 
+    def test_ingest_workers(self):
+        received = []
+
+        @self.register('bundle', create_writers=False)
+        def bundle_ingest_with_workers(*args, **kwargs):
+            received.append(kwargs.get('workers'))
+
+        self.ingest('bundle', self.environ, workers=3)
+        assert_equal(received, [3])
+
+        def ingest_with_workers(environ,
+                                asset_db_writer,
+                                minute_bar_writer,
+                                daily_bar_writer,
+                                adjustment_writer,
+                                calendar,
+                                start_session,
+                                end_session,
+                                cache,
+                                show_progress,
+                                output_dir,
+                                source,
+                                workers=1):
+            received.append((source, workers))
+
+        # Ingest functions whose other arguments are bound with partial or
+        # curry are also passed ``workers``.
+        self.register('bundle', create_writers=False)(
+            partial(ingest_with_workers, source='partial'),
+        )
+        self.ingest('bundle', self.environ, workers=2)
+        self.register('bundle', create_writers=False)(
+            curry(ingest_with_workers, source='curry'),
+        )
+        self.ingest('bundle', self.environ, workers=4)
+        assert_equal(received, [3, ('partial', 2), ('curry', 4)])
+
+        @self.register('bundle', create_writers=False)
+        def bundle_ingest_without_workers(environ,
+                                          asset_db_writer,
+                                          minute_bar_writer,
+                                          daily_bar_writer,
+                                          adjustment_writer,
+                                          calendar,
+                                          start_session,
+                                          end_session,
+                                          cache,
+                                          show_progress,
+                                          output_dir):
+            received.append(None)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.ingest('bundle', self.environ, workers=3)
+        assert_equal(received, [3, ('partial', 2), ('curry', 4), None])
+        assert_equal(len(w), 1)
+        assert_in('single process', str(w[0].message))
+
+        with assert_raises(ValueError):
+            self.ingest('bundle', self.environ, workers=0)
+
+    def test_ingest_map(self):
+        for workers in (1, 2):
+            assert_equal(
+                list(ingest_map(abs, range(0, -20, -1), workers)),
+                list(range(20)),
+            )
+
+    def test_ingest_incremental(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+        first_end = sessions[2]
+
+        sids = tuple(range(3))
+        splits = pd.DataFrame.from_records([
+            {
+                'effective_date': str_to_seconds('2014-01-08'),
+                'ratio': 0.5,
+                'sid': 0,
+            },
+            {
+                'effective_date': str_to_seconds('2014-01-09'),
+                'ratio': 0.1,
+                'sid': 1,
+            },
+        ])
+        start_sessions = []
+
+        def register(end_session):
+            equities = make_simple_equity_info(
+                sids,
+                self.START_DATE,
+                end_session,
+            )
+
+            @self.register(
+                'bundle',
+                calendar_name='NYSE',
+                start_session=self.START_DATE,
+                end_session=end_session,
+            )
+            def bundle_ingest(environ,
+                              asset_db_writer,
+                              minute_bar_writer,
+                              daily_bar_writer,
+                              adjustment_writer,
+                              calendar,
+                              start_session,
+                              end_session,
+                              cache,
+                              show_progress,
+                              output_dir):
+                # Write the whole history, as a bundle which does not know
+                # about incremental ingests would.
+                start_sessions.append(start_session)
+                asset_db_writer.write(equities=equities)
+                minute_bar_writer.write(make_bar_data(
+                    equities,
+                    minutes[minutes <= calendar.session_close(end_session)],
+                ))
+                daily_bar_writer.write(make_bar_data(
+                    equities,
+                    sessions[sessions <= end_session],
+                ))
+                adjustment_writer.write(splits=splits[
+                    splits.effective_date <= end_session.value // 10 ** 9
+                ])
+
+            return equities
+
+        register(first_end)
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-08 23:00', tz='utc'),
+        )
+        equities = register(self.END_DATE)
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-10 23:00', tz='utc'),
+            incremental=True,
+        )
+        assert_equal(start_sessions, [self.START_DATE, sessions[3]])
+
+        bundle = self.load('bundle', environ=self.environ)
+        assert_equal(set(bundle.asset_finder.sids), set(sids))
+        assert_equal(
+            bundle.asset_finder.retrieve_asset(0).end_date,
+            self.END_DATE,
+        )
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, equities, colname),
+                msg=colname,
+            )
+
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, equities, colname),
+                msg=colname,
+            )
+
+        # Each split is written once, even though the second ingest wrote
+        # both of them.
+        adjustments = bundle.adjustment_reader.load_adjustments(
+            ['close'],
+            sessions,
+            pd.Index(sids),
+        )[0]
+        assert_equal(
+            adjustments,
+            {
+                2: [Float64Multiply(
+                    first_row=0,
+                    last_row=2,
+                    first_col=0,
+                    last_col=0,
+                    value=0.5,
+                )],
+                3: [Float64Multiply(
+                    first_row=0,
+                    last_row=3,
+                    first_col=1,
+                    last_col=1,
+                    value=0.1,
+                )],
+            },
+        )
+
+        # There are no new sessions to ingest.
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.ingest(
+                'bundle',
+                environ=self.environ,
+                timestamp=pd.Timestamp('2014-01-11 23:00', tz='utc'),
+                incremental=True,
+            )
+        assert_equal(len(start_sessions), 2)
+        assert_in('no new sessions', str(w[-1].message))
+
+    def test_ingest_incremental_asset_db(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        first_end = sessions[2]
+        bars = make_simple_equity_info([0], self.START_DATE, self.END_DATE)
+
+        # The first ingestion knows that sid 0 was renamed from A to B, and
+        # the second one only knows about B.
+        first_equities = pd.DataFrame(
+            {
+                'symbol': ['A', 'B'],
+                'start_date': [self.START_DATE, sessions[1]],
+                'end_date': [sessions[0], first_end],
+                'exchange': 'TEST',
+            },
+            index=[0, 0],
+        )
+        second_equities = pd.DataFrame(
+            {
+                'symbol': ['B'],
+                'start_date': [sessions[3]],
+                'end_date': [self.END_DATE],
+                'exchange': 'TEST',
+            },
+            index=[0],
+        )
+        futures = pd.DataFrame(
+            {
+                'symbol': ['CLF14'],
+                'root_symbol': ['CL'],
+                'start_date': [self.START_DATE],
+                'end_date': [self.END_DATE],
+                'notice_date': [self.END_DATE],
+                'expiration_date': [self.END_DATE],
+                'auto_close_date': [self.END_DATE],
+                'exchange': ['CMES'],
+                'multiplier': [1000.0],
+                'tick_size': [0.01],
+            },
+            index=[1],
+        )
+        exchanges = pd.DataFrame({
+            'exchange': ['CMES'],
+            'timezone': ['US/Central'],
+        })
+        root_symbols = pd.DataFrame({
+            'root_symbol': ['CL'],
+            'root_symbol_id': [1],
+            'exchange': ['CMES'],
+        })
+
+        def register(end_session, asset_kwargs):
+            @self.register(
+                'bundle',
+                calendar_name='NYSE',
+                start_session=self.START_DATE,
+                end_session=end_session,
+            )
+            def bundle_ingest(environ,
+                              asset_db_writer,
+                              minute_bar_writer,
+                              daily_bar_writer,
+                              adjustment_writer,
+                              calendar,
+                              start_session,
+                              end_session,
+                              cache,
+                              show_progress,
+                              output_dir):
+                asset_db_writer.write(**asset_kwargs)
+                daily_bar_writer.write(make_bar_data(
+                    bars,
+                    sessions[sessions <= end_session],
+                ))
+                adjustment_writer.write()
+
+        register(first_end, {
+            'equities': first_equities,
+            'futures': futures,
+            'exchanges': exchanges,
+            'root_symbols': root_symbols,
+        })
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-08 23:00', tz='utc'),
+        )
+        register(self.END_DATE, {'equities': second_equities})
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-10 23:00', tz='utc'),
+            incremental=True,
+        )
+
+        finder = self.load('bundle', environ=self.environ).asset_finder
+        equity = finder.retrieve_asset(0)
+        assert_equal(equity.symbol, 'B')
+        assert_equal(equity.start_date, self.START_DATE)
+        assert_equal(equity.end_date, self.END_DATE)
+
+        # The symbol history of the first ingestion is kept.
+        assert_equal(finder.lookup_symbol('A', sessions[0]), equity)
+        for session in sessions[1:]:
+            assert_equal(finder.lookup_symbol('B', session), equity)
+        with assert_raises(SymbolNotFound):
+            finder.lookup_symbol('B', sessions[0])
+
+        # So are its futures, root symbols and exchanges.
+        assert_equal(finder.retrieve_asset(1).root_symbol, 'CL')
+        assert_equal(
+            finder.engine.execute(
+                'SELECT root_symbol, exchange FROM futures_root_symbols',
+            ).fetchall(),
+            [('CL', 'CMES')],
+        )
+        assert_equal(
+            finder.engine.execute(
+                'SELECT exchange, timezone FROM futures_exchanges',
+            ).fetchall(),
+            [('CMES', 'US/Central')],
+        )
+
+    def test_ingest_share_files(self):
+        calendar = get_calendar('NYSE')
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+            adjustment_writer.write()
+
+        timestamps = [
+            pd.Timestamp('2014-01-10 23:00', tz='utc'),
+            pd.Timestamp('2014-01-11 23:00', tz='utc'),
+        ]
+        for timestamp in timestamps:
+            self.ingest(
+                'bundle',
+                environ=self.environ,
+                timestamp=timestamp,
+                share_files=True,
+            )
+
+        def minute_bars_path(timestamp):
+            return minute_equity_path(
+                'bundle',
+                to_bundle_ingest_dirname(timestamp.tz_localize(None)),
+                environ=self.environ,
+            )
+
+        def close_sizes_path(timestamp):
+            return os.path.join(
+                minute_bars_path(timestamp),
+                '00',
+                '00',
+                '000000.bcolz',
+                'close',
+                'meta',
+                'sizes',
+            )
+
+        first, second = map(close_sizes_path, timestamps)
+        assert_true(os.path.samefile(first, second))
+
+        bundle = self.load('bundle', environ=self.environ)
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            ['close'],
+            minutes[0],
+            minutes[-1],
+            sids,
+        )[0]
+        assert_equal(
+            actual,
+            expected_bar_values_2d(minutes, equities, 'close'),
+        )
+
+        # The shared files are read-only.
+        assert_false(os.stat(second).st_mode & stat.S_IWUSR)
+
+        # Appending to the minute bars of the first ingestion copies its
+        # shared files instead of changing the second ingestion.
+        new_session = calendar.next_session_label(self.END_DATE)
+        new_minutes = calendar.minutes_for_session(new_session)
+        writer = BcolzMinuteBarWriter.open(
+            minute_bars_path(timestamps[0]),
+            new_session,
+        )
+        writer.write_sid(0, pd.DataFrame(
+            {
+                'open': 1.0,
+                'high': 1.0,
+                'low': 1.0,
+                'close': 1.0,
+                'volume': 100,
+            },
+            index=new_minutes,
+        ))
+        assert_false(os.path.samefile(first, second))
+        assert_equal(os.stat(second).st_nlink, 2)
+
+        appended = BcolzMinuteBarReader(minute_bars_path(timestamps[0]))
+        assert_equal(
+            appended.load_raw_arrays(
+                ['close'],
+                new_minutes[0],
+                new_minutes[-1],
+                [0],
+            )[0],
+            np.full((len(new_minutes), 1), 1.0),
+        )
+
+        bundle = self.load('bundle', environ=self.environ)
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            ['close'],
+            minutes[0],
+            minutes[-1],
+            sids,
+        )[0]
+        assert_equal(
+            actual,
+            expected_bar_values_2d(minutes, equities, 'close'),
+        )
+
+        store = pth.data_path(['bundle', '.shared'], environ=self.environ)
+
+        def stored_files():
+            return [
+                os.path.join(dirpath, filename)
+                for dirpath, _, filenames in os.walk(store)
+                for filename in filenames
+            ]
+
+        files = stored_files()
+        assert_true(files)
+
+        # The second ingestion still uses the shared files.
+        self.clean('bundle', keep_last=1, environ=self.environ)
+        assert_equal(stored_files(), files)
+        assert_equal(os.stat(second).st_nlink, 2)
+
+        self.clean('bundle', keep_last=0, environ=self.environ)
+        assert_equal(stored_files(), [])
+
+    def test_load_in_memory(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        splits = pd.DataFrame.from_records([
+            {
+                'effective_date': str_to_seconds('2014-01-08'),
+                'ratio': 0.5,
+                'sid': 0,
+            },
+        ])
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+            daily_bar_writer.write(make_bar_data(equities, sessions))
+            adjustment_writer.write(splits=splits)
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+        in_memory = InMemoryBundle.from_bundle_data(
+            bundle,
+            sids=[0, 2],
+            start_session=sessions[1],
+            chunksize=1,
+        )
+        assert_is_instance(in_memory, BundleData)
+        assert_equal(set(in_memory.asset_finder.sids), set(sids))
+        assert_equal(
+            in_memory.asset_finder.retrieve_asset(2),
+            bundle.asset_finder.retrieve_asset(2),
+        )
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        for reader_name, dts, earlier in (
+                ('equity_daily_bar_reader', sessions[1:], sessions[0]),
+                ('equity_minute_bar_reader',
+                 minutes[minutes >= minutes[390]],
+                 minutes[389])):
+            reader = getattr(bundle, reader_name)
+            in_memory_reader = getattr(in_memory, reader_name)
+            assert_equal(in_memory_reader.last_available_dt, dts[-1])
+
+            assert_equal(
+                in_memory_reader.load_raw_arrays(
+                    columns, dts[1], dts[-2], [2, 0],
+                ),
+                reader.load_raw_arrays(columns, dts[1], dts[-2], [2, 0]),
+                msg=reader_name,
+            )
+            for column in columns:
+                assert_equal(
+                    in_memory_reader.get_value(2, dts[3], column),
+                    reader.get_value(2, dts[3], column),
+                    msg=column,
+                )
+                assert_equal(
+                    in_memory_reader.get_values([0, 2], dts[3], column),
+                    reader.get_values([0, 2], dts[3], column),
+                    msg=column,
+                )
+                # The bars before ``start_session`` were not loaded.
+                with assert_raises(NoDataOnDate):
+                    in_memory_reader.get_value(2, earlier, column)
+                with assert_raises(NoDataOnDate):
+                    in_memory_reader.get_values([0, 2], earlier, column)
+            asset = bundle.asset_finder.retrieve_asset(0)
+            assert_equal(
+                in_memory_reader.get_last_traded_dt(asset, dts[-1]),
+                reader.get_last_traded_dt(asset, dts[-1]),
+            )
+            assets = bundle.asset_finder.retrieve_all([2, 0])
+            assert_equal(
+                in_memory_reader.get_last_traded_dts(assets, dts[-1]),
+                [reader.get_last_traded_dt(a, dts[-1]) for a in assets],
+            )
+
+        assert_equal(
+            in_memory.adjustment_reader.load_adjustments(
+                columns, sessions, pd.Index(sids),
+            ),
+            bundle.adjustment_reader.load_adjustments(
+                columns, sessions, pd.Index(sids),
+            ),
+        )
+
     @parameterized.expand([('clean',), ('load',)])
     def test_bundle_doesnt_exist(self, fnname):
         with assert_raises(UnknownBundle) as e:
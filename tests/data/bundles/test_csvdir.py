@@ -1,5 +1,6 @@
 from __future__ import division
 
+from nose_parameterized import parameterized
 import numpy as np
 import pandas as pd
 
@@ -95,12 +96,13 @@ class CSVDIRBundleTestCase(ZiplineTestCase):
 
         return pricing, adjustments
 
-    def test_bundle(self):
+    @parameterized.expand([(1,), (2,)])
+    def test_bundle(self, workers):
         environ = {
             'CSVDIR': test_resource_path('csvdir_samples', 'csvdir')
         }
 
-        ingest('csvdir', environ=environ)
+        ingest('csvdir', environ=environ, workers=workers)
         bundle = load('csvdir', environ=environ)
         sids = 0, 1, 2, 3
         assert_equal(set(bundle.asset_finder.sids), set(sids))
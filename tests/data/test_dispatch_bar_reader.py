@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from mock import patch
 from numpy import array, nan
 from numpy.testing import assert_almost_equal
 from pandas import DataFrame, Timestamp
@@ -166,6 +167,29 @@ class AssetDispatchSessionBarTestCase(WithBcolzEquityDailyBarReader,
             for j, result in enumerate(results):
                 assert_almost_equal(result[:, i], expected[j], err_msg=msg)
 
+    def test_get_values(self):
+        sessions = self.trading_calendar.sessions_in_range(
+            self.START_DATE, self.END_DATE)
+        sids = [2, 10003, 1, 10001]
+
+        assert_almost_equal(
+            self.dispatch_reader.get_values(sids, sessions[1], 'high'),
+            array([nan, 30001.9, 101.9, 10001.9]),
+        )
+        assert_almost_equal(
+            self.dispatch_reader.get_values(sids, sessions[1], 'volume'),
+            array([0, 3001, 1001, 1001]),
+        )
+
+        # Assets are dispatched without being looked up again.
+        assets = self.asset_finder.retrieve_all(sids)
+        with patch.object(self.asset_finder, 'retrieve_all') as retrieve_all:
+            assert_almost_equal(
+                self.dispatch_reader.get_values(assets, sessions[1], 'high'),
+                array([nan, 30001.9, 101.9, 10001.9]),
+            )
+        self.assertFalse(retrieve_all.called)
+
 
 class AssetDispatchMinuteBarTestCase(WithBcolzEquityMinuteBarReader,
                                      WithBcolzFutureMinuteBarReader,
@@ -330,3 +354,30 @@ class AssetDispatchMinuteBarTestCase(WithBcolzEquityMinuteBarReader,
         for i, (sid, expected, msg) in enumerate(expected_per_sid):
             for j, result in enumerate(results):
                 assert_almost_equal(result[:, i], expected[j], err_msg=msg)
+
+    def test_get_values(self):
+        f_minutes = self.trading_calendar.minutes_for_session(self.START_DATE)
+        e_minutes = self.trading_calendars[Equity].minutes_for_session(
+            self.START_DATE)
+        sids = [10002, 1, 3, 10001]
+
+        assert_almost_equal(
+            self.dispatch_reader.get_values(sids, e_minutes[1], 'open'),
+            array([20931.5, 101.5, 301.5, 10930.5]),
+        )
+        assert_almost_equal(
+            self.dispatch_reader.get_values(sids, e_minutes[1], 'volume'),
+            array([2931, 1001, 3001, 1930]),
+        )
+
+        # Before the Equity market open, only the futures have values.
+        assert_almost_equal(
+            self.dispatch_reader.get_values([10003, 2], f_minutes[2], 'open'),
+            array([30002.5, nan]),
+        )
+        assert_almost_equal(
+            self.dispatch_reader.get_values(
+                [10003, 2], f_minutes[2], 'volume',
+            ),
+            array([3002, 0]),
+        )
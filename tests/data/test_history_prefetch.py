@@ -0,0 +1,97 @@
+"""
+Tests for the prefetch policies of the history loaders.
+"""
+import pandas as pd
+
+from zipline.data.history_prefetch import (
+    AdaptivePrefetchLength,
+    FixedPrefetchLength,
+    PrefetchDecision,
+)
+from zipline.testing.fixtures import ZiplineTestCase
+from zipline.testing.predicates import assert_equal
+
+
+class PrefetchPolicyTestCase(ZiplineTestCase):
+
+    def test_fixed(self):
+        policy = FixedPrefetchLength(5)
+        policy.record('close', 0, [], [1, 2])
+        policy.record('close', 1, [1, 2], [])
+        policy.record('close', 2, [1], [2])
+
+        assert_equal(policy.length('close'), 5)
+        assert_equal(policy.length('open'), 5)
+        assert_equal(
+            policy.stats(),
+            pd.DataFrame(
+                {
+                    'prefetch_length': [5],
+                    'requests': [3],
+                    'hits': [3],
+                    'misses': [3],
+                    'refetches': [1],
+                },
+                index=pd.Index(['close'], name='field'),
+                columns=[
+                    'prefetch_length',
+                    'requests',
+                    'hits',
+                    'misses',
+                    'refetches',
+                ],
+            ),
+        )
+
+    def test_seen_assets_are_bounded(self):
+        policy = FixedPrefetchLength(5)
+        policy._seen_interval = 2
+        # Each asset is only requested once, so none of them are refetched,
+        # and only the assets of the last two intervals are remembered.
+        for dt in range(10):
+            policy.record('close', dt, [], [dt])
+
+        assert_equal(policy.stats().loc['close', 'refetches'], 0)
+        assert_equal(policy._seen['close'], (set(), {8, 9}))
+
+        # An asset of the previous interval is still counted as a refetch.
+        policy.record('close', 10, [], [8])
+        assert_equal(policy.stats().loc['close', 'refetches'], 1)
+
+    def test_adaptive_grows_on_refetches(self):
+        policy = AdaptivePrefetchLength(10, max_length=30, interval=2)
+        for dt in range(6):
+            policy.record('close', dt, [], [1])
+
+        assert_equal(policy.length('close'), 30)
+        assert_equal(policy.length('open'), 10)
+        assert_equal(
+            policy.decisions,
+            [
+                PrefetchDecision(1, 'close', 10, 20, 'refetch'),
+                PrefetchDecision(3, 'close', 20, 30, 'refetch'),
+            ],
+        )
+
+    def test_adaptive_shrinks_on_churn(self):
+        policy = AdaptivePrefetchLength(10, min_length=4, interval=2)
+        for dt, assets in enumerate([[1, 2], [1, 2], [1, 3], [3], [4], [4]]):
+            policy.record('close', dt, assets, [])
+
+        assert_equal(policy.length('close'), 4)
+        assert_equal(
+            policy.decisions,
+            [
+                PrefetchDecision(3, 'close', 10, 5, 'churn'),
+                PrefetchDecision(5, 'close', 5, 4, 'churn'),
+            ],
+        )
+        assert_equal(policy.stats().loc['close', 'churned'], 3)
+
+    def test_adaptive_invalid_lengths(self):
+        with self.assertRaises(ValueError):
+            AdaptivePrefetchLength(10, min_length=20)
+        with self.assertRaises(ValueError):
+            AdaptivePrefetchLength(10, max_length=5)
+        with self.assertRaises(ValueError):
+            AdaptivePrefetchLength(10, interval=0)
@@ -14,6 +14,7 @@
 # limitations under the License.
 from datetime import timedelta
 import os
+from threading import active_count
 
 from numpy import (
     arange,
@@ -882,6 +883,207 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                 assert_almost_equal(data[sid].loc[minutes, col],
                                     arrays[i][j][minute_locs])
 
+    def test_unadjusted_minutes_mixed_ratios_and_lengths(self):
+        """
+        Test a multi-sid window over an early close where the sids have
+        different ohlc ratios and one sid's data ends before the window does.
+        """
+        xmas_eve = Timestamp('2015-12-24', tz='UTC')
+        market_day_after_xmas = Timestamp('2015-12-28', tz='UTC')
+
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 10},
+        )
+
+        minutes_1 = self.trading_calendar.minutes_for_sessions_in_range(
+            xmas_eve,
+            market_day_after_xmas,
+        )
+        minutes_2 = minutes_1[:10]
+        data_1 = DataFrame(
+            data={
+                'open': arange(len(minutes_1)) + 1.0,
+                'high': arange(len(minutes_1)) + 2.0,
+                'low': arange(len(minutes_1)) + 0.5,
+                'close': arange(len(minutes_1)) + 1.5,
+                'volume': arange(len(minutes_1)) + 100,
+            },
+            index=minutes_1,
+        )
+        data_2 = DataFrame(
+            data={
+                'open': arange(len(minutes_2)) + 10.0,
+                'high': arange(len(minutes_2)) + 20.0,
+                'low': arange(len(minutes_2)) + 5.0,
+                'close': arange(len(minutes_2)) + 15.0,
+                'volume': arange(len(minutes_2)) + 1000,
+            },
+            index=minutes_2,
+        )
+        writer.write_sid(1, data_1)
+        writer.write_sid(2, data_2)
+
+        reader = BcolzMinuteBarReader(self.dest)
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        arrays = reader.load_raw_arrays(
+            columns, minutes_1[0], minutes_1[-1], [1, 2],
+        )
+
+        for i, col in enumerate(columns):
+            self.assertEqual(arrays[i].shape, (len(minutes_1), 2))
+            assert_almost_equal(arrays[i][:, 0], data_1[col].values)
+            assert_almost_equal(
+                arrays[i][:len(minutes_2), 1],
+                data_2[col].values,
+            )
+            if col == 'volume':
+                assert_array_equal(arrays[i][len(minutes_2):, 1], 0)
+            else:
+                assert_array_equal(arrays[i][len(minutes_2):, 1], nan)
+
+    def test_get_values(self):
+        """
+        get_values should match get_value for each sid, including sids with
+        different ohlc ratios and sids whose data ends before the minute.
+        """
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 10},
+        )
+        minutes = self.trading_calendar.minutes_for_session(
+            Timestamp('2015-12-24', tz='UTC'),
+        )
+        for sid, length in ((1, len(minutes)), (2, 10)):
+            values = arange(length) + 10.0 * sid
+            data = DataFrame(
+                data={
+                    'open': values + 1,
+                    'high': values + 2,
+                    'low': values,
+                    'close': values + 1.5,
+                    'volume': values + 100,
+                },
+                index=minutes[:length],
+            )
+            writer.write_sid(sid, data)
+
+        reader = BcolzMinuteBarReader(self.dest)
+        sids = [2, 1, 2]
+        for minute in minutes[[0, 9, 10, -1]]:
+            for col in BcolzMinuteBarReader.FIELDS:
+                expected = [reader.get_value(sid, minute, col) for sid in sids]
+                assert_array_equal(
+                    reader.get_values(sids, minute, col),
+                    expected,
+                    err_msg='minute={0} col={1}'.format(minute, col),
+                )
+
+        # A dt outside of market hours is an error, as it is for get_value.
+        minute = Timestamp('2015-12-24 20:01', tz='UTC')
+        for col in ('close', 'volume'):
+            with self.assertRaises(NoDataOnDate):
+                reader.get_value(sids[0], minute, col)
+            with self.assertRaises(NoDataOnDate):
+                reader.get_values(sids, minute, col)
+
+    def test_threaded_load_raw_arrays(self):
+        """
+        Reading on a thread pool should produce the same arrays as reading on
+        the calling thread.
+        """
+        start_day = Timestamp('2015-11-25', tz='UTC')
+        end_day = Timestamp('2015-11-30', tz='UTC')
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            start_day,
+            end_day,
+        )
+        sids = [1, 2, 3, 4, 5]
+        for sid in sids:
+            # Give each sid a different length of data.
+            sid_minutes = minutes[:len(minutes) // sid]
+            values = arange(len(sid_minutes)) + 100.0 * sid
+            data = DataFrame(
+                data={
+                    'open': values + 1,
+                    'high': values + 2,
+                    'low': values,
+                    'close': values + 1.5,
+                    'volume': values,
+                },
+                index=sid_minutes,
+            )
+            self.writer.write_sid(sid, data)
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        expected = BcolzMinuteBarReader(self.dest).load_raw_arrays(
+            columns, minutes[0], minutes[-1], sids,
+        )
+        threads = active_count()
+        for read_workers in (2, 3, 8):
+            with BcolzMinuteBarReader(self.dest,
+                                      read_workers=read_workers) as reader:
+                actual = reader.load_raw_arrays(
+                    columns, minutes[0], minutes[-1], sids,
+                )
+                self.assertGreater(active_count(), threads)
+            for col, e, a in zip(columns, expected, actual):
+                assert_array_equal(e, a, err_msg=col)
+
+            # Leaving the context stops the pool's threads.
+            self.assertEqual(active_count(), threads)
+
+    def test_carray_cache_bytes(self):
+        minute = self.market_opens[self.test_calendar_start]
+        data = DataFrame(
+            data={
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50.0],
+            },
+            index=[minute],
+        )
+        sids = [1, 2, 3]
+        for sid in sids:
+            self.writer.write_sid(sid, data)
+
+        probe = BcolzMinuteBarReader(self.dest)
+        carray_nbytes = probe._carray_nbytes(
+            probe._open_minute_file('close', sids[0]),
+        )
+
+        # Leave room for two carrays per field.
+        fields = BcolzMinuteBarReader.FIELDS
+        reader = BcolzMinuteBarReader(
+            self.dest,
+            carray_cache_bytes=2 * carray_nbytes * len(fields),
+        )
+
+        for sid in sids:
+            self.assertEqual(reader.get_value(sid, minute, 'close'), 40.0)
+        self.assertEqual(reader.get_value(sids[-1], minute, 'close'), 40.0)
+
+        stats = reader.carray_cache_stats
+        self.assertEqual(list(stats.index), list(fields))
+        close = stats.loc['close']
+        self.assertEqual(close['size'], 2)
+        self.assertEqual(close['nbytes'], 2 * carray_nbytes)
+        self.assertEqual(close['misses'], 3)
+        self.assertEqual(close['hits'], 1)
+        self.assertEqual(close['evictions'], 1)
+        self.assertEqual(stats.loc['open', 'misses'], 0)
+
     def test_adjust_non_trading_minutes(self):
         start_day = Timestamp('2015-06-01', tz='UTC')
         end_day = Timestamp('2015-06-02', tz='UTC')
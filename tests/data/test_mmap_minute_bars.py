@@ -0,0 +1,224 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from datetime import timedelta
+import os
+
+from numpy import arange
+from numpy.testing import assert_array_equal
+from pandas import (
+    DataFrame,
+    DatetimeIndex,
+    NaT,
+    Timestamp,
+)
+
+from zipline.data.bar_reader import NoDataForSid
+from zipline.data.minute_bars import (
+    BcolzMinuteBarMetadata,
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.data.mmap_minute_bars import (
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
+)
+from zipline.testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithTradingCalendars,
+    ZiplineTestCase,
+)
+
+TEST_CALENDAR_START = Timestamp('2015-11-02', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-12-31', tz='UTC')
+
+
+class MmapMinuteBarTestCase(WithTradingCalendars,
+                            WithAssetFinder,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MmapMinuteBarTestCase, cls).init_class_fixtures()
+
+        cal = cls.trading_calendar.schedule.loc[
+            TEST_CALENDAR_START:TEST_CALENDAR_STOP
+        ]
+
+        cls.market_opens = cal.market_open
+        cls.test_calendar_start = cls.market_opens.index[0]
+
+    def init_instance_fixtures(self):
+        super(MmapMinuteBarTestCase, self).init_instance_fixtures()
+
+        self.dest = self.instance_tmpdir.getpath('minute_bars')
+        os.makedirs(self.dest)
+        self.writer = MmapMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+        )
+        self.reader = MmapMinuteBarReader(self.dest)
+
+    def test_metadata(self):
+        metadata = BcolzMinuteBarMetadata.read(self.dest)
+        self.assertEqual(
+            metadata.version,
+            BcolzMinuteBarMetadata.FORMAT_VERSION,
+        )
+        self.assertEqual(metadata.start_session, TEST_CALENDAR_START)
+        self.assertEqual(metadata.end_session, TEST_CALENDAR_STOP)
+
+    def test_no_minute_bars_for_sid(self):
+        minute = self.market_opens[self.test_calendar_start]
+        with self.assertRaises(NoDataForSid):
+            self.reader.get_value(1337, minute, 'close')
+
+    def test_write_one_ohlcv(self):
+        minute = self.market_opens[self.test_calendar_start]
+        sid = 1
+        data = DataFrame(
+            data={
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50.0]
+            },
+            index=[minute])
+        self.writer.write_sid(sid, data)
+
+        for field, expected in zip(BcolzMinuteBarReader.FIELDS,
+                                   (10.0, 20.0, 30.0, 40.0, 50.0)):
+            self.assertEqual(
+                expected,
+                self.reader.get_value(sid, minute, field),
+            )
+
+        self.assertEqual(
+            self.reader.get_last_traded_dt(
+                self.asset_finder.retrieve_asset(sid),
+                minute + timedelta(minutes=5),
+            ),
+            minute,
+        )
+
+    def test_pad_data(self):
+        sid = 1
+        last_date = self.writer.last_date_in_output_for_sid(sid)
+        self.assertIs(last_date, NaT)
+
+        self.writer.pad(sid, TEST_CALENDAR_START)
+
+        last_date = self.writer.last_date_in_output_for_sid(sid)
+        self.assertEqual(last_date, TEST_CALENDAR_START)
+        self.assertEqual(
+            len(self.writer._ensure_ctable(sid)),
+            self.writer._minutes_per_day,
+        )
+
+    def test_set_sid_attrs(self):
+        sid = 1
+        attrs = {'start_day': 1, 'end_day': 2}
+        self.writer.set_sid_attrs(sid, **attrs)
+        for k, v in attrs.items():
+            self.assertEqual(self.reader.get_sid_attr(sid, k), v)
+        self.assertIsNone(self.reader.get_sid_attr(sid, 'not_an_attr'))
+
+    def test_matches_bcolz(self):
+        """
+        The same writes should read back identically from both formats,
+        including windows which span an early close.
+        """
+        bcolz_dest = self.instance_tmpdir.getpath('bcolz_minute_bars')
+        os.makedirs(bcolz_dest)
+        bcolz_writer = BcolzMinuteBarWriter(
+            bcolz_dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+        )
+
+        # 2015-11-27 is an early close.
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            Timestamp('2015-11-25', tz='UTC'),
+            Timestamp('2015-11-30', tz='UTC'),
+        )
+        for sid in self.ASSET_FINDER_EQUITY_SIDS:
+            values = arange(len(minutes), dtype=float) + 100 * sid
+            data = DataFrame(
+                data={
+                    'open': values + 1,
+                    'high': values + 2,
+                    'low': values,
+                    'close': values + 1.5,
+                    'volume': values * 10,
+                },
+                index=minutes,
+            )
+            self.writer.write_sid(sid, data)
+            bcolz_writer.write_sid(sid, data)
+
+        bcolz_reader = BcolzMinuteBarReader(bcolz_dest)
+        fields = list(BcolzMinuteBarReader.FIELDS)
+        sids = list(self.ASSET_FINDER_EQUITY_SIDS)
+
+        expected = bcolz_reader.load_raw_arrays(
+            fields, minutes[0], minutes[-1], sids,
+        )
+        actual = self.reader.load_raw_arrays(
+            fields, minutes[0], minutes[-1], sids,
+        )
+        for field, e, a in zip(fields, expected, actual):
+            assert_array_equal(e, a, err_msg=field)
+
+    def test_truncate(self):
+        tds = self.market_opens.index
+        days = tds[1:3]
+        minutes = DatetimeIndex([
+            self.market_opens[days[0]] + timedelta(minutes=60),
+            self.market_opens[days[1]] + timedelta(minutes=120),
+        ])
+        sid = 1
+        data = DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0]
+            },
+            index=minutes)
+        self.writer.write_sid(sid, data)
+
+        writer = MmapMinuteBarWriter.open(self.dest)
+        writer.truncate(days[0])
+
+        reader = MmapMinuteBarReader(self.dest)
+
+        self.assertEqual(self.writer.last_date_in_output_for_sid(sid), days[0])
+
+        _, last_close = self.trading_calendar.open_and_close_for_session(
+            days[0],
+        )
+        self.assertEqual(reader.last_available_dt, last_close)
+        self.assertEqual(reader.get_value(sid, minutes[0], 'close'), 40.0)
@@ -0,0 +1,235 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+from nose_parameterized import parameterized
+from numpy import arange, datetime64, nan
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, Timestamp
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+)
+from zipline.data.parquet_daily_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+    is_parquet_daily_bar_dir,
+)
+from zipline.pipeline.loaders.synthetic import (
+    expected_bar_values_2d,
+    make_bar_data,
+)
+from zipline.testing.fixtures import (
+    WithBcolzEquityDailyBarReader,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+TEST_CALENDAR_START = Timestamp('2014-12-01', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-01-30', tz='UTC')
+
+# Assets which start and end on either side of the year boundary.
+EQUITY_INFO = DataFrame(
+    [
+        {'start_date': '2014-12-01', 'end_date': '2014-12-19'},
+        {'start_date': '2015-01-12', 'end_date': '2015-01-30'},
+        {'start_date': '2014-12-02', 'end_date': '2015-01-30'},
+        {'start_date': '2014-12-15', 'end_date': '2015-01-09'},
+        {'start_date': '2014-12-29', 'end_date': '2015-01-06'},
+    ],
+    index=arange(1, 6),
+    columns=['start_date', 'end_date'],
+).astype(datetime64)
+EQUITY_INFO['symbol'] = [chr(ord('A') + n) for n in range(len(EQUITY_INFO))]
+
+
+class ParquetDailyBarTestCase(WithBcolzEquityDailyBarReader,
+                              ZiplineTestCase):
+    EQUITY_DAILY_BAR_START_DATE = TEST_CALENDAR_START
+    EQUITY_DAILY_BAR_END_DATE = TEST_CALENDAR_STOP
+
+    # Use tiny row groups so that reads have to select among them.
+    ROW_GROUP_SIZE = 7
+
+    @classmethod
+    def make_equity_info(cls):
+        return EQUITY_INFO
+
+    @classmethod
+    def make_equity_daily_bar_data(cls):
+        return make_bar_data(
+            EQUITY_INFO,
+            cls.equity_daily_bar_days,
+        )
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(ParquetDailyBarTestCase, cls).init_class_fixtures()
+
+        cls.sessions = cls.bcolz_equity_daily_bar_reader.sessions
+        cls.parquet_path = cls.tmpdir.getpath('daily_equity_pricing.parquet')
+        ParquetDailyBarWriter(
+            cls.parquet_path,
+            cls.trading_calendar,
+            cls.sessions[0],
+            cls.sessions[-1],
+            row_group_size=cls.ROW_GROUP_SIZE,
+        ).write(cls.make_equity_daily_bar_data())
+        cls.reader = ParquetDailyBarReader(cls.parquet_path)
+
+    def test_layout(self):
+        self.assertTrue(is_parquet_daily_bar_dir(self.parquet_path))
+        self.assertFalse(is_parquet_daily_bar_dir(self.bcolz_daily_bar_path))
+        self.assertEqual(
+            sorted(p for p in os.listdir(self.parquet_path)
+                   if p.startswith('year=')),
+            ['year=2014', 'year=2015'],
+        )
+
+    def test_metadata(self):
+        bcolz_reader = self.bcolz_equity_daily_bar_reader
+        assert_array_equal(self.reader.sessions, bcolz_reader.sessions)
+        self.assertEqual(
+            self.reader.first_trading_day,
+            bcolz_reader.first_trading_day,
+        )
+        self.assertEqual(
+            self.reader.last_available_dt,
+            bcolz_reader.last_available_dt,
+        )
+        self.assertEqual(
+            self.reader.trading_calendar.name,
+            self.trading_calendar.name,
+        )
+
+    @parameterized.expand([
+        ('2014-12-01', '2015-01-30'),
+        ('2014-12-10', '2014-12-24'),
+        ('2014-12-24', '2015-01-13'),
+        ('2015-01-07', '2015-01-30'),
+        ('2015-01-09', '2015-01-09'),
+    ])
+    def test_load_raw_arrays(self, start, end):
+        start = Timestamp(start, tz='UTC')
+        end = Timestamp(end, tz='UTC')
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        sessions = self.sessions[self.sessions.slice_indexer(start, end)]
+
+        for assets in ([1, 2, 3, 4, 5], [5, 3], [2], [4, 1, 4]):
+            results = self.reader.load_raw_arrays(
+                columns,
+                start,
+                end,
+                assets,
+            )
+            expected = self.bcolz_equity_daily_bar_reader.load_raw_arrays(
+                columns,
+                start,
+                end,
+                assets,
+            )
+            cols = [EQUITY_INFO.index.get_loc(a) for a in assets]
+            for column, result, e in zip(columns, results, expected):
+                self.assertEqual(result.dtype, e.dtype)
+                assert_array_equal(result, e, err_msg=column)
+                assert_array_equal(
+                    result,
+                    expected_bar_values_2d(
+                        sessions,
+                        EQUITY_INFO,
+                        column,
+                    )[:, cols],
+                    err_msg=column,
+                )
+
+    def test_load_raw_arrays_unknown_sid(self):
+        close, volume = self.reader.load_raw_arrays(
+            ['close', 'volume'],
+            self.sessions[0],
+            self.sessions[-1],
+            [3, 9999],
+        )
+        assert_array_equal(close[:, 1], nan)
+        assert_array_equal(volume[:, 1], 0)
+
+    def test_get_value(self):
+        bcolz_reader = self.bcolz_equity_daily_bar_reader
+        for sid in EQUITY_INFO.index:
+            start = Timestamp(EQUITY_INFO.start_date[sid], tz='UTC')
+            end = Timestamp(EQUITY_INFO.end_date[sid], tz='UTC')
+            for day in self.sessions[self.sessions.slice_indexer(start, end)]:
+                for field in 'open', 'close', 'volume':
+                    self.assertEqual(
+                        self.reader.get_value(sid, day, field),
+                        bcolz_reader.get_value(sid, day, field),
+                    )
+
+        with self.assertRaises(NoDataBeforeDate):
+            self.reader.get_value(2, self.sessions[0], 'close')
+
+        with self.assertRaises(NoDataAfterDate):
+            self.reader.get_value(1, self.sessions[-1], 'close')
+
+        with self.assertRaises(NoDataForSid):
+            self.reader.get_value(9999, self.sessions[0], 'close')
+
+    def test_get_last_traded_dt(self):
+        bcolz_reader = self.bcolz_equity_daily_bar_reader
+        for sid in EQUITY_INFO.index:
+            asset = self.asset_finder.retrieve_asset(sid)
+            for day in self.sessions:
+                assert_equal(
+                    self.reader.get_last_traded_dt(asset, day),
+                    bcolz_reader.get_last_traded_dt(asset, day),
+                )
+
+    def test_zero_volume(self):
+        sid = 3
+        sessions = self.sessions[self.sessions.slice_indexer(
+            EQUITY_INFO.start_date[sid],
+            EQUITY_INFO.end_date[sid],
+        )]
+        data = DataFrame(
+            {
+                'open': 10.0,
+                'high': 11.0,
+                'low': 9.0,
+                'close': 10.5,
+                'volume': 100.0,
+            },
+            index=sessions,
+        )
+        # No trades over the year boundary.
+        zero_days = sessions[(sessions > '2014-12-22') &
+                             (sessions < '2015-01-06')]
+        data.loc[zero_days, ['open', 'high', 'low', 'close', 'volume']] = 0
+
+        path = self.tmpdir.getpath('zero_volume.parquet')
+        ParquetDailyBarWriter(
+            path,
+            self.trading_calendar,
+            self.sessions[0],
+            self.sessions[-1],
+        ).write([(sid, data)])
+        reader = ParquetDailyBarReader(path)
+
+        self.assertEqual(
+            reader.get_last_traded_dt(sid, zero_days[-1]),
+            sessions[sessions.get_loc(zero_days[0]) - 1],
+        )
+        assert_array_equal(reader.get_value(sid, zero_days[0], 'close'), nan)
+        self.assertEqual(reader.get_value(sid, zero_days[0], 'volume'), 0)
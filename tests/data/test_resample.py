@@ -13,7 +13,9 @@
 # limitations under the License.
 from collections import OrderedDict
 from numbers import Real
+import os
 
+from mock import patch
 from nose_parameterized import parameterized
 from numpy.testing import assert_almost_equal
 from numpy import nan, array, full, isnan
@@ -21,6 +23,7 @@ import pandas as pd
 from pandas import DataFrame
 from six import iteritems
 
+from zipline.data import resample
 from zipline.data.resample import (
     minute_frame_to_session_frame,
     minute_panel_to_session_panel,
@@ -36,6 +39,7 @@ from zipline.testing.fixtures import (
     WithBcolzEquityMinuteBarReader,
     WithBcolzEquityDailyBarReader,
     WithBcolzFutureMinuteBarReader,
+    WithInstanceTmpDir,
     ZiplineTestCase,
 )
 
@@ -524,6 +528,29 @@ class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                     err_msg='sid={0} field={1} dt={2}'.format(
                         asset, field, minute))
 
+    @parameterized.expand(OHLCV)
+    def test_staggered_minutes_multiple(self, field):
+        # Visit each asset up to a different minute, so that a single call
+        # has to backfill a different number of minutes for each asset.
+        method_name = field + 's'
+        aggregate = getattr(self.equity_daily_aggregator, method_name)
+        assets = self.asset_finder.retrieve_all([1, 2])
+        minutes = EQUITY_CASES[1].index
+        for asset, i in zip(assets, [0, 2]):
+            aggregate([asset], minutes[i])
+
+        for i in [4, 5, 1]:
+            minute = minutes[i]
+            values = aggregate(assets, minute)
+            for j, asset in enumerate(assets):
+                value = values[j]
+                self.assertIsInstance(value, Real)
+                assert_almost_equal(
+                    value,
+                    EXPECTED_AGGREGATION[asset][field][i],
+                    err_msg='sid={0} field={1} dt={2}'.format(
+                        asset, field, minute))
+
 
 class TestMinuteToSession(WithEquityMinuteBarData,
                           ZiplineTestCase):
@@ -667,6 +694,22 @@ class TestResampleSessionBars(WithBcolzFutureMinuteBarReader,
                                         err_msg="sid={0} col={1} dt={2}".
                                         format(sid, col, dt))
 
+    def test_get_values(self):
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)[::-1]
+        for session in self.session_bar_reader.sessions:
+            for col in OHLCV:
+                expected = [
+                    self.session_bar_reader.get_value(sid, session, col)
+                    for sid in sids
+                ]
+                result = self.session_bar_reader.get_values(
+                    sids, session, col,
+                )
+                assert_almost_equal(result,
+                                    expected,
+                                    err_msg="col={0} session={1}".
+                                    format(col, session))
+
     def test_first_trading_day(self):
         self.assertEqual(self.START_DATE,
                          self.session_bar_reader.first_trading_day)
@@ -682,6 +725,142 @@ class TestResampleSessionBars(WithBcolzFutureMinuteBarReader,
         )
 
 
+class TestCachedResampleSessionBars(WithInstanceTmpDir,
+                                    TestResampleSessionBars):
+    """
+    Run the resampling tests against a reader which persists the resampled
+    sessions.
+    """
+
+    def init_instance_fixtures(self):
+        super(TestCachedResampleSessionBars, self).init_instance_fixtures()
+        # Resample one session at a time so that filling the cache has to
+        # stitch blocks of sessions together.
+        self.enter_instance_context(
+            patch.object(resample, 'RESAMPLE_CACHE_SESSIONS_PER_BLOCK', 1),
+        )
+        self.cache_path = self.instance_tmpdir.getpath('resampled')
+        self.session_bar_reader = self.make_cached_reader()
+
+    def make_cached_reader(self):
+        return MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_path=self.cache_path,
+        )
+
+    def cached_tables(self, reader):
+        return sorted(
+            p for p in os.listdir(reader._cache_dir) if p.endswith('.bcolz')
+        )
+
+    def test_cache_is_reused(self):
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        expected = self.session_bar_reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        minute_reader = self.bcolz_future_minute_bar_reader
+        self.assertEqual(
+            self.cached_tables(self.session_bar_reader),
+            sorted(
+                '{0}-{1}.bcolz'.format(sid, minute_reader.table_len(sid))
+                for sid in sids
+            ),
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError('sessions should be read from the cache')
+
+        reader = self.make_cached_reader()
+        reader._get_resampled = fail
+        result = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        for field, e, r in zip(OHLCV, expected, result):
+            self.assertEqual(e.dtype, r.dtype)
+            assert_almost_equal(e, r, err_msg=field)
+
+    def test_open_tables_are_bounded(self):
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        expected = self.session_bar_reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+
+        # A read of more sids than the reader keeps open still reads all of
+        # them, and only the tables of the last sids are kept.
+        reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_path=self.cache_path,
+            sid_cache_size=1,
+        )
+        result = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        for field, e, r in zip(OHLCV, expected, result):
+            assert_almost_equal(e, r, err_msg=field)
+        self.assertEqual(list(reader._cached_tables), [sids[-1]])
+
+    def test_cache_is_invalidated(self):
+        sid = self.ASSET_FINDER_FUTURE_SIDS[0]
+        expected = self.session_bar_reader.get_value(
+            sid, self.START_DATE, 'close',
+        )
+        old_dir = self.session_bar_reader._cache_dir
+        old_tables = self.cached_tables(self.session_bar_reader)
+
+        # Pretend that the minute store changed.
+        reader = self.make_cached_reader()
+        key = reader._cache_key()
+        key['last_available_dt'] = str(self.START_DATE)
+        reader._cache_key = lambda: key
+
+        # The new version of the minute store is cached in a new directory,
+        # leaving the tables of the old version for the readers using them.
+        self.assertNotEqual(reader._cache_dir, old_dir)
+        self.assertEqual(self.cached_tables(reader), [])
+        assert_almost_equal(
+            reader.get_value(sid, self.START_DATE, 'close'),
+            expected,
+        )
+        self.assertEqual(self.cached_tables(self.session_bar_reader),
+                         old_tables)
+        assert_almost_equal(
+            self.session_bar_reader.get_value(sid, self.START_DATE, 'close'),
+            expected,
+        )
+
+    def test_concurrent_writers(self):
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        expected = self.make_cached_reader().load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        tables = self.cached_tables(self.session_bar_reader)
+        paths = [
+            os.path.join(self.session_bar_reader._cache_dir, table)
+            for table in tables
+        ]
+        inodes = [os.stat(path).st_ino for path in paths]
+
+        # Simulate a process which looked for the tables before another
+        # process wrote them, so it resamples the sids and loses the race to
+        # rename its tables into place.
+        reader = self.make_cached_reader()
+        reader._open_cached_table = lambda sid: None
+        result = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        for field, e, r in zip(OHLCV, expected, result):
+            assert_almost_equal(e, r, err_msg=field)
+
+        # The winner's tables are kept, and the loser's are discarded.
+        self.assertEqual(
+            sorted(os.listdir(reader._cache_dir)),
+            sorted(tables + [resample.RESAMPLE_CACHE_METADATA_FILENAME]),
+        )
+        self.assertEqual([os.stat(path).st_ino for path in paths], inodes)
+
+
 class TestReindexMinuteBars(WithBcolzEquityMinuteBarReader,
                             ZiplineTestCase):
 
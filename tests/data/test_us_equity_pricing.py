@@ -14,6 +14,7 @@
 # limitations under the License.
 from sys import maxsize
 import re
+from threading import active_count
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -35,6 +36,8 @@ from zipline.data.us_equity_pricing import (
     BcolzDailyBarWriter,
     NoDataBeforeDate,
     NoDataAfterDate,
+    NoDataForSid,
+    NoDataOnDate,
 )
 from zipline.pipeline.loaders.synthetic import (
     OHLCV,
@@ -330,6 +333,48 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, ZiplineTestCase):
         with self.assertRaises(NoDataAfterDate):
             reader.get_value(4, Timestamp('2015-06-16', tz='UTC'), 'close')
 
+    def test_sid_rows(self):
+        reader = self.bcolz_equity_daily_bar_reader
+        self.assertEqual(reader.sids, sorted(self.assets))
+        for asset_id in self.assets:
+            dates = self.dates_for_asset(asset_id)
+            rows = reader.sid_rows(asset_id)
+            assert_array_equal(rows['id'], [asset_id] * len(dates))
+            assert_array_equal(
+                [seconds_to_timestamp(day) for day in rows['day']],
+                dates,
+            )
+            self.assertEqual(reader.last_session_for_sid(asset_id), dates[-1])
+
+        with self.assertRaises(NoDataForSid):
+            reader.sid_rows(maxsize)
+        with self.assertRaises(NoDataForSid):
+            reader.last_session_for_sid(maxsize)
+
+    @parameterized.expand([(column,) for column in OHLCV])
+    def test_get_values(self, column):
+        reader = self.bcolz_equity_daily_bar_reader
+        # Query the assets out of order, with a repeat.
+        assets = [6, 1, 3, 5, 2, 4, 3]
+        expected = expected_bar_values_2d(
+            self.sessions,
+            EQUITY_INFO,
+            column,
+        )[:, [EQUITY_INFO.index.get_loc(a) for a in assets]]
+
+        for i, session in enumerate(self.sessions):
+            result = reader.get_values(assets, session, column)
+            self.assertEqual(result.dtype, expected.dtype)
+            assert_array_equal(result, expected[i], err_msg=str(session))
+
+        # A day which is not a session is an error, as it is for get_value.
+        with self.assertRaises(NoDataOnDate):
+            reader.get_values(
+                assets,
+                Timestamp('2015-06-06', tz='UTC'),
+                column,
+            )
+
     def test_unadjusted_get_value_empty_value(self):
         reader = self.bcolz_equity_daily_bar_reader
 
@@ -369,6 +414,49 @@ class BcolzDailyBarNeverReadAllTestCase(BcolzDailyBarTestCase):
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = maxsize
 
 
+class BcolzDailyBarThreadedReadTestCase(BcolzDailyBarNeverReadAllTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase with slices of assets read
+    on a thread pool.
+    """
+    BCOLZ_DAILY_BAR_READ_WORKERS = 3
+
+    def test_close(self):
+        reader = BcolzDailyBarReader(
+            self.bcolz_daily_bar_ctable,
+            read_workers=self.BCOLZ_DAILY_BAR_READ_WORKERS,
+        )
+        expected = expected_bar_values_2d(self.sessions, EQUITY_INFO, 'close')
+        threads = active_count()
+
+        with reader:
+            self._check_close_prices(reader, expected)
+            self.assertGreater(active_count(), threads)
+        self.assertEqual(active_count(), threads)
+
+        # A closed reader starts a new pool when it reads on threads again.
+        self._check_close_prices(reader, expected)
+        reader.close()
+        self.assertEqual(active_count(), threads)
+
+    def _check_close_prices(self, reader, expected):
+        result, = reader.load_raw_arrays(
+            ['close'],
+            self.sessions[0],
+            self.sessions[-1],
+            self.assets,
+        )
+        assert_array_equal(result, expected)
+
+
+class BcolzDailyBarThreadedReadAllTestCase(BcolzDailyBarAlwaysReadAllTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase with whole columns read on
+    a thread pool.
+    """
+    BCOLZ_DAILY_BAR_READ_WORKERS = 3
+
+
 class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
                                              WithTmpDir,
                                              WithTradingCalendars,
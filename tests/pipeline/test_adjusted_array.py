@@ -658,6 +658,63 @@ class AdjustedArrayTestCase(TestCase):
             for yielded, expected_yield in zip_longest(window_iter, expected):
                 check_arrays(yielded, expected_yield)
 
+    @parameterized.expand(
+        chain(
+            _gen_unadjusted_cases(
+                'float',
+                make_input=as_dtype(float64_dtype),
+                make_expected_output=as_dtype(float64_dtype),
+                missing_value=default_missing_value_for_dtype(float64_dtype),
+            ),
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(int64_dtype),
+            _gen_overwrite_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(datetime64ns_dtype),
+        )
+    )
+    def test_stack(self,
+                   name,
+                   data,
+                   lookback,
+                   adjustments,
+                   missing_value,
+                   perspective_offset,
+                   expected):
+        array = AdjustedArray(data, adjustments, missing_value)
+        expected = list(expected)
+
+        window_iter = array.traverse(
+            lookback,
+            perspective_offset=perspective_offset,
+        )
+        # Stack the first window alone and then all of the others, copying
+        # each stack before advancing, to check that stacking picks up where
+        # the window was left.
+        stacked = list(window_iter.stack(1).copy())
+        if len(expected) > 1:
+            stacked.extend(window_iter.stack(len(expected) - 1).copy())
+
+        self.assertEqual(len(stacked), len(expected))
+        for yielded, expected_yield in zip(stacked, expected):
+            check_arrays(yielded, expected_yield)
+
+        with self.assertRaises(ValueError):
+            window_iter.stack(1)
+
+    def test_stack_without_adjustments(self):
+        data = arange(30, dtype=float).reshape(6, 5)
+        adj_array = AdjustedArray(data, {}, float('nan'))
+
+        window_iter = adj_array.traverse(3)
+        next(window_iter)
+        stacked = window_iter.stack(3)
+
+        check_arrays(stacked, asarray(list(moving_window(data, 3))[1:]))
+        # The windows are a single view of the data, which can't be written.
+        self.assertIsNotNone(stacked.base)
+        with self.assertRaises(ValueError):
+            stacked[0, 0, 0] = 5.0
+
     def test_invalid_lookback(self):
 
         data = arange(30, dtype=float).reshape(6, 5)
@@ -5,6 +5,7 @@ from __future__ import division
 from collections import OrderedDict
 from itertools import product
 from operator import add, sub
+import pickle
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -15,13 +16,15 @@ from numpy import (
     float64,
     full,
     full_like,
+    inf,
     log,
     nan,
     tile,
     where,
     zeros,
 )
-from numpy.testing import assert_almost_equal
+from numpy.random import RandomState
+from numpy.testing import assert_allclose, assert_almost_equal
 from pandas import (
     Categorical,
     DataFrame,
@@ -36,24 +39,42 @@ from pandas.util.testing import assert_frame_equal
 from six import iteritems, itervalues
 from toolz import merge
 
-from zipline.assets.synthetic import make_rotating_equity_info
+from zipline.assets.synthetic import (
+    make_rotating_equity_info,
+    make_simple_equity_info,
+)
+from zipline.data.bundles.core import _make_bundle_core
 from zipline.errors import NoFurtherDataError
 from zipline.lib.adjustment import MULTIPLY
 from zipline.lib.labelarray import LabelArray
 from zipline.pipeline import CustomFactor, Pipeline
 from zipline.pipeline.data import Column, DataSet, USEquityPricing
 from zipline.pipeline.data.testing import TestingDataSet
+import zipline.pipeline.engine as engine_module
 from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.engine_spec import BundleEngineSpec
 from zipline.pipeline.factors import (
+    AnnualizedVolatility,
+    Aroon,
     AverageDollarVolume,
+    BollingerBands,
     EWMA,
     EWMSTD,
     ExponentialWeightedMovingAverage,
     ExponentialWeightedMovingStdDev,
+    FastStochasticOscillator,
+    IchimokuKinkoHyo,
+    LinearWeightedMovingAverage,
+    MACDSignal,
     MaxDrawdown,
+    RateOfChangePercentage,
     Returns,
+    RSI,
     SimpleMovingAverage,
+    TrueRange,
+    VWAP,
 )
+from zipline.pipeline.filters import StaticSids
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
@@ -79,13 +100,16 @@ from zipline.testing import (
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
     WithEquityPricingPipelineEngine,
+    WithInstanceTmpDir,
     WithSeededRandomPipelineEngine,
     WithTradingEnvironment,
     ZiplineTestCase,
 )
 from zipline.testing.predicates import assert_equal
+from zipline.utils.calendars import get_calendar
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import bool_dtype, datetime64ns_dtype
+from zipline.utils.pool import SequentialPool
 
 
 class RollingSumDifference(CustomFactor):
@@ -378,6 +402,59 @@ class ConstantInputTestCase(WithConstantInputs, ZiplineTestCase):
             full(shape, -2 * high_factor.window_length, dtype=float),
         )
 
+    def test_compute_workers(self):
+        loader = self.loader
+        dates = self.dates[10:15]
+
+        columns = {}
+        for window_length in range(1, 6):
+            short = RollingSumDifference(window_length=window_length)
+            high = RollingSumDifference(
+                window_length=window_length,
+                inputs=[USEquityPricing.open, USEquityPricing.high],
+            )
+            columns['short_%d' % window_length] = short
+            columns['high_%d' % window_length] = high
+            columns['sum_%d' % window_length] = (short + high).rank()
+        pipeline = Pipeline(columns=columns, screen=AssetID() > 1)
+
+        expected = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        ).run_pipeline(pipeline, dates[0], dates[-1])
+
+        for compute_workers in (2, 4):
+            engine = SimplePipelineEngine(
+                lambda column: loader,
+                self.dates,
+                self.asset_finder,
+                compute_workers=compute_workers,
+            )
+            result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+            assert_frame_equal(result, expected)
+
+    def test_compute_workers_error(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            compute_workers=2,
+        )
+
+        class BrokenFactor(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 1
+
+            def compute(self, today, assets, out, closes):
+                raise ValueError('broken')
+
+        p = Pipeline(columns={
+            'broken': BrokenFactor(),
+            'ok': RollingSumDifference(),
+        })
+        with self.assertRaisesRegexp(ValueError, 'broken'):
+            engine.run_pipeline(p, self.dates[10], self.dates[11])
+
     def test_numeric_factor(self):
         constants = self.constants
         loader = self.loader
@@ -1077,6 +1154,39 @@ class SyntheticBcolzTestCase(WithAdjustmentReader,
 
         assert_frame_equal(expected, result)
 
+    def test_compute_workers(self):
+        # The adjustments db is in memory, so it has no index and the loader
+        # reads adjustments from the db's connection, which can only be used
+        # on the thread that created it.
+        self.assertIsNone(self.adjustment_reader.adjustment_index)
+
+        dates = self.trading_calendar.sessions_in_range(
+            self.first_asset_start,
+            self.last_asset_end,
+        )
+        pipeline = Pipeline(columns={
+            'sma': SimpleMovingAverage(
+                inputs=(USEquityPricing.close,),
+                window_length=5,
+            ),
+            'drawdown': MaxDrawdown(
+                inputs=(USEquityPricing.close,),
+                window_length=5,
+            ),
+            'volume': USEquityPricing.volume.latest,
+        })
+
+        def run_pipeline(compute_workers):
+            engine = SimplePipelineEngine(
+                lambda column: self.pipeline_loader,
+                self.trading_calendar.all_sessions,
+                self.asset_finder,
+                compute_workers=compute_workers,
+            )
+            return engine.run_pipeline(pipeline, dates[5], dates[-1])
+
+        assert_frame_equal(run_pipeline(2), run_pipeline(None))
+
 
 class ParameterizedFactorTestCase(WithTradingEnvironment, ZiplineTestCase):
     sids = ASSET_FINDER_EQUITY_SIDS = Int64Index([1, 2, 3])
@@ -1501,6 +1611,16 @@ class PopulateInitialWorkspaceTestCase(WithConstantInputs, ZiplineTestCase):
         )
 
 
+def make_chunked_pipeline():
+    return Pipeline(
+        columns={
+            'close': USEquityPricing.close.latest,
+            'returns': Returns(window_length=2),
+            'categorical': USEquityPricing.close.latest.quantiles(5)
+        },
+    )
+
+
 class ChunkedPipelineTestCase(WithEquityPricingPipelineEngine,
                               ZiplineTestCase):
 
@@ -1531,3 +1651,414 @@ class ChunkedPipelineTestCase(WithEquityPricingPipelineEngine,
             chunksize=22
         )
         self.assertTrue(chunked_result.equals(pipeline_result))
+
+    def test_run_chunked_pipeline_in_pool(self):
+        """
+        Test that running a pipeline in chunks on a pool produces the same
+        result as if it were run all at once
+        """
+        engine = self.pipeline_engine
+        built = []
+
+        def engine_spec():
+            built.append(engine)
+            return engine
+
+        pipeline_result = engine.run_pipeline(
+            make_chunked_pipeline(),
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+        )
+        chunked_result = engine.run_chunked_pipeline_in_pool(
+            make_pipeline=make_chunked_pipeline,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+            engine_spec=engine_spec,
+            pool=SequentialPool(),
+        )
+        self.assertTrue(chunked_result.equals(pipeline_result))
+
+        # The engine is built once for all of the chunks, and isn't kept
+        # alive once the pipeline has been run.
+        self.assertEqual(len(built), 1)
+        self.assertEqual(engine_module._last_chunk_engine, [None, None])
+
+    def test_run_pipeline_chunk_builds_engine_per_run(self):
+        """
+        Test that a worker reuses its engine for the chunks of a run, and
+        replaces it when it computes a chunk of another run.
+        """
+        engine = self.pipeline_engine
+        built = []
+
+        def engine_spec():
+            built.append(engine)
+            return engine
+
+        def run_chunk(run_token):
+            engine_module._run_pipeline_chunk((
+                run_token,
+                engine_spec,
+                make_chunked_pipeline,
+                self.PIPELINE_START_DATE,
+                self.PIPELINE_START_DATE,
+            ))
+
+        try:
+            run_chunk('first')
+            run_chunk('first')
+            self.assertEqual(len(built), 1)
+
+            # The same spec is built again for a new run.
+            run_chunk('second')
+            self.assertEqual(len(built), 2)
+            self.assertEqual(
+                engine_module._last_chunk_engine,
+                ['second', engine],
+            )
+        finally:
+            engine_module._last_chunk_engine[:] = None, None
+
+    def test_bundle_engine_spec_pickle(self):
+        spec = BundleEngineSpec(
+            'bundle',
+            environ={'ZIPLINE_ROOT': '/tmp/zipline'},
+            get_loader=make_chunked_pipeline,
+        )
+        roundtripped = pickle.loads(pickle.dumps(spec))
+
+        self.assertEqual(roundtripped, spec)
+        self.assertEqual(hash(roundtripped), hash(spec))
+        self.assertNotEqual(
+            BundleEngineSpec('bundle', timestamp=spec.timestamp),
+            spec,
+        )
+
+
+class BundleEngineSpecTestCase(WithInstanceTmpDir, ZiplineTestCase):
+    START_DATE = Timestamp('2014-01-06', tz='utc')
+    END_DATE = Timestamp('2014-01-10', tz='utc')
+
+    def test_call(self):
+        _, register, _, ingest, _, _ = _make_bundle_core()
+        sessions = get_calendar('NYSE').sessions_in_range(
+            self.START_DATE,
+            self.END_DATE,
+        )
+        equities = make_simple_equity_info(
+            range(3),
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            daily_bar_writer.write(make_bar_data(equities, sessions))
+            adjustment_writer.write()
+
+        environ = {'ZIPLINE_ROOT': self.instance_tmpdir.path}
+        ingest(
+            'bundle',
+            environ=environ,
+            timestamp=Timestamp('2014-01-10 23:00', tz='utc'),
+        )
+
+        spec = pickle.loads(pickle.dumps(
+            BundleEngineSpec('bundle', environ=environ),
+        ))
+        result = spec().run_pipeline(
+            Pipeline(columns={'close': USEquityPricing.close.latest}),
+            sessions[1],
+            sessions[-1],
+        )
+
+        # Each session sees the close of the session before it.
+        assert_equal(
+            result['close'].unstack().values,
+            expected_bar_values_2d(sessions[:-1], equities, 'close'),
+        )
+
+
+def per_date(factor_type):
+    """
+    Make a subclass of ``factor_type`` which is computed one date at a time.
+    """
+    return type(
+        'PerDate' + factor_type.__name__,
+        (factor_type,),
+        {'compute_batch': None},
+    )
+
+
+class ComputeBatchTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
+
+    def test_builtin_factors_match_compute(self):
+        close = USEquityPricing.close
+        mask = close.latest > 30
+        factors = {
+            'returns': (Returns, {'window_length': 5}),
+            'sma': (SimpleMovingAverage, {
+                'inputs': [close], 'window_length': 10,
+            }),
+            'vwap': (VWAP, {'window_length': 10}),
+            'drawdown': (MaxDrawdown, {
+                'inputs': [close], 'window_length': 10,
+            }),
+            'dollar_volume': (AverageDollarVolume, {'window_length': 10}),
+            'ewma': (EWMA, {
+                'inputs': [close], 'window_length': 10, 'decay_rate': 0.5,
+            }),
+            'ewmstd': (EWMSTD, {
+                'inputs': [close], 'window_length': 10, 'decay_rate': 0.5,
+            }),
+            'lwma': (LinearWeightedMovingAverage, {
+                'inputs': [close], 'window_length': 10,
+            }),
+            'volatility': (AnnualizedVolatility, {'window_length': 20}),
+            'rsi': (RSI, {}),
+            'bollinger': (BollingerBands, {'window_length': 10, 'k': 2}),
+            'aroon': (Aroon, {'window_length': 10}),
+            'fso': (FastStochasticOscillator, {}),
+            'ichimoku': (IchimokuKinkoHyo, {}),
+            'rocp': (RateOfChangePercentage, {
+                'inputs': [close], 'window_length': 10,
+            }),
+            'true_range': (TrueRange, {}),
+            'macd': (MACDSignal, {}),
+        }
+
+        columns = {}
+        for name, (factor_type, kwargs) in iteritems(factors):
+            for suffix, type_ in (('', factor_type),
+                                  ('_per_date', per_date(factor_type))):
+                factor = type_(mask=mask, **kwargs)
+                if factor.outputs is NotSpecified:
+                    columns[name + suffix] = factor
+                else:
+                    for output in factor.outputs:
+                        columns[name + '_' + output + suffix] = getattr(
+                            factor, output,
+                        )
+
+        # Compute one date per call to compute_batch.
+        small_batches = type(
+            'SmallBatchSimpleMovingAverage',
+            (SimpleMovingAverage,),
+            {'_max_batch_size': 1, 'compute_rolling': None},
+        )
+        columns['small_batches'] = small_batches(
+            inputs=[close], window_length=10, mask=mask,
+        )
+        columns['small_batches_per_date'] = columns['sma_per_date']
+
+        dates = self.trading_days[-20:]
+        results = self.run_pipeline(Pipeline(columns), dates[0], dates[-1])
+
+        for name in columns:
+            if name.endswith('_per_date'):
+                continue
+            assert_almost_equal(
+                results[name].values,
+                results[name + '_per_date'].values,
+                err_msg=name,
+            )
+
+    def test_compute_overrides_compute_batch(self):
+
+        class Constant(SimpleMovingAverage):
+            def compute(self, today, assets, out, data):
+                out[:] = 1.0
+
+        dates = self.trading_days[-5:]
+        results = self.run_pipeline(
+            Pipeline({
+                'constant': Constant(inputs=[USEquityPricing.close],
+                                     window_length=3),
+            }),
+            dates[0],
+            dates[-1],
+        )
+        self.assertTrue((results['constant'] == 1.0).all())
+
+    def test_partially_masked_universe(self):
+        sids = self.asset_finder.sids
+        close = USEquityPricing.close
+        # The first asset is masked out on every date, and the others on
+        # some of the dates.
+        mask = ~StaticSids(sids[:1]) & (close.latest > 30)
+        batch_assets = []
+
+        class Range(CustomFactor):
+            inputs = [close]
+            window_length = 5
+
+            def compute(self, today, assets, out, closes):
+                out[:] = closes.max(axis=0) - closes.min(axis=0)
+
+            def compute_batch(self, dates, assets, out, mask, closes):
+                batch_assets.append(assets)
+                out[:] = closes.max(axis=1) - closes.min(axis=1)
+
+        dates = self.trading_days[-10:]
+        results = self.run_pipeline(
+            Pipeline({
+                'range': Range(mask=mask),
+                'range_per_date': per_date(Range)(mask=mask),
+                'mask': mask,
+            }),
+            dates[0],
+            dates[-1],
+        )
+
+        masked_out = ~results['mask']
+        self.assertTrue(masked_out.any() and not masked_out.all())
+
+        # compute_batch is passed the columns of every asset, including the
+        # assets which are masked out on all of the dates, and their outputs
+        # are replaced with the missing value.
+        self.assertTrue(batch_assets)
+        for assets in batch_assets:
+            self.assertIn(sids[0], assets)
+        self.assertTrue(results['range'][masked_out].isnull().all())
+        assert_almost_equal(
+            results['range'].values,
+            results['range_per_date'].values,
+        )
+
+    def test_one_dimensional_factors_use_compute(self):
+        close = USEquityPricing.close
+
+        class MaskedMean(CustomFactor):
+            inputs = [close]
+            window_length = 3
+            window_safe = True
+            ndim = 1
+
+            def compute(self, today, assets, out, closes):
+                # Only the assets in the mask are passed to ``compute``.
+                out[:] = closes.mean()
+
+            def compute_batch(self, dates, assets, out, mask, closes):
+                raise AssertionError('compute_batch should not be called')
+
+        # Single column outputs can't be pipeline columns, so they are read
+        # through another factor.
+        class UsesMaskedMean(CustomFactor):
+            inputs = [MaskedMean(mask=close.latest > 30)]
+            window_length = 1
+
+            def compute(self, today, assets, out, mean):
+                out[:] = mean[-1]
+
+        dates = self.trading_days[-5:]
+        results = self.run_pipeline(
+            Pipeline({'mean': UsesMaskedMean()}),
+            dates[0],
+            dates[-1],
+        )
+        self.assertFalse(results['mean'].isnull().any())
+
+    def test_rolling_factors_match_compute(self):
+        dates = self.trading_days[-40:]
+        sids = self.asset_finder.sids
+        assets = self.asset_finder.retrieve_all(sids)
+        close, volume = USEquityPricing.close, USEquityPricing.volume
+
+        state = RandomState(5)
+        closes = DataFrame(
+            state.uniform(10, 100, (len(dates), len(assets))),
+            index=dates,
+            columns=assets,
+        )
+        closes.iloc[5:8, 0] = nan
+        # Windows with infinities are computed by compute_batch.
+        closes.iloc[30, 1] = inf
+        volumes = DataFrame(
+            state.uniform(1e5, 1e6, (len(dates), len(assets))),
+            index=dates,
+            columns=assets,
+        )
+        volumes.iloc[10, 2] = nan
+
+        def adjustments(*records):
+            return DataFrame.from_records([
+                dict(
+                    kind=MULTIPLY,
+                    sid=sids[i],
+                    value=value,
+                    start_date=None,
+                    end_date=dates[apply_idx - 1],
+                    apply_date=dates[apply_idx],
+                )
+                for i, value, apply_idx in records
+            ])
+
+        # The inputs are adjusted on different dates, so the rolling kernels
+        # are run between the adjustments of both.
+        loaders = {
+            close: DataFrameLoader(
+                close, closes, adjustments((0, 0.5, 20), (1, 2.0, 25)),
+            ),
+            volume: DataFrameLoader(
+                volume, volumes, adjustments((0, 2.0, 22)),
+            ),
+        }
+        engine = SimplePipelineEngine(
+            loaders.__getitem__,
+            self.trading_days,
+            self.asset_finder,
+        )
+
+        mask = close.latest > 20
+        factors = {
+            'sma': (SimpleMovingAverage, {'inputs': [close]}),
+            'vwap': (VWAP, {}),
+            'dollar_volume': (AverageDollarVolume, {}),
+            'volatility': (AnnualizedVolatility, {}),
+            'ewma': (EWMA, {'inputs': [close], 'decay_rate': 0.5}),
+            'ewmstd': (EWMSTD, {'inputs': [close], 'decay_rate': 0.5}),
+        }
+        columns = {}
+        for name, (factor_type, kwargs) in iteritems(factors):
+            for suffix, type_ in (('', factor_type),
+                                  ('_per_date', per_date(factor_type))):
+                columns[name + suffix] = type_(
+                    window_length=10, mask=mask, **kwargs
+                )
+
+        # Advance the windows a few dates at a time, so that blocks start
+        # and stop between adjustments.
+        small_blocks = type(
+            'SmallBlockVWAP',
+            (VWAP,),
+            # Three dates of the windows of both inputs.
+            {'_max_batch_size': 3 * 2 * 10 * len(sids)},
+        )
+        columns['small_blocks'] = small_blocks(window_length=10, mask=mask)
+        columns['small_blocks_per_date'] = columns['vwap_per_date']
+
+        results = engine.run_pipeline(Pipeline(columns), dates[15], dates[-1])
+        for name in list(factors) + ['small_blocks']:
+            assert_allclose(
+                results[name].values,
+                results[name + '_per_date'].values,
+                rtol=1e-9,
+                err_msg=name,
+            )
@@ -0,0 +1,129 @@
+"""
+Tests for zipline.lib.rolling
+"""
+from numpy import arange, array, average, nan, sqrt
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+
+from zipline.lib.rolling import (
+    aligned_spans,
+    rolling_ewma,
+    rolling_ewmstd,
+    rolling_nanmean,
+    rolling_nansum,
+    rolling_nanstd,
+    rolling_windows,
+)
+from zipline.pipeline.factors.basic import exponential_weights
+from zipline.testing import check_arrays, parameter_space
+from zipline.testing.fixtures import ZiplineTestCase
+from zipline.utils.math_utils import nanmean, nanstd, nansum
+from zipline.utils.numpy_utils import ignore_nanwarnings
+
+
+def ewmstd(window, decay_rate):
+    weights = exponential_weights(len(window), decay_rate)
+    mean = average(window, axis=0, weights=weights)
+    variance = average((window - mean) ** 2, axis=0, weights=weights)
+    squared_weight_sum = weights.sum() ** 2
+    return sqrt(
+        variance * squared_weight_sum /
+        (squared_weight_sum - (weights ** 2).sum())
+    )
+
+
+class RollingKernelsTestCase(ZiplineTestCase):
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(RollingKernelsTestCase, cls).init_class_fixtures()
+        data = RandomState(0).uniform(50.0, 150.0, (30, 4))
+        data[[2, 3, 15], [0, 1, 3]] = nan
+        # Windows which start before the first value of a column.
+        data[:12, 2] = nan
+        cls.data = data
+
+    def expected(self, func, window_length):
+        with ignore_nanwarnings():
+            return array([
+                func(window)
+                for window in rolling_windows(self.data, window_length)
+            ])
+
+    def test_rolling_windows(self):
+        data = arange(12).reshape(6, 2)
+        windows = rolling_windows(data, 3)
+
+        check_arrays(
+            windows,
+            array([data[0:3], data[1:4], data[2:5], data[3:6]]),
+        )
+        self.assertFalse(windows.flags.writeable)
+
+    @parameter_space(window_length=[1, 3, 10])
+    def test_nan_reductions(self, window_length):
+        for kernel, reduction in ((rolling_nansum, nansum),
+                                  (rolling_nanmean, nanmean),
+                                  (rolling_nanstd, nanstd)):
+            assert_allclose(
+                kernel(self.data, window_length),
+                self.expected(
+                    lambda window: reduction(window, axis=0),
+                    window_length,
+                ),
+                rtol=1e-10,
+                atol=1e-10,
+                err_msg=kernel.__name__,
+            )
+
+    @parameter_space(window_length=[2, 3, 10], decay_rate=[0.25, 0.5, 1.0])
+    def test_exponential_reductions(self, window_length, decay_rate):
+        assert_allclose(
+            rolling_ewma(self.data, window_length, decay_rate),
+            self.expected(
+                lambda window: average(
+                    window,
+                    axis=0,
+                    weights=exponential_weights(window_length, decay_rate),
+                ),
+                window_length,
+            ),
+            rtol=1e-10,
+        )
+        assert_allclose(
+            rolling_ewmstd(self.data, window_length, decay_rate),
+            self.expected(
+                lambda window: ewmstd(window, decay_rate),
+                window_length,
+            ),
+            rtol=1e-8,
+        )
+
+    def test_aligned_spans(self):
+        window_length = 3
+        data = arange(20).reshape(10, 2)
+
+        def split(*starts):
+            # Split the 8 windows of data into spans, starting at ``starts``.
+            stops = starts[1:] + (8,)
+            return [
+                data[start:stop + window_length - 1]
+                for start, stop in zip(starts, stops)
+            ]
+
+        pieces = list(
+            aligned_spans([split(0, 3), split(0, 5, 6)], window_length, 8)
+        )
+        self.assertEqual(
+            [(start, stop) for start, stop, _ in pieces],
+            [(0, 3), (3, 5), (5, 6), (6, 8)],
+        )
+        for start, stop, arrays in pieces:
+            for span in arrays:
+                check_arrays(span, data[start:stop + window_length - 1])
+
+        # Terms without inputs still get a single run of windows.
+        self.assertEqual(
+            [(start, stop) for start, stop, _ in aligned_spans([], 3, 8)],
+            [(0, 8)],
+        )
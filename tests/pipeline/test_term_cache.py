@@ -0,0 +1,209 @@
+"""
+Tests for zipline.pipeline.term_cache
+"""
+import numpy as np
+from pandas import Timestamp, date_range
+from pandas.util.testing import assert_frame_equal
+
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import Returns, SimpleMovingAverage
+from zipline.pipeline.loaders.synthetic import PrecomputedLoader
+from zipline.pipeline.term_cache import TermResultCache, term_digest
+from zipline.testing import ExplodingObject
+from zipline.testing.fixtures import (
+    WithInstanceTmpDir,
+    WithTradingEnvironment,
+    ZiplineTestCase,
+)
+
+
+class TermResultCacheTestCase(WithInstanceTmpDir,
+                              WithTradingEnvironment,
+                              ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3, 4
+    START_DATE = Timestamp('2014-01-01', tz='utc')
+    END_DATE = Timestamp('2014-03-01', tz='utc')
+    INGESTION_TIMESTAMP = Timestamp('2014-03-02', tz='utc')
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(TermResultCacheTestCase, cls).init_class_fixtures()
+        cls.dates = date_range(
+            cls.START_DATE,
+            cls.END_DATE,
+            freq='D',
+            tz='UTC',
+        )
+        cls.loader = PrecomputedLoader(
+            constants={
+                USEquityPricing.close: 3,
+                USEquityPricing.volume: 100,
+            },
+            dates=cls.dates,
+            sids=cls.ASSET_FINDER_EQUITY_SIDS,
+        )
+
+    def make_engine(self, loader, cache):
+        return SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            term_cache=cache,
+        )
+
+    def make_pipeline(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        return Pipeline(
+            columns={
+                'sma': sma,
+                'returns': Returns(window_length=3),
+            },
+            screen=sma > 0,
+        )
+
+    def test_cached_terms_are_not_recomputed(self):
+        path = self.instance_tmpdir.path
+        start, end = self.dates[10], self.dates[20]
+
+        cache = TermResultCache(path, self.INGESTION_TIMESTAMP)
+        expected = self.make_engine(self.loader, cache).run_pipeline(
+            self.make_pipeline(), start, end,
+        )
+        self.assertEqual(cache.hits, 0)
+        # The two factors and the screen.
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(cache.writes, 3)
+        self.assertEqual(len(cache), 3)
+
+        # A new cache reading the same directory, as in another process,
+        # serves all of the terms, so the loader isn't used.
+        cache = TermResultCache(path, self.INGESTION_TIMESTAMP)
+        result = self.make_engine(ExplodingObject(), cache).run_pipeline(
+            self.make_pipeline(), start, end,
+        )
+        assert_frame_equal(result, expected)
+        self.assertEqual((cache.hits, cache.misses, cache.writes), (3, 0, 0))
+
+        # Other dates and ingestions are computed again.
+        cache.reset_stats()
+        self.make_engine(self.loader, cache).run_pipeline(
+            self.make_pipeline(), start, self.dates[21],
+        )
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+        cache = TermResultCache(path, Timestamp('2014-03-03', tz='utc'))
+        self.make_engine(self.loader, cache).run_pipeline(
+            self.make_pipeline(), start, end,
+        )
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+    def test_eviction(self):
+        path = self.instance_tmpdir.path
+        cache = TermResultCache(path, self.INGESTION_TIMESTAMP)
+        engine = self.make_engine(self.loader, cache)
+        engine.run_pipeline(
+            self.make_pipeline(), self.dates[10], self.dates[20],
+        )
+
+        max_bytes = cache.nbytes
+        cache = TermResultCache(
+            path, self.INGESTION_TIMESTAMP, max_bytes=max_bytes,
+        )
+        engine = self.make_engine(self.loader, cache)
+        engine.run_pipeline(
+            self.make_pipeline(), self.dates[11], self.dates[21],
+        )
+
+        self.assertEqual(cache.writes, 3)
+        self.assertEqual(cache.evictions, 3)
+        self.assertLessEqual(cache.nbytes, max_bytes)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_term_digest(self):
+        close = USEquityPricing.close
+        sma = SimpleMovingAverage(inputs=[close], window_length=5)
+
+        self.assertEqual(
+            term_digest(sma),
+            term_digest(SimpleMovingAverage(inputs=[close], window_length=5)),
+        )
+        self.assertNotEqual(
+            term_digest(sma),
+            term_digest(SimpleMovingAverage(inputs=[close], window_length=6)),
+        )
+
+        def make_factor(offset):
+            class Factor(CustomFactor):
+                inputs = [close]
+                window_length = 1
+
+                if offset:
+                    def compute(self, today, assets, out, close):
+                        out[:] = close[-1] + 1
+                else:
+                    def compute(self, today, assets, out, close):
+                        out[:] = close[-1]
+
+            return Factor()
+
+        # Factors whose compute methods differ have different digests.
+        self.assertNotEqual(
+            term_digest(make_factor(0)),
+            term_digest(make_factor(1)),
+        )
+
+    def test_changed_compute_is_a_miss(self):
+        path = self.instance_tmpdir.path
+        start, end = self.dates[10], self.dates[20]
+
+        def make_pipeline(reduce_):
+            # The two compute methods only differ by the function they call.
+            if reduce_ == 'mean':
+                class Reduced(CustomFactor):
+                    inputs = [USEquityPricing.close]
+                    window_length = 5
+
+                    def compute(self, today, assets, out, close):
+                        out[:] = np.nanmean(close, axis=0)
+            else:
+                class Reduced(CustomFactor):
+                    inputs = [USEquityPricing.close]
+                    window_length = 5
+
+                    def compute(self, today, assets, out, close):
+                        out[:] = np.nanmedian(close, axis=0)
+
+            return Pipeline(columns={'reduced': Reduced()})
+
+        cache = TermResultCache(path, self.INGESTION_TIMESTAMP)
+        self.make_engine(self.loader, cache).run_pipeline(
+            make_pipeline('mean'), start, end,
+        )
+        self.make_engine(self.loader, cache).run_pipeline(
+            make_pipeline('median'), start, end,
+        )
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        # Factors which call different functions through their closures
+        # differ too.
+        def make_factor(reduce_):
+            class Reduced(CustomFactor):
+                inputs = [USEquityPricing.close]
+                window_length = 5
+
+                def compute(self, today, assets, out, close):
+                    out[:] = reduce_(close, axis=0)
+
+            return Reduced()
+
+        self.assertNotEqual(
+            term_digest(make_factor(np.nanmean)),
+            term_digest(make_factor(np.nanmedian)),
+        )
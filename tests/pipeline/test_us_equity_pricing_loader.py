@@ -15,6 +15,10 @@
 """
 Tests for USEquityPricingLoader and related classes.
 """
+import shutil
+import sqlite3
+
+from mock import patch
 from nose_parameterized import parameterized
 from numpy import (
     arange,
@@ -34,8 +38,16 @@ from pandas import (
     Timestamp,
 )
 from pandas.util.testing import assert_frame_equal
+from six import iteritems
 from toolz.curried.operator import getitem
 
+from zipline.data._adjustments import load_adjustments_from_sqlite
+from zipline.data.adjustment_index import (
+    AdjustmentIndex,
+    adjustment_index_path,
+    sqlite_db_path,
+)
+from zipline.data.us_equity_pricing import SQLiteAdjustmentReader
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     NullAdjustmentReader,
@@ -52,6 +64,7 @@ from zipline.testing import (
     seconds_to_timestamp,
     str_to_seconds,
     MockDailyBarReader,
+    tmp_dir,
 )
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
@@ -611,3 +624,91 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+
+class USEquityPricingLoaderAdjustmentIndexTestCase(
+        USEquityPricingLoaderTestCase):
+    """
+    Runs the USEquityPricingLoader tests against an adjustments db stored in a
+    file, whose adjustments are loaded from its AdjustmentIndex.
+    """
+    @classmethod
+    def make_adjustment_db_conn_str(cls):
+        return cls.enter_class_context(tmp_dir()).getpath('adjustments.db')
+
+    @staticmethod
+    def adjustment_keys(adjustments):
+        # The order of the adjustments applied on the same date does not
+        # matter, and differs between the index and the db.
+        return [
+            {loc: sorted(adj._key() for adj in adjs)
+             for loc, adjs in iteritems(column_adjustments)}
+            for column_adjustments in adjustments
+        ]
+
+    def check_adjustments_match_sqlite(self, reader):
+        columns = ['open', 'close', 'volume']
+        for start, stop in ((TEST_QUERY_START, TEST_QUERY_STOP),
+                            (TEST_CALENDAR_START, TEST_CALENDAR_STOP)):
+            query_days = self.calendar_days_between(start, stop)
+            self.assertEqual(
+                self.adjustment_keys(reader.load_adjustments(
+                    columns,
+                    query_days,
+                    self.assets,
+                )),
+                self.adjustment_keys(load_adjustments_from_sqlite(
+                    reader.conn,
+                    columns,
+                    query_days,
+                    self.assets,
+                )),
+            )
+
+    def test_adjustment_index_matches_sqlite(self):
+        self.assertIsNotNone(self.adjustment_reader.adjustment_index)
+        self.check_adjustments_match_sqlite(self.adjustment_reader)
+
+    def test_adjustment_index_is_checked_against_db(self):
+        source = sqlite_db_path(self.adjustment_reader.conn)
+        db_path = self.enter_instance_context(tmp_dir()).getpath(
+            'adjustments.db',
+        )
+        shutil.copy(source, db_path)
+        shutil.copytree(
+            adjustment_index_path(source),
+            adjustment_index_path(db_path),
+        )
+
+        # The index of an unchanged db is read without querying the db.
+        with patch.object(AdjustmentIndex,
+                          'from_db',
+                          side_effect=AssertionError):
+            reader = SQLiteAdjustmentReader(db_path)
+        self.assertIsNotNone(reader.adjustment_index)
+        self.check_adjustments_match_sqlite(reader)
+        reader.conn.close()
+
+        # Commits to a db in WAL mode don't update its file change counter,
+        # so the index is compared with the contents of the db.
+        conn = sqlite3.connect(db_path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.close()
+        reader = SQLiteAdjustmentReader(db_path)
+        self.assertIsNotNone(reader.adjustment_index)
+        self.check_adjustments_match_sqlite(reader)
+        reader.conn.close()
+
+        # Correcting ratios in place keeps the number of adjustments, but
+        # makes the index stale.
+        for journal_mode in ('WAL', 'DELETE'):
+            conn = sqlite3.connect(db_path)
+            conn.execute('PRAGMA journal_mode={}'.format(journal_mode))
+            conn.execute('UPDATE splits SET ratio = ratio * 2')
+            conn.commit()
+            conn.close()
+
+            reader = SQLiteAdjustmentReader(db_path)
+            self.assertIsNone(reader.adjustment_index, msg=journal_mode)
+            self.check_adjustments_match_sqlite(reader)
+            reader.conn.close()
@@ -653,6 +653,35 @@ class TestMinuteBarData(WithCreateBarData,
         with handle_non_market_minutes(bar_data):
             self.assertTrue(bar_data.is_stale(self.HILARIOUSLY_ILLIQUID_ASSET))
 
+    def test_can_trade_and_is_stale_multiple_assets(self):
+        assets = [
+            self.ASSET1,
+            self.ASSET2,
+            self.HILARIOUSLY_ILLIQUID_ASSET,
+            self.ASSET1,
+        ]
+        minutes = self.trading_calendar.minutes_for_session(
+            self.ASSET1.start_date
+        )
+
+        for minute in minutes[::10]:
+            # The results of a list of assets are memoized for the minute, so
+            # compare them to the results of a separate BarData.
+            bar_data = self.create_bardata(lambda: minute)
+            expected = self.create_bardata(lambda: minute)
+
+            can_trade = bar_data.can_trade(assets)
+            is_stale = bar_data.is_stale(assets)
+
+            self.assertEqual(list(can_trade.index), assets)
+            self.assertEqual(list(is_stale.index), assets)
+            for i, asset in enumerate(assets):
+                self.assertEqual(can_trade.iloc[i], expected.can_trade(asset))
+                self.assertEqual(is_stale.iloc[i], expected.is_stale(asset))
+
+                self.assertEqual(bar_data.can_trade(asset), can_trade.iloc[i])
+                self.assertEqual(bar_data.is_stale(asset), is_stale.iloc[i])
+
     def test_overnight_adjustments(self):
         # verify there is a split for SPLIT_ASSET
         splits = self.adjustment_reader.get_adjustments_for_sid(
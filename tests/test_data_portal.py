@@ -370,6 +370,57 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    @parameter_space(data_frequency=['minute', 'daily'])
+    def test_get_spot_value_multiple_assets_matches_single(self,
+                                                           data_frequency):
+        # Multiple assets are read with one call to the pricing reader, which
+        # should give the same values as reading each asset on its own,
+        # including forward filled prices and last traded dts.
+        assets = self.asset_finder.retrieve_all([10001, 2, 1, 10000, 1])
+        trading_calendar = self.trading_calendars[Equity]
+        if data_frequency == 'minute':
+            dts = trading_calendar.minutes_for_session(self.trading_days[2])
+            dts = dts[[0, 1, 5, 100]].append(
+                trading_calendar.minutes_for_session(self.trading_days[3])[:2],
+            )
+            # A minute of the futures session before the equity market opens,
+            # which is not a minute of the equity reader.
+            dts = dts.append(
+                self.trading_calendars[Future].minutes_for_session(
+                    self.trading_days[3],
+                )[:1],
+            )
+        else:
+            dts = self.trading_days[:4]
+
+        for dt in dts:
+            for field in ('open', 'close', 'volume', 'price'):
+                expected = [
+                    self.data_portal.get_spot_value(
+                        asset, field, dt, data_frequency,
+                    )
+                    for asset in assets
+                ]
+                result = self.data_portal.get_spot_value(
+                    assets, field, dt, data_frequency,
+                )
+                assert_almost_equal(
+                    result,
+                    expected,
+                    err_msg='dt={0} field={1}'.format(dt, field),
+                )
+
+            expected = [
+                self.data_portal.get_spot_value(
+                    asset, 'last_traded', dt, data_frequency,
+                )
+                for asset in assets
+            ]
+            result = self.data_portal.get_spot_value(
+                assets, 'last_traded', dt, data_frequency,
+            )
+            assert_equal(result, expected, msg='dt={0}'.format(dt))
+
     def test_bar_count_for_simple_transforms(self):
         # July 2015
         # Su Mo Tu We Th Fr Sa
@@ -516,6 +516,15 @@ def check_internal_consistency(bar_data, assets, fields, bar_count, freq):
                 panel[field][asset]
             )
 
+        # the raw arrays hold the same data as the frames
+        array = bar_data.history_array(asset_list, field, bar_count, freq)
+        np.testing.assert_array_equal(array, multi_asset_dict[field].values)
+        assert not array.flags.writeable
+        np.testing.assert_array_equal(
+            bar_data.history_index(bar_count, freq),
+            multi_asset_dict[field].index,
+        )
+
 
 # each minute's OHLCV data has a consistent offset for each field.
 # for example, the open is always 1 higher than the close, the high
@@ -2022,6 +2031,136 @@ class DailyEquityHistoryTestCase(WithHistory, ZiplineTestCase):
         np.testing.assert_almost_equal(window_1[self.ASSET2].values,
                                        window_2[self.ASSET2].values)
 
+    def test_history_window_changing_assets(self):
+        """
+        Assets added to or removed from the requested assets share window
+        blocks with the other assets, which must not change their windows.
+        """
+        data_portal = self.make_data_portal()
+        asset_sets = [
+            [self.SPLIT_ASSET, self.ASSET2],
+            [self.SPLIT_ASSET, self.ASSET2, self.MERGER_ASSET],
+            [self.MERGER_ASSET, self.DIVIDEND_ASSET],
+            [self.DIVIDEND_ASSET, self.SPLIT_ASSET, self.MERGER_ASSET],
+            [self.ASSET2, self.DIVIDEND_ASSET, self.SPLIT_ASSET],
+        ]
+        sessions = self.trading_calendar.sessions_in_range(
+            pd.Timestamp('2015-01-06', tz='UTC'),
+            pd.Timestamp('2015-01-12', tz='UTC'),
+        )
+
+        for session, assets in zip(sessions, asset_sets):
+            window = data_portal.get_history_window(
+                assets,
+                session,
+                3,
+                '1d',
+                'close',
+                'daily',
+            )
+            for asset in assets:
+                expected = self.make_data_portal().get_history_window(
+                    [asset],
+                    session,
+                    3,
+                    '1d',
+                    'close',
+                    'daily',
+                )[asset]
+                np.testing.assert_almost_equal(
+                    window[asset].values,
+                    expected.values,
+                )
+
+    def test_history_window_different_bar_counts(self):
+        """
+        Windows of different lengths for the same asset and field are served
+        by the longest window.
+        """
+        data_portal = self.make_data_portal()
+        sessions = self.trading_calendar.sessions_in_range(
+            pd.Timestamp('2015-01-09', tz='UTC'),
+            pd.Timestamp('2015-01-14', tz='UTC'),
+        )
+        asset = self.SPLIT_ASSET
+
+        for session in sessions:
+            for bar_count in (2, 5, 3):
+                window = data_portal.get_history_window(
+                    [asset],
+                    session,
+                    bar_count,
+                    '1d',
+                    'close',
+                    'daily',
+                )[asset]
+                expected = self.make_data_portal().get_history_window(
+                    [asset],
+                    session,
+                    bar_count,
+                    '1d',
+                    'close',
+                    'daily',
+                )[asset]
+                np.testing.assert_almost_equal(window.values, expected.values)
+
+        # Only the longest window is cached.
+        window, _ = data_portal._history_loader._window_blocks['close'].get(
+            (asset, False),
+            sessions[-1],
+        )
+        self.assertEqual(window.size, 5)
+
+    def test_get_adjustments(self):
+        assets = [
+            self.ASSET1,
+            self.SPLIT_ASSET,
+            self.MERGER_ASSET,
+            self.DIVIDEND_ASSET,
+        ]
+        dts = [
+            pd.Timestamp('2015-01-05', tz='UTC'),
+            pd.Timestamp('2015-01-06', tz='UTC'),
+            pd.Timestamp('2015-01-06 14:31', tz='UTC'),
+            pd.Timestamp('2015-01-07', tz='UTC'),
+            pd.Timestamp('2015-01-08', tz='UTC'),
+        ]
+        reader = self.adjustment_reader
+
+        def expected_ratio(asset, field, dt, perspective_dt):
+            tables = ['SPLITS']
+            if field != 'volume':
+                tables += ['MERGERS', 'DIVIDENDS']
+            ratio = 1.0
+            for table in tables:
+                for adj_dt, adj in reader.get_adjustments_for_sid(
+                        table, asset.sid):
+                    if dt <= adj_dt <= perspective_dt:
+                        if table == 'SPLITS' and field == 'volume':
+                            adj = 1.0 / adj
+                        ratio *= adj
+            return ratio
+
+        for field in ('close', 'volume'):
+            for i, dt in enumerate(dts):
+                for perspective_dt in dts[i:]:
+                    expected = [
+                        expected_ratio(asset, field, dt, perspective_dt)
+                        for asset in assets
+                    ]
+                    np.testing.assert_almost_equal(
+                        self.data_portal.get_adjustments(
+                            assets, field, dt, perspective_dt,
+                        ),
+                        expected,
+                    )
+                    np.testing.assert_almost_equal(
+                        self.data_portal.get_adjustment_ratios(
+                            assets, field, dt, perspective_dt,
+                        ),
+                        expected,
+                    )
+
     def test_history_window_out_of_order_dates(self):
         """
         Use a history window with non-monotonically increasing dates.
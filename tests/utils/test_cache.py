@@ -2,7 +2,12 @@ from unittest import TestCase
 
 from pandas import Timestamp, Timedelta
 
-from zipline.utils.cache import CachedObject, Expired, ExpiringCache
+from zipline.utils.cache import (
+    ByteLimitedLRU,
+    CachedObject,
+    Expired,
+    ExpiringCache,
+)
 
 
 class CachedObjectTestCase(TestCase):
@@ -65,3 +70,63 @@ class ExpiringCacheTestCase(TestCase):
         with self.assertRaises(KeyError) as e:
             self.assertEqual(cache.get('baz', expiry_3))
         self.assertEqual(e.exception.args, ('baz',))
+
+
+class ByteLimitedLRUTestCase(TestCase):
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = ByteLimitedLRU(maxbytes=10, sizeof=len)
+
+        cache['a'] = 'aaa'
+        cache['b'] = 'bbb'
+        cache['c'] = 'ccc'
+        self.assertEqual(cache.nbytes, 9)
+
+        # Touch 'a' so that 'b' is the least recently used.
+        self.assertEqual(cache['a'], 'aaa')
+        cache['d'] = 'ddd'
+
+        self.assertEqual(sorted(cache), ['a', 'c', 'd'])
+        self.assertEqual(cache.nbytes, 9)
+        self.assertEqual(cache.evictions, 1)
+
+        with self.assertRaises(KeyError):
+            cache['b']
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_oversized_value(self):
+        cache = ByteLimitedLRU(maxbytes=4, sizeof=len)
+        cache['a'] = 'aa'
+        cache['b'] = 'bbbbbbbb'
+
+        # The value which was just inserted is kept even though it is over
+        # the budget on its own.
+        self.assertEqual(list(cache), ['b'])
+        self.assertEqual(cache.nbytes, 8)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_replace_and_delete(self):
+        cache = ByteLimitedLRU(maxbytes=10, sizeof=len)
+        cache['a'] = 'aaa'
+        cache['a'] = 'aaaaa'
+        self.assertEqual(cache.nbytes, 5)
+        self.assertEqual(len(cache), 1)
+
+        del cache['a']
+        self.assertEqual(cache.nbytes, 0)
+        self.assertNotIn('a', cache)
+
+    def test_maxsize(self):
+        cache = ByteLimitedLRU(sizeof=len, maxsize=2)
+        for key in 'abc':
+            cache[key] = key * 100
+
+        self.assertEqual(sorted(cache), ['b', 'c'])
+        self.assertEqual(cache.evictions, 1)
+
+        cache.reset_stats()
+        self.assertEqual(
+            (cache.hits, cache.misses, cache.evictions),
+            (0, 0, 0),
+        )
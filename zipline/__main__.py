@@ -312,7 +312,34 @@ def zipline_magic(line, cell=None):
     default=True,
     help='Print progress information to the terminal.'
 )
-def ingest(bundle, assets_version, show_progress):
+@click.option(
+    '-w',
+    '--workers',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of processes used to read the bundle\'s data, for'
+    ' bundles which support it.',
+)
+@click.option(
+    '--incremental',
+    is_flag=True,
+    default=False,
+    help='Only ingest the sessions after the most recent ingestion of the'
+    ' bundle, appending them to a copy of its data.',
+)
+@click.option(
+    '--share-files/--no-share-files',
+    default=False,
+    help='Hard-link the minute bar files which are identical to the files of'
+    ' other ingestions of the bundle.',
+)
+def ingest(bundle,
+           assets_version,
+           show_progress,
+           workers,
+           incremental,
+           share_files):
     """Ingest the data for the given bundle.
     """
     bundles_module.ingest(
@@ -321,6 +348,9 @@ def ingest(bundle, assets_version, show_progress):
         pd.Timestamp.utcnow(),
         assets_version,
         show_progress,
+        workers,
+        incremental,
+        share_files,
     )
 
 
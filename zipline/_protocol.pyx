@@ -29,6 +29,7 @@ from zipline.assets import (Asset,
                             PricingDataAssociable,
                             Future)
 from zipline.assets.continuous_futures import ContinuousFuture
+from zipline.utils.calendars import get_calendar
 from zipline.zipline_warnings import ZiplineDeprecationWarning
 
 
@@ -167,6 +168,9 @@ cdef class BarData:
     cdef bool _daily_mode
     cdef object _trading_calendar
     cdef object _is_restricted
+    cdef object _memo_dts
+    cdef dict _can_trade_memo
+    cdef dict _is_stale_memo
 
     cdef bool _adjust_minutes
 
@@ -188,6 +192,10 @@ cdef class BarData:
         self._trading_calendar = trading_calendar
         self._is_restricted = restrictions.is_restricted
 
+        self._memo_dts = None
+        self._can_trade_memo = {}
+        self._is_stale_memo = {}
+
     cdef _get_equity_price_view(self, asset):
         """
         Returns a DataPortalSidView for the given asset.  Used to support the
@@ -373,15 +381,16 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for asset in assets
-                        }, index=assets, name=fields)
+                    return pd.Series(
+                        data=self.data_portal.get_spot_value(
+                            assets,
+                            field,
+                            self._get_current_minute(),
+                            self.data_frequency
+                        ),
+                        index=assets,
+                        name=fields,
+                    )
                 else:
                     return pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
@@ -396,21 +405,25 @@ cdef class BarData:
 
             else:
                 # both assets and fields are iterable
-                data = {}
-
                 if not self._adjust_minutes:
-                    for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
-                        data[field] = series
+                    # Look up each field for all of the assets at once, and
+                    # build the frame from the columns in one go.
+                    assets = list(assets)
+                    current_minute = self._get_current_minute()
+                    return pd.DataFrame(
+                        {
+                            field: self.data_portal.get_spot_value(
+                                assets,
+                                field,
+                                current_minute,
+                                self.data_frequency
+                            )
+                            for field in fields
+                        },
+                        index=assets,
+                    )
                 else:
+                    data = {}
                     for field in fields:
                         series = pd.Series(data={
                             asset: self.data_portal.get_adjusted_value(
@@ -424,7 +437,7 @@ cdef class BarData:
                             }, index=assets, name=field)
                         data[field] = series
 
-                return pd.DataFrame(data)
+                    return pd.DataFrame(data)
 
     @check_parameters(('continuous_future',),
                       (ContinuousFuture,))
@@ -474,19 +487,125 @@ cdef class BarData:
             adjusted_dt = dt
 
         data_portal = self.data_portal
+        memo = self._get_memo(self._can_trade_memo, dt, adjusted_dt)
 
         if isinstance(assets, Asset):
-            return self._can_trade_for_asset(
-                assets, dt, adjusted_dt, data_portal
-            )
-        else:
-            tradeable = [
-                self._can_trade_for_asset(
-                    asset, dt, adjusted_dt, data_portal
+            try:
+                return memo[assets]
+            except KeyError:
+                tradeable = memo[assets] = self._can_trade_for_asset(
+                    assets, dt, adjusted_dt, data_portal
                 )
+                return tradeable
+        else:
+            assets = list(assets)
+            missing = [asset for asset in assets if asset not in memo]
+            if missing:
+                memo.update(zip(
+                    missing,
+                    self._can_trade_for_assets(
+                        missing, dt, adjusted_dt, data_portal
+                    ).tolist(),
+                ))
+
+            return pd.Series(
+                data=[memo[asset] for asset in assets],
+                index=assets,
+                dtype=bool,
+            )
+
+    cdef dict _get_memo(self, dict memo, dt, adjusted_dt):
+        """
+        Returns ``memo`` after clearing the memoized results of both
+        ``can_trade`` and ``is_stale`` if the simulation minute has changed
+        since they were computed.
+        """
+        cdef tuple memo_dts = (dt, adjusted_dt)
+
+        if self._memo_dts != memo_dts:
+            self._can_trade_memo.clear()
+            self._is_stale_memo.clear()
+            self._memo_dts = memo_dts
+
+        return memo
+
+    cdef _is_alive_for_session(self, list assets, session_label):
+        """
+        Vectorized version of ``Asset.is_alive_for_session``.
+        """
+        cdef object label = session_label.value
+
+        return np.array(
+            [
+                asset.start_date.value <= label <= asset.end_date.value
                 for asset in assets
-            ]
-            return pd.Series(data=tradeable, index=assets, dtype=bool)
+            ],
+            dtype=bool,
+        )
+
+    cdef _can_trade_for_assets(self, list assets, dt, adjusted_dt,
+                               data_portal):
+        """
+        Vectorized version of ``_can_trade_for_asset``, which looks up the
+        restrictions, the exchange status of each distinct exchange and the
+        last prices of the remaining assets once for all of ``assets``.
+        """
+        cdef object session_label
+        cdef object dt_to_use_for_exchange_check
+        cdef dict exchange_open
+
+        tradeable = ~np.asarray(
+            self._is_restricted(assets, adjusted_dt),
+            dtype=bool,
+        )
+
+        session_label = self._trading_calendar.minute_to_session_label(dt)
+
+        tradeable &= self._is_alive_for_session(assets, session_label)
+        tradeable &= np.array(
+            [
+                not (asset.auto_close_date and
+                     session_label > asset.auto_close_date)
+                for asset in assets
+            ],
+            dtype=bool,
+        )
+
+        if not self._daily_mode:
+            # Find the next market minute for this calendar, and check if
+            # each exchange is open at that minute.
+            if self._trading_calendar.is_open_on_minute(dt):
+                dt_to_use_for_exchange_check = dt
+            else:
+                dt_to_use_for_exchange_check = \
+                    self._trading_calendar.next_open(dt)
+
+            exchange_open = {}
+            for asset in assets:
+                if asset.exchange not in exchange_open:
+                    exchange_open[asset.exchange] = get_calendar(
+                        asset.exchange,
+                    ).is_open_on_minute(dt_to_use_for_exchange_check)
+
+            tradeable &= np.array(
+                [exchange_open[asset.exchange] for asset in assets],
+                dtype=bool,
+            )
+
+        # is there a last price?
+        candidates = np.flatnonzero(tradeable)
+        if len(candidates):
+            prices = data_portal.get_spot_value(
+                [assets[i] for i in candidates],
+                "price",
+                adjusted_dt,
+                self.data_frequency,
+            )
+            tradeable[candidates] = ~np.isnan(
+                np.array(prices, dtype=np.float64)
+            )
+
+        return tradeable
 
     cdef bool _can_trade_for_asset(self, asset, dt, adjusted_dt, data_portal):
         cdef object session_label
@@ -550,18 +669,80 @@ cdef class BarData:
             adjusted_dt = dt
 
         data_portal = self.data_portal
+        memo = self._get_memo(self._is_stale_memo, dt, adjusted_dt)
 
         if isinstance(assets, Asset):
-            return self._is_stale_for_asset(
-                assets, dt, adjusted_dt, data_portal
-            )
-        else:
-            return pd.Series(data={
-                asset: self._is_stale_for_asset(
-                    asset, dt, adjusted_dt, data_portal
+            try:
+                return memo[assets]
+            except KeyError:
+                stale = memo[assets] = self._is_stale_for_asset(
+                    assets, dt, adjusted_dt, data_portal
                 )
-                for asset in assets
-            })
+                return stale
+        else:
+            assets = list(assets)
+            missing = [asset for asset in assets if asset not in memo]
+            if missing:
+                memo.update(zip(
+                    missing,
+                    self._is_stale_for_assets(
+                        missing, dt, adjusted_dt, data_portal
+                    ).tolist(),
+                ))
+
+            return pd.Series(
+                data=[memo[asset] for asset in assets],
+                index=assets,
+                dtype=bool,
+            )
+
+    cdef _is_stale_for_assets(self, list assets, dt, adjusted_dt,
+                              data_portal):
+        """
+        Vectorized version of ``_is_stale_for_asset``, which looks up the
+        volumes of the live assets, and the last traded dts of those without
+        a trade, once for all of ``assets``.
+        """
+        # As documented in ``is_stale``, whether an asset is alive is checked
+        # for the date of the current simulation time, even outside of market
+        # hours, rather than for the session the calendar maps it to. This
+        # must agree with ``_is_stale_for_asset``, since both fill the same
+        # memo.
+        session_label = normalize_date(dt)
+
+        stale = np.zeros(len(assets), dtype=bool)
+
+        alive = np.flatnonzero(
+            self._is_alive_for_session(assets, session_label)
+        )
+        if not len(alive):
+            return stale
+
+        volumes = np.array(
+            data_portal.get_spot_value(
+                [assets[i] for i in alive],
+                "volume",
+                adjusted_dt,
+                self.data_frequency,
+            ),
+            dtype=np.float64,
+        )
+
+        # An asset without a current trade is stale if it has ever traded.
+        untraded = alive[~(volumes > 0)]
+        if len(untraded):
+            last_traded_dts = data_portal.get_spot_value(
+                [assets[i] for i in untraded],
+                "last_traded",
+                adjusted_dt,
+                self.data_frequency,
+            )
+            stale[untraded] = [
+                not (last_traded_dt is pd.NaT)
+                for last_traded_dt in last_traded_dts
+            ]
+
+        return stale
 
     cdef bool _is_stale_for_asset(self, asset, dt, adjusted_dt, data_portal):
         session_label = normalize_date(dt) # FIXME
@@ -734,6 +915,84 @@ cdef class BarData:
                 # minor axis: assets
                 return pd.Panel(df_dict)
 
+    @check_parameters(('assets', 'field', 'bar_count', 'frequency'),
+                      ((Asset, ContinuousFuture) + string_types, string_types,
+                       int,
+                       string_types))
+    def history_array(self, assets, field, bar_count, frequency):
+        """
+        Returns the values of a window of data for the given assets and
+        field, as a numpy array.
+
+        This is the data returned by `history` for a single field, without
+        the DataFrame around it, for algorithms which only use the values.
+        The dts of the window are returned by `history_index`.
+
+        Parameters
+        ----------
+        assets: Asset or iterable of Asset
+
+        field: string.  Valid values are "open", "high", "low", "close",
+            "volume", "price", and "sid".
+
+        bar_count: integer number of bars of trade data
+
+        frequency: string. "1m" for minutely data or "1d" for daily date
+
+        Returns
+        -------
+        history : np.ndarray
+            A read-only array of shape (bar_count, len(assets)), with one
+            column per asset, even if a single asset is passed in.
+        """
+        if isinstance(assets, PricingDataAssociable):
+            asset_list = [assets]
+        else:
+            asset_list = assets
+
+        values = self.data_portal.get_history_window_array(
+            asset_list,
+            self._get_current_minute(),
+            bar_count,
+            frequency,
+            field,
+            self.data_frequency,
+        )
+
+        if self._adjust_minutes:
+            adjs = self.data_portal.get_adjustments(
+                asset_list,
+                field,
+                self._get_current_minute(),
+                self.simulation_dt_func()
+            )
+
+            values = values * adjs
+            values.setflags(write=False)
+
+        return values
+
+    def history_index(self, bar_count, frequency):
+        """
+        Returns the dts of the windows returned by `history_array`.
+
+        Parameters
+        ----------
+        bar_count: integer number of bars of trade data
+
+        frequency: string. "1m" for minutely data or "1d" for daily date
+
+        Returns
+        -------
+        index : pd.DatetimeIndex
+            The dts of the window, which are cached between calls.
+        """
+        return self.data_portal.get_history_window_index(
+            self._get_current_minute(),
+            bar_count,
+            frequency,
+        )
+
     property current_dt:
         def __get__(self):
             return self.simulation_dt_func()
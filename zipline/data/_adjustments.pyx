@@ -203,6 +203,84 @@ cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
         assets,
     )
 
+    return _adjustments_from_rows(
+        splits,
+        mergers,
+        dividends,
+        columns,
+        dates,
+        assets,
+        start_date,
+    )
+
+
+cpdef load_adjustments_from_index(object index,  # AdjustmentIndex
+                                  list columns,
+                                  DatetimeIndex_t dates,
+                                  Int64Index_t assets):
+    """
+    Load a dictionary of Adjustment objects from an AdjustmentIndex.
+
+    Parameters
+    ----------
+    index : zipline.data.adjustment_index.AdjustmentIndex
+        The index of an adjustments db written by SQLiteAdjustmentWriter.
+    columns : list[str]
+        List of column names for which adjustments are needed.
+    dates : pd.DatetimeIndex
+        Dates for which adjustments are needed
+    assets : pd.Int64Index
+        Assets for which adjustments are needed.
+
+    Returns
+    -------
+    adjustments : list[dict[int -> Adjustment]]
+        A list of mappings from index to adjustment objects to apply at that
+        index.
+
+    See Also
+    --------
+    load_adjustments_from_sqlite
+    """
+    cdef int start_date = timedelta_to_integral_seconds(dates[0] - EPOCH)
+    cdef int end_date = timedelta_to_integral_seconds(dates[-1] - EPOCH)
+
+    cdef list rows = []
+    for tablename in ('splits', 'mergers', 'dividends'):
+        sids, ratios, effective_dates = index.get_adjustments(
+            tablename,
+            assets,
+            start_date,
+            end_date,
+        )
+        rows.append(list(zip(
+            sids.tolist(),
+            ratios.tolist(),
+            effective_dates.tolist(),
+        )))
+
+    return _adjustments_from_rows(
+        rows[0],
+        rows[1],
+        rows[2],
+        columns,
+        dates,
+        assets,
+        start_date,
+    )
+
+
+cdef _adjustments_from_rows(list splits,
+                            list mergers,
+                            list dividends,
+                            list columns,
+                            DatetimeIndex_t dates,
+                            Int64Index_t assets,
+                            int start_date):
+    """
+    Build the Adjustment objects of the (sid, ratio, effective_date) rows of
+    the splits, mergers and dividends tables.
+    """
     cdef list results = [{} for column in columns]
     cdef dict asset_ixs = {}  # Cache sid lookups here.
     cdef dict date_ixs = {}
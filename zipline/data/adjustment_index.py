@@ -0,0 +1,317 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from hashlib import sha1
+import json
+import os
+import shutil
+import struct
+
+import numpy as np
+
+from zipline.utils.paths import ensure_directory
+
+# The tables of ratio adjustments stored in an AdjustmentIndex.
+ADJUSTMENT_INDEX_TABLES = ('splits', 'mergers', 'dividends')
+ADJUSTMENT_INDEX_VERSION = 2
+ADJUSTMENT_INDEX_METADATA_FILENAME = 'metadata.json'
+
+_COLUMNS = (
+    ('sid', np.int64),
+    ('effective_date', np.int64),
+    ('ratio', np.float64),
+)
+
+
+def adjustment_index_path(db_path):
+    """
+    The path of the AdjustmentIndex of the adjustments db at ``db_path``.
+    """
+    return db_path + '.index'
+
+
+def sqlite_db_path(conn):
+    """
+    The path of the file of the main database of ``conn``, or None if the
+    database is not backed by a file.
+    """
+    for _, name, path in conn.execute('PRAGMA database_list').fetchall():
+        if name == 'main':
+            return path or None
+    return None
+
+
+def sqlite_change_counter(db_path):
+    """
+    The file change counter in the header of the SQLite database at
+    ``db_path``, which SQLite increments whenever it commits a change to the
+    database.
+
+    Returns None if the counter can not be relied upon, because the database
+    is in WAL mode, where commits do not update the header.
+    """
+    try:
+        with open(db_path, 'rb') as f:
+            header = f.read(100)
+    except (IOError, OSError):
+        return None
+    # Bytes 18 and 19 are the write and read format versions, which are 2 in
+    # WAL mode.
+    if len(header) < 100 or header[18:20] != b'\x01\x01':
+        return None
+    return struct.unpack('>I', header[24:28])[0]
+
+
+class AdjustmentIndex(object):
+    """
+    The splits, mergers and dividends of an adjustments db as arrays sorted
+    by sid and effective date, so that the adjustments of a set of sids in a
+    range of dates can be found with binary searches instead of SQL queries.
+
+    Parameters
+    ----------
+    tables : dict[str -> (np.ndarray[int64], np.ndarray[int64], np.ndarray)]
+        A map from each of ``ADJUSTMENT_INDEX_TABLES`` to its sids, its
+        effective dates as seconds since the epoch, and its ratios.
+    change_counter : int, optional
+        The file change counter of the adjustments db the index was built
+        from. See :func:`sqlite_change_counter`.
+
+    See Also
+    --------
+    zipline.data.us_equity_pricing.SQLiteAdjustmentWriter
+    """
+    def __init__(self, tables, change_counter=None):
+        self._tables = tables
+        self._change_counter = change_counter
+
+    @classmethod
+    def from_db(cls, conn):
+        """
+        Build the index of the adjustments db on ``conn``.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            A connection to a db written by SQLiteAdjustmentWriter.
+
+        Returns
+        -------
+        index : AdjustmentIndex
+        """
+        tables = {}
+        for tablename in ADJUSTMENT_INDEX_TABLES:
+            rows = conn.execute(
+                'SELECT sid, effective_date, ratio FROM "{}"'.format(
+                    tablename,
+                ),
+            ).fetchall()
+            sids, effective_dates, ratios = (
+                np.array(column, dtype=dtype)
+                for column, (_, dtype) in zip(
+                    zip(*rows) if rows else ((), (), ()),
+                    _COLUMNS,
+                )
+            )
+            order = np.lexsort((effective_dates, sids))
+            tables[tablename] = (
+                sids[order],
+                effective_dates[order],
+                ratios[order],
+            )
+
+        db_path = sqlite_db_path(conn)
+        return cls(
+            tables,
+            None if db_path is None else sqlite_change_counter(db_path),
+        )
+
+    def checksums(self):
+        """
+        Compute a checksum of the contents of each table of the index.
+
+        Returns
+        -------
+        checksums : dict[str -> str]
+            A map from each of ``ADJUSTMENT_INDEX_TABLES`` to the hex digest
+            of its sids, effective dates and ratios.
+        """
+        checksums = {}
+        for tablename, arrays in self._tables.items():
+            hasher = sha1()
+            for array in arrays:
+                hasher.update(np.ascontiguousarray(array).tobytes())
+            checksums[tablename] = hasher.hexdigest()
+        return checksums
+
+    @classmethod
+    def read(cls, path, conn=None):
+        """
+        Read the index written to ``path``, memory-mapping its arrays.
+
+        Parameters
+        ----------
+        path : str
+            The directory the index was written to.
+        conn : sqlite3.Connection, optional
+            A connection to the adjustments db the index was built from. If
+            given, the index is only used if it has the same adjustments as
+            the db.
+
+        Returns
+        -------
+        index : AdjustmentIndex or None
+            The index, or None if there is no up to date index at ``path``.
+
+        Notes
+        -----
+        When the file change counter of the db is the one the index was
+        built with, the db has not changed since and the index is read
+        without querying the db. Otherwise, such as when the db is in WAL
+        mode, the adjustments are read from the db and compared with the
+        checksums of the index. If they match, the index built from the db
+        is returned instead of reading the arrays at ``path``.
+        """
+        try:
+            with open(
+                os.path.join(path, ADJUSTMENT_INDEX_METADATA_FILENAME),
+            ) as f:
+                metadata = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if metadata.get('version') != ADJUSTMENT_INDEX_VERSION:
+            return None
+
+        if conn is not None:
+            db_path = sqlite_db_path(conn)
+            change_counter = metadata['change_counter']
+            if (change_counter is None or
+                    db_path is None or
+                    sqlite_change_counter(db_path) != change_counter):
+                # The db may have changed since the index was written, even
+                # if it has as many adjustments as before, so compare their
+                # contents.
+                index = cls.from_db(conn)
+                if index.checksums() != metadata['checksums']:
+                    return None
+                return index
+
+        counts = metadata['counts']
+
+        tables = {}
+        for tablename in ADJUSTMENT_INDEX_TABLES:
+            # Empty files can not be memory-mapped.
+            mmap_mode = 'r' if counts[tablename] else None
+            tables[tablename] = tuple(
+                np.load(
+                    os.path.join(path, '{}.{}.npy'.format(tablename, column)),
+                    mmap_mode=mmap_mode,
+                )
+                for column, _ in _COLUMNS
+            )
+        return cls(tables)
+
+    def write(self, path):
+        """
+        Write the index to the directory ``path``, replacing any index
+        already there.
+
+        Parameters
+        ----------
+        path : str
+            The directory to write the index to.
+        """
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        ensure_directory(path)
+
+        counts = {}
+        for tablename, arrays in self._tables.items():
+            for (column, _), array in zip(_COLUMNS, arrays):
+                np.save(
+                    os.path.join(path, '{}.{}.npy'.format(tablename, column)),
+                    array,
+                )
+            counts[tablename] = len(arrays[0])
+
+        # The metadata is written last so that an interrupted write leaves no
+        # index behind.
+        with open(
+            os.path.join(path, ADJUSTMENT_INDEX_METADATA_FILENAME), 'w',
+        ) as f:
+            json.dump(
+                {
+                    'version': ADJUSTMENT_INDEX_VERSION,
+                    'counts': counts,
+                    'checksums': self.checksums(),
+                    'change_counter': self._change_counter,
+                },
+                f,
+            )
+
+    def _locs_in_range(self, sids, effective_dates, assets, start_date,
+                       end_date):
+        """
+        The locations of the rows of ``assets`` whose effective dates are in
+        ``[start_date, end_date]``, in order of sid and effective date.
+        """
+        assets = np.unique(np.asarray(assets, dtype=np.int64))
+        firsts = sids.searchsorted(assets, side='left')
+        lasts = sids.searchsorted(assets, side='right')
+
+        locs = []
+        for first, last in zip(firsts, lasts):
+            if first == last:
+                continue
+            dates = effective_dates[first:last]
+            locs.append(np.arange(
+                first + dates.searchsorted(start_date, side='left'),
+                first + dates.searchsorted(end_date, side='right'),
+            ))
+        if not locs:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(locs)
+
+    def get_adjustments(self, tablename, assets, start_date, end_date):
+        """
+        Get the adjustments of ``assets`` in ``tablename`` which are
+        effective from ``start_date`` to ``end_date``, inclusive.
+
+        Parameters
+        ----------
+        tablename : {'splits', 'mergers', 'dividends'}
+            The table to read.
+        assets : iterable[int]
+            The sids whose adjustments are needed.
+        start_date : int
+            The first effective date, in seconds since the epoch.
+        end_date : int
+            The last effective date, in seconds since the epoch.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+        ratios : np.ndarray[float64]
+        effective_dates : np.ndarray[int64]
+            The adjustments, sorted by sid and effective date.
+        """
+        sids, effective_dates, ratios = self._tables[tablename]
+        locs = self._locs_in_range(
+            sids,
+            effective_dates,
+            assets,
+            start_date,
+            end_date,
+        )
+        return sids[locs], ratios[locs], effective_dates[locs]
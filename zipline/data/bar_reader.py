@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+import numpy as np
 from six import with_metaclass
 
 
@@ -122,6 +124,77 @@ class BarReader(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of ``field`` at ``dt`` for many assets at once.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLVC name for the desired data points.
+
+        Returns
+        -------
+        values : np.ndarray
+            An array with an entry per sid, with a dtype of float64 for OHLC
+            and an integer dtype for 'volume'. Sids without data at ``dt``
+            are filled with nan, or 0 for 'volume'.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given dt is not a valid market minute (in minute mode) or
+            session (in daily mode) according to this reader's
+            tradingcalendar, as with ``get_value``.
+
+        Notes
+        -----
+        The default implementation calls ``get_value`` for each sid, and fills
+        the values of sids for which it raises ``NoDataBeforeDate`` or
+        ``NoDataAfterDate``. Readers which can look up many sids at once
+        should override it.
+        """
+        values = []
+        for sid in sids:
+            try:
+                values.append(self.get_value(sid, dt, field))
+            except (NoDataBeforeDate, NoDataAfterDate):
+                values.append(0 if field == 'volume' else np.nan)
+
+        if field == 'volume':
+            return np.array(values, dtype=np.int64)
+        return np.array(values, dtype=np.float64)
+
+    def get_last_traded_dts(self, assets, dt):
+        """
+        Get the latest minute or session on or before ``dt`` in which each
+        of ``assets`` traded.
+
+        Parameters
+        ----------
+        assets : iterable[zipline.asset.Asset]
+            The assets for which to get the last traded dts.
+        dt : pd.Timestamp
+            The dt at which to start searching for the last trades.
+
+        Returns
+        -------
+        last_traded : list[pd.Timestamp]
+            The last traded dt of each asset, or ``pd.NaT`` for assets with
+            no trades on or before ``dt``.
+
+        Notes
+        -----
+        The default implementation calls ``get_last_traded_dt`` for each
+        asset. Readers which can search many assets at once should override
+        it.
+        """
+        return [self.get_last_traded_dt(asset, dt) for asset in assets]
+
     @abstractmethod
     def get_last_traded_dt(self, asset, dt):
         """
@@ -8,20 +8,24 @@ from .core import (
     clean,
     from_bundle_ingest_dirname,
     ingest,
+    ingest_map,
     ingestions_for_bundle,
     load,
     register,
     to_bundle_ingest_dirname,
     unregister,
 )
+from .in_memory import InMemoryBundle
 
 
 __all__ = [
+    'InMemoryBundle',
     'UnknownBundle',
     'bundles',
     'clean',
     'from_bundle_ingest_dirname',
     'ingest',
+    'ingest_map',
     'ingestions_for_bundle',
     'load',
     'register',
@@ -1,5 +1,6 @@
-from collections import namedtuple
+from collections import deque, namedtuple
 import errno
+from multiprocessing import Pool
 import os
 import shutil
 import warnings
@@ -19,6 +20,23 @@ from ..minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
 )
+from ..mmap_minute_bars import (
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
+)
+from ..parquet_daily_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+)
+from ..resample import MinuteResampleSessionBarReader
+from .incremental import (
+    IncrementalAdjustmentWriter,
+    IncrementalAssetDBWriter,
+    IncrementalDailyBarWriter,
+    IncrementalMinuteBarWriter,
+    last_ingested_session,
+)
+from .shared_files import collect_shared_files, share_sid_files
 from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.assets.asset_db_migrations import downgrade
 from zipline.utils.cache import (
@@ -26,7 +44,7 @@ from zipline.utils.cache import (
     working_dir,
     working_file,
 )
-from zipline.utils.compat import mappingproxy
+from zipline.utils.compat import mappingproxy, signature
 from zipline.utils.input_validation import ensure_timestamp, optionally
 import zipline.utils.paths as pth
 from zipline.utils.preprocess import preprocess
@@ -47,6 +65,13 @@ def minute_equity_path(bundle_name, timestr, environ=None):
     )
 
 
+def mmap_minute_equity_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        mmap_minute_equity_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
 def daily_equity_path(bundle_name, timestr, environ=None):
     return pth.data_path(
         daily_equity_relative(bundle_name, timestr, environ),
@@ -54,6 +79,20 @@ def daily_equity_path(bundle_name, timestr, environ=None):
     )
 
 
+def parquet_daily_equity_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        parquet_daily_equity_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
+def resampled_daily_equity_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        resampled_daily_equity_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
 def adjustment_db_path(bundle_name, timestr, environ=None):
     return pth.data_path(
         adjustment_db_relative(bundle_name, timestr, environ),
@@ -68,6 +107,13 @@ def cache_path(bundle_name, environ=None):
     )
 
 
+def shared_files_path(bundle_name, environ=None):
+    return pth.data_path(
+        shared_files_relative(bundle_name, environ),
+        environ=environ,
+    )
+
+
 def adjustment_db_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'adjustments.sqlite'
 
@@ -76,14 +122,30 @@ def cache_relative(bundle_name, timestr, environ=None):
     return bundle_name, '.cache'
 
 
+def shared_files_relative(bundle_name, environ=None):
+    return bundle_name, '.shared'
+
+
 def daily_equity_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'daily_equities.bcolz'
 
 
+def parquet_daily_equity_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'daily_equities.parquet'
+
+
+def resampled_daily_equity_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'daily_equities_resampled.bcolz'
+
+
 def minute_equity_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'minute_equities.bcolz'
 
 
+def mmap_minute_equity_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'minute_equities.mmap'
+
+
 def asset_db_relative(bundle_name, timestr, environ=None, db_version=None):
     db_version = ASSET_DB_VERSION if db_version is None else db_version
 
@@ -132,6 +194,88 @@ def ingestions_for_bundle(bundle, environ=None):
     )
 
 
+def _previous_ingestion(bundle, timestamp, environ=None):
+    """The timestr of the most recent ingestion of ``bundle`` before
+    ``timestamp`` with bcolz daily bars, or None if there is none.
+    """
+    try:
+        ingestions = ingestions_for_bundle(bundle, environ=environ)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+        return None
+
+    for ingestion in ingestions:
+        if ingestion >= timestamp:
+            continue
+        timestr = to_bundle_ingest_dirname(ingestion)
+        if os.path.exists(daily_equity_path(bundle, timestr, environ)):
+            return timestr
+    return None
+
+
+def _accepts_workers(f):
+    """Whether the ingest function ``f`` can be passed ``workers``.
+    """
+    try:
+        parameters = signature(f).parameters
+    except (TypeError, ValueError):
+        # No signature can be found, for example for some builtins.
+        return False
+    return 'workers' in parameters or any(
+        parameter.kind == parameter.VAR_KEYWORD
+        for parameter in parameters.values()
+    )
+
+
+def ingest_map(f, iterable, workers=1):
+    """Lazily apply ``f`` to each element of ``iterable`` with a pool of
+    processes, yielding the results in the order of ``iterable``.
+
+    This lets an ingest function parse its source files in parallel while
+    still writing them to the bar writers one sid at a time, in sid order.
+
+    Parameters
+    ----------
+    f : callable
+        The function to apply. When ``workers`` is greater than 1, ``f``, the
+        elements of ``iterable`` and the results must be picklable; ``f``
+        should be a module scope function.
+    iterable : iterable
+        The elements to apply ``f`` to.
+    workers : int, optional
+        The number of processes to use. With 1 worker, ``f`` is called in
+        this process.
+
+    Yields
+    ------
+    result : any
+        ``f(element)`` for each element of ``iterable``.
+
+    Notes
+    -----
+    At most ``2 * workers`` elements are submitted ahead of the element being
+    yielded, so the results of a slow consumer do not pile up in memory.
+    """
+    if workers == 1:
+        for element in iterable:
+            yield f(element)
+        return
+
+    pool = Pool(workers)
+    try:
+        pending = deque()
+        for element in iterable:
+            pending.append(pool.apply_async(f, (element,)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 RegisteredBundle = namedtuple(
     'RegisteredBundle',
     ['calendar_name',
@@ -139,9 +283,30 @@ RegisteredBundle = namedtuple(
      'end_session',
      'minutes_per_day',
      'ingest',
-     'create_writers']
+     'create_writers',
+     'minute_bar_format',
+     'daily_bar_format']
 )
 
+# Maps the ``minute_bar_format`` of a registered bundle to the writer class
+# used at ingest time and the function giving its path relative to the data
+# root.
+MINUTE_BAR_FORMATS = {
+    'bcolz': (BcolzMinuteBarWriter, minute_equity_relative),
+    'mmap': (MmapMinuteBarWriter, mmap_minute_equity_relative),
+}
+
+# Maps the ``daily_bar_format`` of a registered bundle to the writer and
+# reader classes and the function giving its path relative to the data root.
+DAILY_BAR_FORMATS = {
+    'bcolz': (BcolzDailyBarWriter, BcolzDailyBarReader, daily_equity_relative),
+    'parquet': (
+        ParquetDailyBarWriter,
+        ParquetDailyBarReader,
+        parquet_daily_equity_relative,
+    ),
+}
+
 BundleData = namedtuple(
     'BundleData',
     'asset_finder equity_minute_bar_reader equity_daily_bar_reader '
@@ -228,7 +393,9 @@ def _make_bundle_core():
                  start_session=None,
                  end_session=None,
                  minutes_per_day=390,
-                 create_writers=True):
+                 create_writers=True,
+                 minute_bar_format='bcolz',
+                 daily_bar_format='bcolz'):
         """Register a data bundle ingest function.
 
         Parameters
@@ -242,10 +409,12 @@ def _make_bundle_core():
                   The environment this is being run with.
               asset_db_writer : AssetDBWriter
                   The asset db writer to write into.
-              minute_bar_writer : BcolzMinuteBarWriter
-                  The minute bar writer to write into.
-              daily_bar_writer : BcolzDailyBarWriter
-                  The daily bar writer to write into.
+              minute_bar_writer : BcolzMinuteBarWriter or MmapMinuteBarWriter
+                  The minute bar writer to write into, depending on
+                  ``minute_bar_format``.
+              daily_bar_writer : BcolzDailyBarWriter or ParquetDailyBarWriter
+                  The daily bar writer to write into, depending on
+                  ``daily_bar_format``.
               adjustment_writer : SQLiteAdjustmentWriter
                   The adjustment db writer to write into.
               calendar : zipline.utils.calendars.TradingCalendar
@@ -261,6 +430,10 @@ def _make_bundle_core():
                   successful load.
               show_progress : bool
                   Show the progress for the current load where possible.
+
+            If ``f`` accepts a ``workers`` keyword argument, it is also passed
+            the number of processes the ingest may use, for example with
+            :func:`~zipline.data.bundles.core.ingest_map`.
         calendar_name : str, optional
             The name of a calendar used to align bundle data.
             Default is 'NYSE'.
@@ -278,6 +451,16 @@ def _make_bundle_core():
             Should the ingest machinery create the writers for the ingest
             function. This can be disabled as an optimization for cases where
             they are not needed, like the ``quantopian-quandl`` bundle.
+        minute_bar_format : {'bcolz', 'mmap'}, optional
+            The on-disk format for minute bars. 'bcolz' writes compressed
+            bcolz ctables. 'mmap' writes flat, uncompressed files which are
+            memory-mapped when read, trading disk space for reads that do no
+            decompression. Default is 'bcolz'.
+        daily_bar_format : {'bcolz', 'parquet'}, optional
+            The on-disk format for daily bars. 'bcolz' writes a single bcolz
+            ctable. 'parquet' writes Parquet files partitioned by year and
+            sorted by sid, so reads of a few sids or a short range only read
+            the row groups they need; it requires pyarrow. Default is 'bcolz'.
 
         Notes
         -----
@@ -293,6 +476,22 @@ def _make_bundle_core():
         --------
         zipline.data.bundles.bundles
         """
+        if minute_bar_format not in MINUTE_BAR_FORMATS:
+            raise ValueError(
+                'Unknown minute_bar_format %r, must be one of %s' % (
+                    minute_bar_format,
+                    sorted(MINUTE_BAR_FORMATS),
+                ),
+            )
+
+        if daily_bar_format not in DAILY_BAR_FORMATS:
+            raise ValueError(
+                'Unknown daily_bar_format %r, must be one of %s' % (
+                    daily_bar_format,
+                    sorted(DAILY_BAR_FORMATS),
+                ),
+            )
+
         if name in bundles:
             warnings.warn(
                 'Overwriting bundle with name %r' % name,
@@ -310,6 +509,8 @@ def _make_bundle_core():
             minutes_per_day=minutes_per_day,
             ingest=f,
             create_writers=create_writers,
+            minute_bar_format=minute_bar_format,
+            daily_bar_format=daily_bar_format,
         )
         return f
 
@@ -339,7 +540,10 @@ def _make_bundle_core():
                environ=os.environ,
                timestamp=None,
                assets_versions=(),
-               show_progress=False):
+               show_progress=False,
+               workers=1,
+               incremental=False,
+               share_files=False):
         """Ingest data for a given bundle.
 
         Parameters
@@ -355,12 +559,45 @@ def _make_bundle_core():
             Versions of the assets db to which to downgrade.
         show_progress : bool, optional
             Tell the ingest function to display the progress where possible.
+        workers : int, optional
+            The number of processes the ingest function may use to read its
+            data. This is only passed to ingest functions which accept a
+            ``workers`` argument; others ingest with a single process.
+        incremental : bool, optional
+            Start from the most recent ingestion of the bundle and only
+            ingest the sessions after its last session. The ingest function
+            is passed the first new session as its ``start_session``; bars
+            and adjustments it writes before that session are dropped. This
+            requires a bundle which creates writers and uses the ``'bcolz'``
+            daily and minute bar formats. When the bundle has not been
+            ingested before, all of its sessions are ingested.
+        share_files : bool, optional
+            Hard-link the files of the bcolz minute bars which are identical
+            to files of other ingestions of the bundle, so that they are only
+            stored once. The linked files are read-only, and are copied
+            before ``BcolzMinuteBarWriter`` writes to them. ``clean`` only
+            removes a shared file once no ingestion uses it. This is off by
+            default.
         """
         try:
             bundle = bundles[name]
         except KeyError:
             raise UnknownBundle(name)
 
+        if workers < 1:
+            raise ValueError('workers must be at least 1, got %r' % workers)
+
+        ingest_kwargs = {}
+        if _accepts_workers(bundle.ingest):
+            ingest_kwargs['workers'] = workers
+        elif workers > 1:
+            warnings.warn(
+                'The ingest function of bundle {name!r} does not accept a'
+                ' workers argument; ingesting with a single process.'.format(
+                    name=name,
+                ),
+            )
+
         calendar = get_calendar(bundle.calendar_name)
 
         start_session = bundle.start_session
@@ -377,6 +614,40 @@ def _make_bundle_core():
         timestamp = timestamp.tz_convert('utc').tz_localize(None)
 
         timestr = to_bundle_ingest_dirname(timestamp)
+
+        previous_timestr = None
+        if incremental:
+            if not bundle.create_writers or (
+                    bundle.daily_bar_format != 'bcolz' or
+                    bundle.minute_bar_format != 'bcolz'):
+                raise ValueError(
+                    'Incremental ingests require a bundle which creates'
+                    ' writers and uses the bcolz daily and minute bar'
+                    ' formats.',
+                )
+            previous_timestr = _previous_ingestion(name, timestamp, environ)
+
+        if previous_timestr is not None:
+            previous_daily_bar_reader = BcolzDailyBarReader(
+                daily_equity_path(name, previous_timestr, environ=environ),
+            )
+            previous_minute_bar_writer = BcolzMinuteBarWriter.open(
+                minute_equity_path(name, previous_timestr, environ=environ),
+            )
+            last_session = last_ingested_session(
+                previous_daily_bar_reader,
+                previous_minute_bar_writer,
+            )
+            if not pd.isnull(last_session):
+                if last_session >= end_session:
+                    warnings.warn(
+                        'The most recent ingestion of bundle {name!r} already'
+                        ' ends on {last:%Y-%m-%d}; there are no new sessions'
+                        ' to ingest.'.format(name=name, last=last_session),
+                    )
+                    return
+                start_session = calendar.next_session_label(last_session)
+
         cachepath = cache_path(name, environ=environ)
         pth.ensure_directory(pth.data_path([name, timestr], environ=environ))
         pth.ensure_directory(cachepath)
@@ -388,46 +659,106 @@ def _make_bundle_core():
                 wd = stack.enter_context(working_dir(
                     pth.data_path([], environ=environ))
                 )
+                (daily_bar_writer_type,
+                 daily_bar_reader_type,
+                 daily_relative) = DAILY_BAR_FORMATS[bundle.daily_bar_format]
                 daily_bars_path = wd.ensure_dir(
-                    *daily_equity_relative(
+                    *daily_relative(
                         name, timestr, environ=environ,
                     )
                 )
-                daily_bar_writer = BcolzDailyBarWriter(
-                    daily_bars_path,
-                    calendar,
-                    start_session,
-                    end_session,
-                )
-                # Do an empty write to ensure that the daily ctables exist
+                if previous_timestr is None:
+                    daily_bar_writer = daily_bar_writer_type(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                    )
+                else:
+                    # The daily bars are rewritten from the first session of
+                    # the previous ingestion.
+                    daily_bar_writer = IncrementalDailyBarWriter(
+                        daily_bar_writer_type(
+                            daily_bars_path,
+                            calendar,
+                            previous_daily_bar_reader.sessions[0],
+                            end_session,
+                        ),
+                        previous_daily_bar_reader,
+                    )
+                # Do an empty write to ensure that the daily bars exist
                 # when we create the SQLiteAdjustmentWriter below. The
-                # SQLiteAdjustmentWriter needs to open the daily ctables so
+                # SQLiteAdjustmentWriter needs to open the daily bars so
                 # that it can compute the adjustment ratios for the dividends.
 
                 daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(
-                        name, timestr, environ=environ)
-                    ),
-                    calendar,
-                    start_session,
-                    end_session,
-                    minutes_per_day=bundle.minutes_per_day,
-                )
+                minute_bar_writer_type, minute_relative = MINUTE_BAR_FORMATS[
+                    bundle.minute_bar_format
+                ]
                 assets_db_path = wd.getpath(*asset_db_relative(
                     name, timestr, environ=environ,
                 ))
                 asset_db_writer = AssetDBWriter(assets_db_path)
+                adjustments_path = wd.getpath(*adjustment_db_relative(
+                    name, timestr, environ=environ,
+                ))
 
-                adjustment_db_writer = stack.enter_context(
-                    SQLiteAdjustmentWriter(
-                        wd.getpath(*adjustment_db_relative(
-                            name, timestr, environ=environ)),
-                        BcolzDailyBarReader(daily_bars_path),
-                        calendar.all_sessions,
-                        overwrite=True,
+                if previous_timestr is None:
+                    minute_bar_writer = minute_bar_writer_type(
+                        wd.ensure_dir(*minute_relative(
+                            name, timestr, environ=environ)
+                        ),
+                        calendar,
+                        start_session,
+                        end_session,
+                        minutes_per_day=bundle.minutes_per_day,
+                    )
+                    adjustment_db_writer = stack.enter_context(
+                        SQLiteAdjustmentWriter(
+                            adjustments_path,
+                            daily_bar_reader_type(daily_bars_path),
+                            calendar.all_sessions,
+                            overwrite=True,
+                        )
+                    )
+                else:
+                    # The minute bars and adjustments are appended to copies
+                    # of the previous ingestion's. They are copied rather
+                    # than linked because appending modifies them in place.
+                    minute_bars_path = wd.getpath(*minute_relative(
+                        name, timestr, environ=environ,
+                    ))
+                    shutil.copytree(
+                        minute_equity_path(
+                            name, previous_timestr, environ=environ,
+                        ),
+                        minute_bars_path,
+                    )
+                    minute_bar_writer = IncrementalMinuteBarWriter(
+                        minute_bar_writer_type.open(
+                            minute_bars_path,
+                            end_session,
+                        ),
+                        start_session,
+                    )
+                    shutil.copy2(
+                        adjustment_db_path(
+                            name, previous_timestr, environ=environ,
+                        ),
+                        adjustments_path,
+                    )
+                    adjustment_db_writer = IncrementalAdjustmentWriter(
+                        stack.enter_context(SQLiteAdjustmentWriter(
+                            adjustments_path,
+                            daily_bar_reader_type(daily_bars_path),
+                            calendar.all_sessions,
+                        )),
+                        start_session,
+                    )
+                    asset_db_writer = IncrementalAssetDBWriter(
+                        asset_db_writer,
+                        asset_db_path(name, previous_timestr, environ=environ),
                     )
-                )
             else:
                 daily_bar_writer = None
                 minute_bar_writer = None
@@ -449,6 +780,7 @@ def _make_bundle_core():
                 cache,
                 show_progress,
                 pth.data_path([name, timestr], environ=environ),
+                **ingest_kwargs
             )
 
             for version in sorted(set(assets_versions), reverse=True):
@@ -459,6 +791,16 @@ def _make_bundle_core():
                     shutil.copy2(assets_db_path, wf.path)
                     downgrade(wf.path, version)
 
+        # The files are linked once the working directory has been copied to
+        # the ingestion's directory, which doesn't preserve links.
+        if (share_files and
+                bundle.create_writers and
+                bundle.minute_bar_format == 'bcolz'):
+            share_sid_files(
+                minute_equity_path(name, timestr, environ=environ),
+                shared_files_path(name, environ=environ),
+            )
+
     def most_recent_data(bundle_name, timestamp, environ=None):
         """Get the path to the most recent data after ``date``for the
         given bundle.
@@ -519,16 +861,40 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+        mmap_minute_path = mmap_minute_equity_path(
+            name, timestr, environ=environ,
+        )
+        if os.path.exists(mmap_minute_path):
+            equity_minute_bar_reader = MmapMinuteBarReader(mmap_minute_path)
+        else:
+            equity_minute_bar_reader = BcolzMinuteBarReader(
+                minute_equity_path(name, timestr, environ=environ),
+            )
+        parquet_daily_path = parquet_daily_equity_path(
+            name, timestr, environ=environ,
+        )
+        if os.path.exists(parquet_daily_path):
+            equity_daily_bar_reader = ParquetDailyBarReader(parquet_daily_path)
+        else:
+            equity_daily_bar_reader = BcolzDailyBarReader(
+                daily_equity_path(name, timestr, environ=environ),
+            )
+        if pd.isnull(equity_daily_bar_reader.first_trading_day):
+            # The bundle only has minute data. Serve sessions resampled from
+            # the minutes, persisting them beside the bundle's other data.
+            equity_daily_bar_reader = MinuteResampleSessionBarReader(
+                equity_minute_bar_reader.trading_calendar,
+                equity_minute_bar_reader,
+                cache_path=resampled_daily_equity_path(
+                    name, timestr, environ=environ,
+                ),
+            )
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
             ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
-                minute_equity_path(name, timestr, environ=environ),
-            ),
-            equity_daily_bar_reader=BcolzDailyBarReader(
-                daily_equity_path(name, timestr, environ=environ),
-            ),
+            equity_minute_bar_reader=equity_minute_bar_reader,
+            equity_daily_bar_reader=equity_daily_bar_reader,
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
             ),
@@ -574,6 +940,11 @@ def _make_bundle_core():
         BadClean
             Raised when ``before`` and or ``after`` are passed with
             ``keep_last``. This is a subclass of ``ValueError``.
+
+        Notes
+        -----
+        The minute bar files shared between ingestions are removed once none
+        of the remaining ingestions use them.
         """
         try:
             all_runs = sorted(
@@ -614,6 +985,11 @@ def _make_bundle_core():
                 shutil.rmtree(path)
                 cleaned.add(path)
 
+        # Remove the shared files which were only used by the removed runs.
+        store = shared_files_path(name, environ=environ)
+        if cleaned and os.path.isdir(store):
+            collect_shared_files(store)
+
         return cleaned
 
     return BundleCore(bundles, register, unregister, ingest, load, clean)
@@ -6,7 +6,8 @@ import sys
 
 from logbook import Logger, StreamHandler
 from numpy import empty
-from pandas import DataFrame, read_csv, Index, Timedelta, NaT
+from pandas import DataFrame, read_csv, Timedelta, NaT, concat
+from six.moves import zip
 
 from zipline.utils.calendars import register_calendar_alias
 from zipline.utils.cli import maybe_show_progress
@@ -18,7 +19,7 @@ logger = Logger(__name__)
 logger.handlers.append(handler)
 
 
-def csvdir_equities(tframes=None, csvdir=None):
+def csvdir_equities(tframes=None, csvdir=None, workers=1):
     """
     Generate an ingest function for custom data bundle
     This function can be used in ~/.zipline/extension.py
@@ -37,6 +38,9 @@ def csvdir_equities(tframes=None, csvdir=None):
         <directory>/<timeframe2>/<symbol1>.csv
         <directory>/<timeframe2>/<symbol2>.csv
         <directory>/<timeframe2>/<symbol3>.csv
+    workers : int, optional
+        The default number of processes used to parse the csv files, used
+        when the ingest is not passed a number of workers.
 
     Returns
     -------
@@ -53,7 +57,7 @@ def csvdir_equities(tframes=None, csvdir=None):
                 '/full/path/to/the/csvdir/directory'))
     """
 
-    return CSVDIRBundle(tframes, csvdir).ingest
+    return CSVDIRBundle(tframes, csvdir, workers).ingest
 
 
 class CSVDIRBundle:
@@ -62,9 +66,10 @@ class CSVDIRBundle:
     list of time frames and a path to the csvdir directory
     """
 
-    def __init__(self, tframes=None, csvdir=None):
+    def __init__(self, tframes=None, csvdir=None, workers=1):
         self.tframes = tframes
         self.csvdir = csvdir
+        self.workers = workers
 
     def ingest(self,
                environ,
@@ -77,7 +82,8 @@ class CSVDIRBundle:
                end_session,
                cache,
                show_progress,
-               output_dir):
+               output_dir,
+               workers=None):
 
         csvdir_bundle(environ,
                       asset_db_writer,
@@ -91,7 +97,8 @@ class CSVDIRBundle:
                       show_progress,
                       output_dir,
                       self.tframes,
-                      self.csvdir)
+                      self.csvdir,
+                      self.workers if workers is None else workers)
 
 
 @bundles.register("csvdir")
@@ -107,9 +114,13 @@ def csvdir_bundle(environ,
                   show_progress,
                   output_dir,
                   tframes=None,
-                  csvdir=None):
+                  csvdir=None,
+                  workers=1):
     """
     Build a zipline data bundle from the directory with csv files.
+
+    With more than one worker, the csv files are parsed in a pool of
+    ``workers`` processes and written in sid order as they are parsed.
     """
     if not csvdir:
         csvdir = environ.get('CSVDIR')
@@ -152,7 +163,7 @@ def csvdir_bundle(environ,
             writer = daily_bar_writer
 
         writer.write(_pricing_iter(ddir, symbols, metadata,
-                     divs_splits, show_progress),
+                     divs_splits, show_progress, workers),
                      show_progress=show_progress)
 
         # Hardcode the exchange to "CSVDIR" for all assets and (elsewhere)
@@ -168,23 +179,66 @@ def csvdir_bundle(environ,
                                 dividends=divs_splits['divs'])
 
 
-def _pricing_iter(csvdir, symbols, metadata, divs_splits, show_progress):
-    with maybe_show_progress(symbols, show_progress,
-                             label='Loading custom pricing data: ') as it:
-        files = os.listdir(csvdir)
-        for sid, symbol in enumerate(it):
-            logger.debug('%s: sid %s' % (symbol, sid))
+def _read_symbol_csv(path):
+    """
+    Parse the csv file of a symbol into its pricing frame and its splits and
+    dividends, without sids.
 
+    This is run in the ingest's worker processes.
+    """
+    dfr = read_csv(path,
+                   parse_dates=[0],
+                   infer_datetime_format=True,
+                   index_col=0).sort_index()
+
+    split = None
+    if 'split' in dfr.columns:
+        tmp = 1. / dfr[dfr['split'] != 1.0]['split']
+        split = DataFrame(data=tmp.index.tolist(),
+                          columns=['effective_date'])
+        split['ratio'] = tmp.tolist()
+
+    div = None
+    if 'dividend' in dfr.columns:
+        # ex_date   amount  sid record_date declared_date pay_date
+        tmp = dfr[dfr['dividend'] != 0.0]['dividend']
+        div = DataFrame(data=tmp.index.tolist(), columns=['ex_date'])
+        div['record_date'] = NaT
+        div['declared_date'] = NaT
+        div['pay_date'] = NaT
+        div['amount'] = tmp.tolist()
+
+    return dfr, split, div
+
+
+def _pricing_iter(csvdir,
+                  symbols,
+                  metadata,
+                  divs_splits,
+                  show_progress,
+                  workers=1):
+    fnames = {}
+    for fname in os.listdir(csvdir):
+        if '.csv' in fname:
+            fnames.setdefault(fname.split('.csv')[0], fname)
+
+    def paths():
+        for symbol in symbols:
             try:
-                fname = [fname for fname in files
-                         if '%s.csv' % symbol in fname][0]
-            except IndexError:
+                fname = fnames[symbol]
+            except KeyError:
                 raise ValueError("%s.csv file is not in %s" % (symbol, csvdir))
+            yield os.path.join(csvdir, fname)
 
-            dfr = read_csv(os.path.join(csvdir, fname),
-                           parse_dates=[0],
-                           infer_datetime_format=True,
-                           index_col=0).sort_index()
+    splits = [divs_splits['splits']]
+    divs = [divs_splits['divs']]
+    with maybe_show_progress(symbols, show_progress,
+                             label='Loading custom pricing data: ') as it:
+        parsed = bundles.ingest_map(_read_symbol_csv, paths(), workers)
+        # Exhaust the parsed frames first, so that the worker pool is shut
+        # down as soon as the last frame is received.
+        for sid, ((dfr, split, div), symbol) in enumerate(zip(parsed, it)):
+            logger.debug('%s: sid %s' % (symbol, sid))
 
             start_date = dfr.index[0]
             end_date = dfr.index[-1]
@@ -193,35 +247,18 @@ def _pricing_iter(csvdir, symbols, metadata, divs_splits, show_progress):
             ac_date = end_date + Timedelta(days=1)
             metadata.iloc[sid] = start_date, end_date, ac_date, symbol
 
-            if 'split' in dfr.columns:
-                tmp = 1. / dfr[dfr['split'] != 1.0]['split']
-                split = DataFrame(data=tmp.index.tolist(),
-                                  columns=['effective_date'])
-                split['ratio'] = tmp.tolist()
+            if split is not None:
                 split['sid'] = sid
+                splits.append(split)
 
-                splits = divs_splits['splits']
-                index = Index(range(splits.shape[0],
-                                    splits.shape[0] + split.shape[0]))
-                split.set_index(index, inplace=True)
-                divs_splits['splits'] = splits.append(split)
-
-            if 'dividend' in dfr.columns:
-                # ex_date   amount  sid record_date declared_date pay_date
-                tmp = dfr[dfr['dividend'] != 0.0]['dividend']
-                div = DataFrame(data=tmp.index.tolist(), columns=['ex_date'])
-                div['record_date'] = NaT
-                div['declared_date'] = NaT
-                div['pay_date'] = NaT
-                div['amount'] = tmp.tolist()
+            if div is not None:
                 div['sid'] = sid
-
-                divs = divs_splits['divs']
-                ind = Index(range(divs.shape[0], divs.shape[0] + div.shape[0]))
-                div.set_index(ind, inplace=True)
-                divs_splits['divs'] = divs.append(div)
+                divs.append(div)
 
             yield sid, dfr
 
+    divs_splits['splits'] = concat(splits, ignore_index=True)
+    divs_splits['divs'] = concat(divs, ignore_index=True)
+
 
 register_calendar_alias("CSVDIR", "NYSE")
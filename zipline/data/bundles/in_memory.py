@@ -0,0 +1,174 @@
+"""
+Bundles loaded into memory once, for running many backtests over the same
+data without reading and decompressing it again for each one.
+"""
+import os
+import sqlite3
+
+import sqlalchemy as sa
+
+from zipline.assets import AssetFinder
+from ..adjustment_index import AdjustmentIndex
+from ..in_memory_bars import (
+    DEFAULT_LOAD_CHUNKSIZE,
+    InMemoryMinuteBarReader,
+    InMemorySessionBarReader,
+)
+from ..us_equity_pricing import SQLiteAdjustmentReader
+from .core import BundleData, load as load_bundle
+
+
+def _sqlite_in_memory(conn):
+    """Copy the database on the sqlite3 connection ``conn`` into a new
+    in-memory database.
+    """
+    copy = sqlite3.connect(':memory:', check_same_thread=False)
+    if hasattr(conn, 'backup'):
+        conn.backup(copy)
+    else:
+        copy.executescript('\n'.join(conn.iterdump()))
+    return copy
+
+
+def _in_memory_asset_finder(asset_finder):
+    """An AssetFinder over an in-memory copy of the db of ``asset_finder``,
+    with all of its assets already retrieved.
+    """
+    raw = asset_finder.engine.raw_connection()
+    try:
+        conn = _sqlite_in_memory(raw.connection)
+    finally:
+        raw.close()
+
+    finder = AssetFinder(sa.create_engine(
+        'sqlite://',
+        creator=lambda: conn,
+        poolclass=sa.pool.StaticPool,
+    ))
+    finder.retrieve_all(finder.sids)
+    return finder
+
+
+def _in_memory_adjustment_reader(adjustment_reader):
+    """A SQLiteAdjustmentReader over an in-memory copy of the db of
+    ``adjustment_reader``, which loads adjustments from an in-memory index.
+    """
+    conn = _sqlite_in_memory(adjustment_reader.conn)
+    reader = SQLiteAdjustmentReader(conn)
+    reader.adjustment_index = AdjustmentIndex.from_db(conn)
+    return reader
+
+
+class InMemoryBundle(BundleData):
+    """The data of a bundle, loaded into memory.
+
+    The bars are held in read-only numpy arrays by
+    :class:`~zipline.data.in_memory_bars.InMemorySessionBarReader` and
+    :class:`~zipline.data.in_memory_bars.InMemoryMinuteBarReader`, and the
+    asset and adjustment dbs are copied into in-memory sqlite dbs, so that
+    backtests run with an ``InMemoryBundle`` never read the bundle's files.
+
+    An ``InMemoryBundle`` is a :class:`~zipline.data.bundles.core.BundleData`
+    and can be used wherever the data returned by
+    :func:`~zipline.data.bundles.load` is.
+
+    Worker processes forked after the bundle has been loaded share its
+    arrays with the parent process instead of copying them, as long as they
+    only read from the bundle.
+
+    See Also
+    --------
+    zipline.data.bundles.load
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_bundle_data(cls,
+                         bundle_data,
+                         sids=None,
+                         start_session=None,
+                         end_session=None,
+                         minute_bars=True,
+                         chunksize=DEFAULT_LOAD_CHUNKSIZE):
+        """Load the data of a bundle into memory.
+
+        Parameters
+        ----------
+        bundle_data : BundleData
+            The readers of the bundle.
+        sids : iterable[int], optional
+            The sids whose bars are loaded. By default the bars of all of the
+            bundle's equities are loaded.
+        start_session, end_session : pd.Timestamp, optional
+            The first and last session whose bars are loaded. By default all
+            of the bundle's sessions are loaded.
+        minute_bars : bool, optional
+            Whether to load the minute bars. When False, the bundle's minute
+            bar reader is used as it is.
+        chunksize : int, optional
+            The number of sids read from the bundle's bar readers at a time.
+
+        Returns
+        -------
+        bundle : InMemoryBundle
+        """
+        asset_finder = _in_memory_asset_finder(bundle_data.asset_finder)
+        if sids is None:
+            sids = asset_finder.equities_sids
+        sids = sorted(sids)
+        equities = asset_finder.retrieve_all(sids)
+
+        equity_daily_bar_reader = InMemorySessionBarReader.from_reader(
+            bundle_data.equity_daily_bar_reader,
+            sids,
+            start_session=start_session,
+            end_session=end_session,
+            start_dates=[equity.start_date for equity in equities],
+            end_dates=[equity.end_date for equity in equities],
+            chunksize=chunksize,
+        )
+
+        if minute_bars:
+            equity_minute_bar_reader = InMemoryMinuteBarReader.from_reader(
+                bundle_data.equity_minute_bar_reader,
+                sids,
+                start_session=start_session,
+                end_session=end_session,
+                chunksize=chunksize,
+            )
+        else:
+            equity_minute_bar_reader = bundle_data.equity_minute_bar_reader
+
+        return cls(
+            asset_finder=asset_finder,
+            equity_minute_bar_reader=equity_minute_bar_reader,
+            equity_daily_bar_reader=equity_daily_bar_reader,
+            adjustment_reader=_in_memory_adjustment_reader(
+                bundle_data.adjustment_reader,
+            ),
+        )
+
+    @classmethod
+    def load(cls, name, environ=os.environ, timestamp=None, **kwargs):
+        """Load a previously ingested bundle into memory.
+
+        Parameters
+        ----------
+        name : str
+            The name of the bundle.
+        environ : mapping, optional
+            The environment variables. Defaults of os.environ.
+        timestamp : datetime, optional
+            The timestamp of the data to lookup.
+            Defaults to the current time.
+        **kwargs
+            Forwarded to :meth:`from_bundle_data`.
+
+        Returns
+        -------
+        bundle : InMemoryBundle
+        """
+        return cls.from_bundle_data(
+            load_bundle(name, environ=environ, timestamp=timestamp),
+            **kwargs
+        )
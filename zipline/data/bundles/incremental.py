@@ -0,0 +1,468 @@
+"""
+Writers which add the sessions of an incremental ingest to the data of the
+previous ingestion of a bundle.
+
+An incremental ingest starts from a copy of the previous ingestion's minute
+bars and adjustments, and passes the ingest function writers which only keep
+the sessions after the last session of the previous ingestion, so that an
+ingest function which writes its whole history still only appends the new
+sessions.
+"""
+import os
+
+from bcolz import ctable
+import numpy as np
+import pandas as pd
+
+from zipline.data.bar_reader import NoDataForSid
+from zipline.utils.sqlite_utils import check_and_create_connection
+
+# The columns of a daily bar table which are written for each sid.
+_DAILY_BAR_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'day')
+
+# The columns of asset metadata holding dates.
+_ASSET_DATE_COLUMNS = [
+    'start_date',
+    'end_date',
+    'first_traded',
+    'auto_close_date',
+    'notice_date',
+    'expiration_date',
+]
+
+
+def minute_bar_sids(rootdir):
+    """The sids with a table in the bcolz minute bar directory ``rootdir``.
+    """
+    sids = []
+    for dirpath, dirnames, _ in os.walk(rootdir):
+        tables = [name for name in dirnames if name.endswith('.bcolz')]
+        sids.extend(int(name[:-len('.bcolz')]) for name in tables)
+        # Don't walk into the tables themselves.
+        dirnames[:] = [name for name in dirnames if name not in tables]
+    return sorted(sids)
+
+
+def last_ingested_session(daily_bar_reader, minute_bar_writer):
+    """The last session with data in an ingestion.
+
+    Parameters
+    ----------
+    daily_bar_reader : BcolzDailyBarReader
+        The reader of the ingestion's daily bars.
+    minute_bar_writer : BcolzMinuteBarWriter
+        A writer opened on the ingestion's minute bars.
+
+    Returns
+    -------
+    last_session : pd.Timestamp
+        The last session with a daily or minute bar, or NaT if the ingestion
+        has no bars.
+    """
+    last_session = pd.NaT
+
+    sids = daily_bar_reader.sids
+    if sids:
+        last_session = max(map(daily_bar_reader.last_session_for_sid, sids))
+
+    for sid in minute_bar_sids(minute_bar_writer._rootdir):
+        last_date = minute_bar_writer.last_date_in_output_for_sid(sid)
+        if pd.isnull(last_session) or last_date > last_session:
+            last_session = last_date
+
+    return last_session
+
+
+class _IncrementalWriter(object):
+    """Base class for writers which forward everything but their write
+    methods to the writer they wrap.
+    """
+    def __init__(self, writer):
+        self._writer = writer
+
+    def __getattr__(self, name):
+        return getattr(self._writer, name)
+
+
+class IncrementalDailyBarWriter(_IncrementalWriter):
+    """A daily bar writer which writes the bars of the previous ingestion
+    along with the new ones.
+
+    Each sid's previous bars before its first new bar are written ahead of
+    its new bars, and the sids without new bars keep their previous bars.
+
+    Parameters
+    ----------
+    writer : BcolzDailyBarWriter
+        The writer of the new ingestion, starting at the first session of the
+        previous ingestion.
+    previous_reader : BcolzDailyBarReader
+        The reader of the previous ingestion's daily bars.
+    """
+    def __init__(self, writer, previous_reader):
+        super(IncrementalDailyBarWriter, self).__init__(writer)
+        self._previous_reader = previous_reader
+
+    def _previous_rows(self, sid):
+        try:
+            return self._previous_reader.sid_rows(sid)
+        except NoDataForSid:
+            return None
+
+    def _merge(self, sid, table):
+        previous = self._previous_rows(sid)
+        if previous is None:
+            return table
+        if len(table):
+            previous = previous[previous['day'] < table['day'][0]]
+        return ctable(
+            columns=[
+                np.concatenate([previous[name], table[name][:]])
+                for name in _DAILY_BAR_COLUMNS
+            ],
+            names=list(_DAILY_BAR_COLUMNS),
+        )
+
+    def _merged_data(self, data, invalid_data_behavior):
+        seen = set()
+        for sid, df in data:
+            seen.add(sid)
+            yield sid, self._merge(
+                sid,
+                self._writer.to_ctable(df, invalid_data_behavior),
+            )
+
+        for sid in sorted(set(self._previous_reader.sids) - seen):
+            previous = self._previous_rows(sid)
+            yield sid, ctable(
+                columns=[previous[name] for name in _DAILY_BAR_COLUMNS],
+                names=list(_DAILY_BAR_COLUMNS),
+            )
+
+    def write(self,
+              data,
+              assets=None,
+              show_progress=False,
+              invalid_data_behavior='warn'):
+        if assets is not None:
+            assets = set(assets) | set(self._previous_reader.sids)
+        return self._writer.write(
+            self._merged_data(data, invalid_data_behavior),
+            assets=assets,
+            show_progress=show_progress,
+            invalid_data_behavior=invalid_data_behavior,
+        )
+
+
+class IncrementalMinuteBarWriter(_IncrementalWriter):
+    """A minute bar writer, opened on a copy of the previous ingestion's
+    minute bars, which drops the minutes before ``first_session``.
+
+    Parameters
+    ----------
+    writer : BcolzMinuteBarWriter
+        The writer opened on the copy of the previous minute bars.
+    first_session : pd.Timestamp
+        The first session of the incremental ingest.
+    """
+    def __init__(self, writer, first_session):
+        super(IncrementalMinuteBarWriter, self).__init__(writer)
+        self._first_minute = writer._calendar.session_open(first_session)
+
+    def _new_minutes(self, df):
+        return df[df.index >= self._first_minute]
+
+    def _new_data(self, data):
+        for sid, df in data:
+            df = self._new_minutes(df)
+            if len(df):
+                yield sid, df
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        return self._writer.write(
+            self._new_data(data),
+            show_progress=show_progress,
+            invalid_data_behavior=invalid_data_behavior,
+        )
+
+    def write_sid(self, sid, df, invalid_data_behavior='warn'):
+        df = self._new_minutes(df)
+        if len(df):
+            self._writer.write_sid(
+                sid,
+                df,
+                invalid_data_behavior=invalid_data_behavior,
+            )
+
+
+class IncrementalAdjustmentWriter(_IncrementalWriter):
+    """An adjustment writer, opened on a copy of the previous ingestion's
+    adjustments db, which only appends the adjustments effective on or after
+    ``first_session``.
+
+    Parameters
+    ----------
+    writer : SQLiteAdjustmentWriter
+        The writer opened on the copy of the previous adjustments db.
+    first_session : pd.Timestamp
+        The first session of the incremental ingest.
+    """
+    def __init__(self, writer, first_session):
+        super(IncrementalAdjustmentWriter, self).__init__(writer)
+        self._first_second = np.datetime64(
+            first_session.value // 1000000000, 's',
+        )
+
+    def _new_rows(self, frame, column):
+        if frame is None or frame.empty:
+            return frame
+        # Dates are read the way SQLiteAdjustmentWriter reads them.
+        dates = frame[column].values.astype('datetime64[s]')
+        return frame[dates >= self._first_second]
+
+    def write(self,
+              splits=None,
+              mergers=None,
+              dividends=None,
+              stock_dividends=None):
+        return self._writer.write(
+            splits=self._new_rows(splits, 'effective_date'),
+            mergers=self._new_rows(mergers, 'effective_date'),
+            dividends=self._new_rows(dividends, 'ex_date'),
+            stock_dividends=self._new_rows(stock_dividends, 'ex_date'),
+        )
+
+
+def _utc_datetimes(column):
+    """Convert a column of datetime-likes, naive or not, to naive UTC
+    datetime64s.
+    """
+    return np.array(
+        [pd.Timestamp(dt).value for dt in column],
+        dtype=np.int64,
+    ).view('datetime64[ns]')
+
+
+def _with_utc_dates(frame):
+    """A copy of ``frame`` with its date columns converted by
+    ``_utc_datetimes``.
+    """
+    frame = frame.copy()
+    for column in frame.columns.intersection(_ASSET_DATE_COLUMNS):
+        frame[column] = _utc_datetimes(frame[column])
+    return frame
+
+
+def _indexed(frame, key):
+    """``frame`` indexed by ``key``, if it is one of its columns.
+    """
+    if key in frame.columns:
+        return frame.set_index(key)
+    return frame
+
+
+def _merge_asset_frames(previous, new):
+    """Merge the asset metadata of the previous ingestion with the metadata
+    written by an incremental ingest, both indexed by sid.
+
+    The new rows replace the previous ones, but keep the earlier start date
+    and first traded date of the previous ingestion.
+    """
+    if new is None:
+        return previous if len(previous) else None
+    new = _indexed(new, 'sid')
+    if not len(previous):
+        return new
+
+    previous = _with_utc_dates(
+        previous[previous.columns.intersection(new.columns)],
+    )
+    new = _with_utc_dates(new)
+
+    both = new.index.intersection(previous.index)
+    for column in new.columns.intersection(['start_date', 'first_traded']):
+        new.loc[both, column] = pd.concat(
+            [previous.loc[both, column], new.loc[both, column]],
+            axis=1,
+        ).min(axis=1)
+    return pd.concat([previous.drop(both), new]).sort_index()
+
+
+def _merge_equity_frames(previous, new):
+    """Merge the equities of the previous ingestion with the equities written
+    by an incremental ingest, both indexed by sid with a row for each symbol
+    held by an equity.
+
+    The previous symbols of an equity which start before its first new symbol
+    are kept, ending where the new symbols start, so that the symbol history
+    of the previous ingestion is preserved. A previous symbol which continues
+    as the first new symbol is merged into it.
+    """
+    if new is None:
+        return previous if len(previous) else None
+    new = _indexed(new, 'sid')
+    if not len(previous):
+        return new
+
+    new = _with_utc_dates(new)
+    # The dates the writer assumes for equities without them.
+    if 'start_date' not in new.columns:
+        new['start_date'] = np.datetime64(0, 'ns')
+    if 'end_date' not in new.columns:
+        new['end_date'] = pd.Timestamp.max.to_datetime64()
+    previous = _with_utc_dates(
+        previous[previous.columns.intersection(new.columns)],
+    )
+
+    if 'first_traded' in new.columns:
+        first_traded = pd.concat(
+            [
+                previous.first_traded.groupby(level=0).min(),
+                new.first_traded.groupby(level=0).min(),
+            ],
+            axis=1,
+        ).min(axis=1)
+        new['first_traded'] = first_traded.reindex(new.index).values
+
+    new_starts = new.start_date.groupby(level=0).min()
+    starts = new_starts.reindex(previous.index).values
+    previous = previous[
+        pd.isnull(starts) | (previous.start_date.values < starts)
+    ].copy()
+
+    starts = new_starts.reindex(previous.index).values
+    ends = previous.end_date.values
+    cut = ~pd.isnull(starts) & (ends >= starts)
+    previous['end_date'] = np.where(
+        cut,
+        starts - np.timedelta64(1, 'ns'),
+        ends,
+    )
+
+    new_sids = new.index.values
+    new_start_dates = new.start_date.values.copy()
+    new_symbols = new.symbol.str.upper().values
+    continued = np.zeros(len(previous), dtype=bool)
+    for loc in np.flatnonzero(cut):
+        first_new = (
+            (new_sids == previous.index[loc]) &
+            (new_start_dates == starts[loc]) &
+            (new_symbols == previous.symbol.iat[loc].upper())
+        )
+        if first_new.any():
+            new_start_dates[first_new] = previous.start_date.iat[loc]
+            continued[loc] = True
+    new['start_date'] = new_start_dates
+
+    return pd.concat([previous[~continued], new]).sort_index()
+
+
+def _merge_keyed_frames(previous, new, key):
+    """Merge the rows of a table of the previous ingestion, indexed by
+    ``key``, with the rows written by an incremental ingest, which replace
+    the previous rows with the same key.
+    """
+    if new is None:
+        return previous if len(previous) else None
+    new = _indexed(new, key)
+    if not len(previous):
+        return new
+    return pd.concat([previous[~previous.index.isin(new.index)], new])
+
+
+def _merge_supplementary_mappings(previous, new):
+    """Merge the equity supplementary mappings of the previous ingestion with
+    the mappings written by an incremental ingest, which replace the previous
+    mappings of the same sid and field starting on the same date.
+    """
+    if new is None:
+        return previous if len(previous) else None
+    if not len(previous):
+        return new
+
+    key = ['sid', 'field', 'start_date']
+    previous = _with_utc_dates(previous).set_index(key)
+    new = _with_utc_dates(new).set_index(key)
+    return pd.concat(
+        [previous[~previous.index.isin(new.index)], new],
+    ).reset_index()
+
+
+class IncrementalAssetDBWriter(_IncrementalWriter):
+    """An asset db writer which writes the assets of the previous ingestion
+    along with the ones written by the ingest function.
+
+    The previous ingestion's symbol history, futures root symbols, exchanges
+    and supplementary mappings are read from the tables of its asset db, and
+    the rows written by the ingest function take precedence over them.
+
+    Parameters
+    ----------
+    writer : AssetDBWriter
+        The writer of the new ingestion.
+    previous_asset_db_path : str
+        The path to the previous ingestion's asset db.
+    """
+    def __init__(self, writer, previous_asset_db_path):
+        super(IncrementalAssetDBWriter, self).__init__(writer)
+        self._previous_asset_db_path = previous_asset_db_path
+
+    def _previous_tables(self):
+        conn = check_and_create_connection(
+            self._previous_asset_db_path,
+            require_exists=True,
+        )
+        try:
+            def read(table):
+                return pd.read_sql('SELECT * FROM "{}"'.format(table), conn)
+
+            mappings = read('equity_symbol_mappings')
+            equities = read('equities').drop(
+                ['start_date', 'end_date'],
+                axis=1,
+            )
+            return {
+                # A row for each symbol held by each equity, as they are
+                # passed to AssetDBWriter.write.
+                'equities': mappings[
+                    ['sid', 'symbol', 'start_date', 'end_date']
+                ].merge(equities, on='sid').set_index('sid'),
+                'futures': read('futures_contracts').set_index('sid'),
+                'exchanges': read('futures_exchanges').set_index('exchange'),
+                'root_symbols': read('futures_root_symbols').set_index(
+                    'root_symbol',
+                ),
+                'equity_supplementary_mappings': read(
+                    'equity_supplementary_mappings',
+                ),
+            }
+        finally:
+            conn.close()
+
+    def write(self,
+              equities=None,
+              futures=None,
+              exchanges=None,
+              root_symbols=None,
+              equity_supplementary_mappings=None,
+              **kwargs):
+        previous = self._previous_tables()
+        return self._writer.write(
+            equities=_merge_equity_frames(previous['equities'], equities),
+            futures=_merge_asset_frames(previous['futures'], futures),
+            exchanges=_merge_keyed_frames(
+                previous['exchanges'],
+                exchanges,
+                'exchange',
+            ),
+            root_symbols=_merge_keyed_frames(
+                previous['root_symbols'],
+                root_symbols,
+                'root_symbol',
+            ),
+            equity_supplementary_mappings=_merge_supplementary_mappings(
+                previous['equity_supplementary_mappings'],
+                equity_supplementary_mappings,
+            ),
+            **kwargs
+        )
@@ -0,0 +1,160 @@
+"""
+Sharing of identical sid files between the ingestions of a bundle.
+
+The files of each sid's minute bar table are hard-linked to a content
+addressed store kept next to the ingestions, so a file which is identical in
+several ingestions is only stored once. A file in the store is used by an
+ingestion as long as it has a link besides the store's own, which is how
+``clean`` knows which files of the store can be removed.
+
+The shared files are made read-only, and ``BcolzMinuteBarWriter`` copies the
+files of a sid's table before writing to it, so that writing to the bars of
+one ingestion doesn't change the other ingestions.
+"""
+import errno
+import hashlib
+import os
+import stat
+import warnings
+
+# The errors raised by os.link when the files can't be linked, for example
+# because the filesystem doesn't support hard links.
+_LINK_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in ('EXDEV', 'EPERM', 'EMLINK', 'ENOTSUP', 'EOPNOTSUPP')
+    if hasattr(errno, name)
+)
+
+_READ_SIZE = 1 << 20
+
+
+def file_digest(path):
+    """The hex sha1 digest of the contents of the file at ``path``.
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_READ_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sid_files(rootdir):
+    """The paths of the files of the sid tables in the bcolz minute bar
+    directory ``rootdir``.
+    """
+    for dirpath, dirnames, filenames in os.walk(rootdir):
+        if not any(
+            part.endswith('.bcolz')
+            for part in os.path.relpath(dirpath, rootdir).split(os.sep)
+        ):
+            continue
+        for filename in filenames:
+            yield os.path.join(dirpath, filename)
+
+
+def _replace_with_link(source, path):
+    """Atomically replace ``path`` with a hard link to ``source``.
+    """
+    tmp_path = path + '.link'
+    os.link(source, tmp_path)
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+
+
+def _make_read_only(path):
+    """Remove the write permissions of the file at ``path``, and so of all of
+    its links.
+    """
+    mode = os.stat(path).st_mode
+    os.chmod(
+        path,
+        mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH),
+    )
+
+
+def share_sid_files(rootdir, store):
+    """Hard-link the files of the sid tables in ``rootdir`` to the identical
+    files in ``store``, adding the files which aren't in ``store`` yet.
+
+    Parameters
+    ----------
+    rootdir : str
+        The bcolz minute bar directory of an ingestion.
+    store : str
+        The directory of the bundle's shared files.
+
+    Returns
+    -------
+    shared : int
+        The number of files which were replaced by a link to a file already
+        in the store.
+
+    Notes
+    -----
+    The files in ``store``, and so their links, are read-only.
+
+    If the files can't be linked, for example because the filesystem doesn't
+    support hard links, a warning is issued and the remaining files are kept
+    as they are.
+    """
+    if not hasattr(os, 'link'):
+        return 0
+
+    shared = 0
+    for path in _sid_files(rootdir):
+        digest = file_digest(path)
+        shared_path = os.path.join(store, digest[:2], digest)
+        try:
+            if not os.path.exists(shared_path):
+                subdir = os.path.dirname(shared_path)
+                if not os.path.isdir(subdir):
+                    os.makedirs(subdir)
+                _replace_with_link(path, shared_path)
+                _make_read_only(shared_path)
+            elif not os.path.samefile(path, shared_path) and (
+                    os.path.getsize(path) == os.path.getsize(shared_path)):
+                _replace_with_link(shared_path, path)
+                shared += 1
+        except OSError as e:
+            if e.errno not in _LINK_ERRNOS:
+                raise
+            warnings.warn(
+                'Could not link the files of {rootdir!r} to {store!r}: {e}.'
+                ' They will not be shared with other ingestions.'.format(
+                    rootdir=rootdir,
+                    store=store,
+                    e=e,
+                ),
+            )
+            break
+
+    return shared
+
+
+def collect_shared_files(store):
+    """Remove the files of ``store`` which are not used by an ingestion any
+    more.
+
+    Parameters
+    ----------
+    store : str
+        The directory of the bundle's shared files.
+
+    Returns
+    -------
+    removed : set[str]
+        The paths of the files which were removed.
+    """
+    removed = set()
+    for dirpath, _, filenames in os.walk(store, topdown=False):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if os.stat(path).st_nlink <= 1:
+                os.remove(path)
+                removed.add(path)
+        if dirpath != store and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return removed
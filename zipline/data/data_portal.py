@@ -98,6 +98,12 @@ _DEF_M_HIST_PREFETCH = DEFAULT_MINUTE_HISTORY_PREFETCH
 _DEF_D_HIST_PREFETCH = DEFAULT_DAILY_HISTORY_PREFETCH
 
 
+def _writeable(array):
+    """``array``, or a copy of it if it is read-only.
+    """
+    return array if array.flags.writeable else array.copy()
+
+
 class DataPortal(object):
     """Interface to all of the data that a zipline simulation needs.
 
@@ -113,15 +119,17 @@ class DataPortal(object):
         The calendar instance used to provide minute->session information.
     first_trading_day : pd.Timestamp
         The first trading day for the simulation.
-    equity_daily_reader : BcolzDailyBarReader, optional
-        The daily bar reader for equities. This will be used to service
+    equity_daily_reader : SessionBarReader, optional
+        The daily bar reader for equities, e.g. a BcolzDailyBarReader or
+        ParquetDailyBarReader. This will be used to service
         daily data backtests or daily history calls in a minute backetest.
         If a daily bar reader is not provided but a minute bar reader is,
         the minutes will be rolled up to serve the daily requests.
-    equity_minute_reader : BcolzMinuteBarReader, optional
-        The minute bar reader for equities. This will be used to service
-        minute data backtests or minute history calls. This can be used
-        to serve daily calls if no daily bar reader is provided.
+    equity_minute_reader : MinuteBarReader, optional
+        The minute bar reader for equities, e.g. a BcolzMinuteBarReader or
+        MmapMinuteBarReader. This will be used to service minute data
+        backtests or minute history calls. This can be used to serve daily
+        calls if no daily bar reader is provided.
     future_daily_reader : BcolzDailyBarReader, optional
         The daily bar ready for futures. This will be used to service
         daily data backtests or daily history calls in a minute backetest.
@@ -138,6 +146,13 @@ class DataPortal(object):
         The last session to make available in session-level data.
     last_available_minute : pd.Timestamp, optional
         The last minute to make available in minute-level data.
+    minute_history_prefetch_length : int or PrefetchPolicy, optional
+        The number of minutes loaded beyond the end of minute history
+        windows, or a policy which chooses it, e.g. an
+        :class:`~zipline.data.history_prefetch.AdaptivePrefetchLength`.
+    daily_history_prefetch_length : int or PrefetchPolicy, optional
+        The number of sessions loaded beyond the end of daily history
+        windows, or a policy which chooses it.
     """
     def __init__(self,
                  asset_finder,
@@ -164,6 +179,9 @@ class DataPortal(object):
         self._mergers_dict = {}
         self._dividends_dict = {}
 
+        # cache of (sid, is_volume) -> cumulative adjustment factors
+        self._adjustment_factors = {}
+
         # Cache of sid -> the first trading day of an asset.
         self._asset_start_dates = {}
         self._asset_end_dates = {}
@@ -526,9 +544,187 @@ class DataPortal(object):
 
         if assets_is_scalar:
             return get_single_asset_value(assets)
-        else:
+
+        assets = list(assets)
+        if field not in OHLCVP_FIELDS and field != "last_traded":
             return list(map(get_single_asset_value, assets))
 
+        # Read the assets with one call to the pricing reader per field, or
+        # per forward filled dt. Assets which aren't alive at ``dt`` have no
+        # values other than their last traded dt, and are, like anything
+        # other than an Asset, looked up one at a time.
+        if field == "last_traded":
+            batch = [
+                i for i, asset in enumerate(assets) if isinstance(asset, Asset)
+            ]
+        else:
+            batch = [
+                i for i, asset in enumerate(assets)
+                if isinstance(asset, Asset) and
+                asset.start_date <= dt and session_label <= asset.end_date
+            ]
+        results = [None] * len(assets)
+        if len(batch) != len(assets):
+            batched = set(batch)
+            for i, asset in enumerate(assets):
+                if i not in batched:
+                    results[i] = get_single_asset_value(asset)
+
+        if batch:
+            values = self._get_spot_values(
+                [assets[i] for i in batch],
+                field,
+                dt,
+                session_label,
+                data_frequency,
+            )
+            for i, value in zip(batch, values):
+                results[i] = value
+
+        return results
+
+    def _get_spot_values(self, assets, field, dt, session_label,
+                         data_frequency):
+        """
+        Internal method that looks up ``field`` for many assets at once.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The assets whose data is desired. Unless ``field`` is
+            'last_traded', all of them must be alive at ``dt``.
+        field : {'open', 'high', 'low', 'close', 'volume', 'price',
+                 'last_traded'}
+            The desired field of the assets.
+        dt : pd.Timestamp
+            The timestamp for the desired values.
+        session_label : pd.Timestamp
+            The session containing ``dt``.
+        data_frequency : str
+            The frequency of the data to query.
+
+        Returns
+        -------
+        values : list
+            The value of ``field`` for each asset.
+        """
+        reader = self._get_pricing_reader(data_frequency)
+        if data_frequency == "daily":
+            dt = session_label
+
+        if field == "last_traded":
+            return reader.get_last_traded_dts(assets, dt)
+
+        # The assets are passed as they are, rather than as their sids, so
+        # that readers which dispatch on the type of asset don't have to look
+        # them up again.
+        if field != "price":
+            return list(self._get_reader_values(reader, assets, dt, field))
+
+        values = self._get_reader_values(reader, assets, dt, "close")
+        if data_frequency == "daily":
+            self._ffill_daily_prices(assets, values, dt)
+        else:
+            self._ffill_minute_prices(assets, values, dt)
+        return list(values)
+
+    @staticmethod
+    def _get_reader_values(reader, assets, dt, field):
+        """
+        Look up ``field`` for ``assets`` at ``dt`` with ``reader.get_values``,
+        treating a ``dt`` for which the reader has no data as a dt at which
+        none of the assets traded, as the single asset lookups do.
+        """
+        try:
+            return reader.get_values(assets, dt, field)
+        except NoDataOnDate:
+            if field == 'volume':
+                return np.zeros(len(assets), dtype=np.int64)
+            return np.full(len(assets), np.nan)
+
+    def _ffill_minute_prices(self, assets, values, dt):
+        """
+        Forward fill, in place, the minute closes ``values`` of ``assets``
+        at ``dt`` for the assets which did not trade at ``dt``.
+        """
+        reader = self._get_pricing_reader('minute')
+        # The last traded minute of an asset with volume at ``dt`` is ``dt``
+        # itself, so its close does not need forward filling.
+        missing = np.flatnonzero(
+            self._get_reader_values(reader, assets, dt, "volume") == 0
+        )
+        if not len(missing):
+            return
+
+        last_traded = reader.get_last_traded_dts(
+            [assets[i] for i in missing],
+            dt,
+        )
+        by_dt = {}
+        for i, query_dt in zip(missing, last_traded):
+            if pd.isnull(query_dt):
+                values[i] = np.nan
+            else:
+                by_dt.setdefault(query_dt, []).append(i)
+
+        for query_dt, locs in iteritems(by_dt):
+            found = reader.get_values(
+                [assets[i] for i in locs],
+                query_dt,
+                "close",
+            )
+            same_day = dt == query_dt or dt.date() == query_dt.date()
+            for i, value in zip(locs, found):
+                if not same_day:
+                    # The value came from a different day, so it has to be
+                    # adjusted if there are any adjustments on that day
+                    # barrier.
+                    value = self.get_adjusted_value(
+                        assets[i], "close", query_dt,
+                        dt, "minute", spot_value=value
+                    )
+                values[i] = value
+
+    def _ffill_daily_prices(self, assets, values, session):
+        """
+        Forward fill, in place, the daily closes ``values`` of ``assets`` on
+        ``session`` for the assets without a close on ``session``.
+        """
+        reader = self._get_pricing_reader('daily')
+        sessions = self.trading_calendar.all_sessions
+        missing = np.flatnonzero(isnull(values))
+
+        session_loc = sessions.get_loc(session)
+        found_loc = session_loc
+        while len(missing) and found_loc > 0:
+            found_loc -= 1
+            found_dt = sessions[found_loc]
+            # Stop searching for assets which started after ``found_dt``.
+            missing = missing[[
+                assets[i].start_date <= found_dt for i in missing
+            ]]
+            if not len(missing):
+                break
+
+            try:
+                found = reader.get_values(
+                    [assets[i] for i in missing],
+                    found_dt,
+                    "close",
+                )
+            except NoDataOnDate:
+                # The reader has no sessions this early, so the remaining
+                # assets stay nan.
+                break
+            is_found = ~isnull(found)
+            for i, value in zip(missing[is_found], found[is_found]):
+                # adjust if needed
+                values[i] = self.get_adjusted_value(
+                    assets[i], "price", found_dt, session, "minute",
+                    spot_value=value
+                )
+            missing = missing[~is_found]
+
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
         Returns a list of adjustments between the dt and perspective_dt for the
@@ -554,48 +750,119 @@ class DataPortal(object):
         adjustments : list[Adjustment]
             The adjustments to that field.
         """
+        return self.get_adjustment_ratios(
+            assets, field, dt, perspective_dt,
+        ).tolist()
+
+    def get_adjustment_ratios(self, assets, field, dt, perspective_dt):
+        """
+        Returns the ratios of the adjustments between the dt and
+        perspective_dt for the given field and assets, as an array.
+
+        This is the batched form of :meth:`get_adjustments`.
+
+        Parameters
+        ----------
+        assets : list of type Asset, or Asset
+            The asset, or assets whose adjustments are desired.
+        field : {'open', 'high', 'low', 'close', 'volume', \
+                 'price', 'last_traded'}
+            The desired field of the asset.
+        dt : pd.Timestamp
+            The timestamp for the desired value.
+        perspective_dt : pd.Timestamp
+            The timestamp from which the data is being viewed back from.
+
+        Returns
+        -------
+        ratios : np.ndarray[float64]
+            For each asset, the product of the ratios of its adjustments
+            effective between dt and perspective_dt, inclusive.
+        """
         if isinstance(assets, Asset):
             assets = [assets]
 
-        adjustment_ratios_per_asset = []
+        is_volume = field == 'volume'
+        start = pd.Timestamp(dt).value
+        end = pd.Timestamp(perspective_dt).value
+
+        ratios = np.empty(len(assets), dtype=float64)
+        for i, asset in enumerate(assets):
+            dates, factors, asset_ratios = self._get_adjustment_factors(
+                asset, is_volume,
+            )
+            first = dates.searchsorted(start, 'left')
+            last = dates.searchsorted(end, 'right')
+            if first >= last:
+                ratios[i] = 1.0
+            elif factors[first]:
+                ratios[i] = factors[last] / factors[first]
+            else:
+                # A zero ratio before the range; multiply the ratios in it.
+                ratios[i] = reduce(mul, asset_ratios[first:last], 1.0)
+        return ratios
+
+    def _get_adjustment_factors(self, asset, is_volume):
+        """
+        Internal method that returns the cumulative adjustment factors for
+        the given sid.
+
+        The ratio of the adjustments effective between two dates is the
+        quotient of the factors at the locations of the dates in the
+        effective dates.
+
+        Parameters
+        ----------
+        asset : Asset
+            The asset for which to return adjustment factors.
+
+        is_volume: bool
+            Whether to return the factors of the adjustments to volumes,
+            i.e. of the inverted split ratios, rather than to prices.
+
+        Returns
+        -------
+        dates : np.ndarray[int64]
+            The sorted effective dates of the adjustments, in nanoseconds.
+
+        factors : np.ndarray[float64]
+            The products of the first 0 to len(dates) adjustment ratios.
 
-        def split_adj_factor(x):
-            return x if field != 'volume' else 1.0 / x
+        ratios : np.ndarray[float64]
+            The ratios of the adjustments, in the order of ``dates``.
+        """
+        key = int(asset), is_volume
+        try:
+            return self._adjustment_factors[key]
+        except KeyError:
+            pass
 
-        for asset in assets:
-            adjustments_for_asset = []
-            split_adjustments = self._get_adjustment_list(
-                asset, self._splits_dict, "SPLITS"
+        adjustments = [
+            (adj_dt, 1.0 / ratio if is_volume else ratio)
+            for adj_dt, ratio in self._get_adjustment_list(
+                asset, self._splits_dict, "SPLITS",
             )
-            for adj_dt, adj in split_adjustments:
-                if dt <= adj_dt <= perspective_dt:
-                    adjustments_for_asset.append(split_adj_factor(adj))
-                elif adj_dt > perspective_dt:
-                    break
-
-            if field != 'volume':
-                merger_adjustments = self._get_adjustment_list(
-                    asset, self._mergers_dict, "MERGERS"
-                )
-                for adj_dt, adj in merger_adjustments:
-                    if dt <= adj_dt <= perspective_dt:
-                        adjustments_for_asset.append(adj)
-                    elif adj_dt > perspective_dt:
-                        break
-
-                dividend_adjustments = self._get_adjustment_list(
-                    asset, self._dividends_dict, "DIVIDENDS",
-                )
-                for adj_dt, adj in dividend_adjustments:
-                    if dt <= adj_dt <= perspective_dt:
-                        adjustments_for_asset.append(adj)
-                    elif adj_dt > perspective_dt:
-                        break
+        ]
+        if not is_volume:
+            adjustments.extend(self._get_adjustment_list(
+                asset, self._mergers_dict, "MERGERS",
+            ))
+            adjustments.extend(self._get_adjustment_list(
+                asset, self._dividends_dict, "DIVIDENDS",
+            ))
 
-            ratio = reduce(mul, adjustments_for_asset, 1.0)
-            adjustment_ratios_per_asset.append(ratio)
+        dates = np.array(
+            [adj_dt.value for adj_dt, _ in adjustments],
+            dtype=int64,
+        )
+        ratios = np.array([ratio for _, ratio in adjustments], dtype=float64)
+        order = dates.argsort(kind='mergesort')
+        dates = dates[order]
+        ratios = ratios[order]
+        factors = np.concatenate([[1.0], np.cumprod(ratios)])
 
-        return adjustment_ratios_per_asset
+        self._adjustment_factors[key] = result = dates, factors, ratios
+        return result
 
     def get_adjusted_value(self, asset, field, dt,
                            perspective_dt,
@@ -643,7 +910,9 @@ class DataPortal(object):
                                                  data_frequency)
 
         if isinstance(asset, Equity):
-            ratio = self.get_adjustments(asset, field, dt, perspective_dt)[0]
+            ratio = self.get_adjustment_ratios(
+                [asset], field, dt, perspective_dt,
+            )[0]
             spot_value *= ratio
 
         return spot_value
@@ -735,33 +1004,6 @@ class DataPortal(object):
             )
         return tds[start_loc:end_loc + 1]
 
-    def _get_history_daily_window(self,
-                                  assets,
-                                  end_dt,
-                                  bar_count,
-                                  field_to_use,
-                                  data_frequency):
-        """
-        Internal method that returns a dataframe containing history bars
-        of daily frequency for the given sids.
-        """
-        session = self.trading_calendar.minute_to_session_label(end_dt)
-        days_for_window = self._get_days_for_window(session, bar_count)
-
-        if len(assets) == 0:
-            return pd.DataFrame(None,
-                                index=days_for_window,
-                                columns=None)
-
-        data = self._get_history_daily_window_data(
-            assets, days_for_window, end_dt, field_to_use, data_frequency
-        )
-        return pd.DataFrame(
-            data,
-            index=days_for_window,
-            columns=assets
-        )
-
     def _get_history_daily_window_data(self,
                                        assets,
                                        days_for_window,
@@ -834,13 +1076,7 @@ class DataPortal(object):
             suggested_start_day=suggested_start_day.date(),
         )
 
-    def _get_history_minute_window(self, assets, end_dt, bar_count,
-                                   field_to_use):
-        """
-        Internal method that returns a dataframe containing history bars
-        of minute frequency for the given sids.
-        """
-        # get all the minutes for this window
+    def _get_minutes_for_window(self, end_dt, bar_count):
         try:
             minutes_for_window = self.trading_calendar.minutes_window(
                 end_dt, -bar_count
@@ -851,17 +1087,175 @@ class DataPortal(object):
         if minutes_for_window[0] < self._first_trading_minute:
             self._handle_minute_history_out_of_bounds(bar_count)
 
-        asset_minute_data = self._get_minute_window_data(
-            assets,
-            field_to_use,
-            minutes_for_window,
+        return minutes_for_window
+
+    @weak_lru_cache(20)
+    def get_history_window_index(self, end_dt, bar_count, frequency):
+        """
+        The dts of a history window, as returned in the index of
+        :meth:`get_history_window`.
+
+        The indices of the most recently requested windows are cached.
+
+        Parameters
+        ----------
+        end_dt : pd.Timestamp
+            The last dt of the window.
+        bar_count : int
+            The number of bars in the window.
+        frequency : str
+            "1d" or "1m"
+
+        Returns
+        -------
+        index : pd.DatetimeIndex
+            The sessions or minutes of the window.
+        """
+        if frequency == "1d":
+            return self._get_days_for_window(
+                self.trading_calendar.minute_to_session_label(end_dt),
+                bar_count,
+            )
+        elif frequency == "1m":
+            return self._get_minutes_for_window(end_dt, bar_count)
+        else:
+            raise ValueError("Invalid frequency: {0}".format(frequency))
+
+    def get_history_window_array(self,
+                                 assets,
+                                 end_dt,
+                                 bar_count,
+                                 frequency,
+                                 field,
+                                 data_frequency):
+        """
+        The values of a history window, without building a DataFrame.
+
+        This returns the same values as :meth:`get_history_window`, whose
+        index is given by :meth:`get_history_window_index`.
+
+        Parameters
+        ----------
+        assets : list of zipline.data.Asset objects
+            The assets whose data is desired.
+        end_dt : pd.Timestamp
+            The last dt of the window.
+        bar_count : int
+            The number of bars desired.
+        frequency : str
+            "1d" or "1m"
+        field : str
+            The desired field of the asset.
+        data_frequency : str
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars.
+
+        Returns
+        -------
+        values : np.ndarray
+            A read-only array of shape (bar_count, len(assets)). The array
+            may be shared with the history loaders, which don't modify it.
+        """
+        _, values = self._get_history_window_values(
+            assets, end_dt, bar_count, frequency, field, data_frequency
         )
+        values.setflags(write=False)
+        return values
+
+    def _get_history_window_values(self,
+                                   assets,
+                                   end_dt,
+                                   bar_count,
+                                   frequency,
+                                   field,
+                                   data_frequency):
+        """
+        The index and values of a history window. The values may be a
+        read-only array shared with the history loaders.
+        """
+        if field not in OHLCVP_FIELDS and field != 'sid':
+            raise ValueError("Invalid field: {0}".format(field))
 
-        return pd.DataFrame(
-            asset_minute_data,
-            index=minutes_for_window,
-            columns=assets
+        field_to_use = "close" if field == "price" else field
+        index = self.get_history_window_index(end_dt, bar_count, frequency)
+        if frequency == "1d" and len(assets) == 0:
+            return index, np.empty((len(index), 0))
+        elif frequency == "1d":
+            values = self._get_history_daily_window_data(
+                assets, index, end_dt, field_to_use, data_frequency
+            )
+        else:
+            values = self._get_minute_window_data(
+                assets, field_to_use, index
+            )
+
+        if field == "price":
+            values = self._ffill_history_prices(
+                assets,
+                _writeable(values),
+                index,
+                'daily' if frequency == "1d" else 'minute',
+            )
+        return index, values
+
+    def _ffill_history_prices(self, assets, values, index, data_frequency):
+        """
+        Forward-fill the prices of a history window in place.
+
+        The leading missing prices of each asset are filled with its last
+        traded price before the window, and the prices after the end date of
+        an asset are left missing.
+        """
+        history_start, history_end = index[[0, -1]]
+        for i in np.flatnonzero(isnull(values[0])):
+            asset = assets[i]
+            last_traded = self.get_last_traded_dt(
+                asset,
+                history_start,
+                data_frequency,
+            )
+            if not isnull(last_traded):
+                values[0, i] = self.get_adjusted_value(
+                    asset,
+                    'price',
+                    dt=last_traded,
+                    perspective_dt=history_end,
+                    data_frequency=data_frequency,
+                )
+
+        # For each bar and asset, the row of the last bar with a price.
+        rows = np.where(
+            isnull(values),
+            0,
+            np.arange(len(values))[:, np.newaxis],
         )
+        np.maximum.accumulate(rows, axis=0, out=rows)
+        values[:] = values[rows, np.arange(values.shape[1])]
+
+        # forward-filling will incorrectly produce values after the end of
+        # an asset's lifetime, so write NaNs back over the asset's
+        # end_date.
+        normed_index = index.normalize()
+        for i, asset in enumerate(assets):
+            if history_end >= asset.end_date:
+                values[normed_index > asset.end_date, i] = nan
+        return values
+
+    def get_history_prefetch_stats(self):
+        """
+        The window accesses and prefetch lengths of the history loaders.
+
+        Returns
+        -------
+        stats : dict[str -> pd.DataFrame]
+            The :meth:`~zipline.data.history_prefetch.PrefetchPolicy.stats` of
+            the prefetch policies of the 'daily' and 'minute' history
+            windows.
+        """
+        return {
+            'daily': self._history_loader.prefetch_policy.stats(),
+            'minute': self._minute_history_loader.prefetch_policy.stats(),
+        }
 
     def get_history_window(self,
                            assets,
@@ -901,76 +1295,12 @@ class DataPortal(object):
         -------
         A dataframe containing the requested data.
         """
-        if field not in OHLCVP_FIELDS and field != 'sid':
-            raise ValueError("Invalid field: {0}".format(field))
-
-        if frequency == "1d":
-            if field == "price":
-                df = self._get_history_daily_window(assets, end_dt, bar_count,
-                                                    "close", data_frequency)
-            else:
-                df = self._get_history_daily_window(assets, end_dt, bar_count,
-                                                    field, data_frequency)
-        elif frequency == "1m":
-            if field == "price":
-                df = self._get_history_minute_window(assets, end_dt, bar_count,
-                                                     "close")
-            else:
-                df = self._get_history_minute_window(assets, end_dt, bar_count,
-                                                     field)
-        else:
-            raise ValueError("Invalid frequency: {0}".format(frequency))
-
-        # forward-fill price
-        if field == "price":
-            if frequency == "1m":
-                data_frequency = 'minute'
-            elif frequency == "1d":
-                data_frequency = 'daily'
-            else:
-                raise Exception(
-                    "Only 1d and 1m are supported for forward-filling.")
-
-            assets_with_leading_nan = np.where(isnull(df.iloc[0]))[0]
-
-            history_start, history_end = df.index[[0, -1]]
-            initial_values = []
-            for asset in df.columns[assets_with_leading_nan]:
-                last_traded = self.get_last_traded_dt(
-                    asset,
-                    history_start,
-                    data_frequency,
-                )
-                if isnull(last_traded):
-                    initial_values.append(nan)
-                else:
-                    initial_values.append(
-                        self.get_adjusted_value(
-                            asset,
-                            field,
-                            dt=last_traded,
-                            perspective_dt=history_end,
-                            data_frequency=data_frequency,
-                        )
-                    )
-
-            # Set leading values for assets that were missing data, then ffill.
-            df.ix[0, assets_with_leading_nan] = np.array(
-                initial_values,
-                dtype=np.float64
-            )
-            df.fillna(method='ffill', inplace=True)
-
-            # forward-filling will incorrectly produce values after the end of
-            # an asset's lifetime, so write NaNs back over the asset's
-            # end_date.
-            normed_index = df.index.normalize()
-            for asset in df.columns:
-                if history_end >= asset.end_date:
-                    # if the window extends past the asset's end date, set
-                    # all post-end-date values to NaN in that asset's series
-                    df.loc[normed_index > asset.end_date, asset] = nan
-        return df
+        index, values = self._get_history_window_values(
+            assets, end_dt, bar_count, frequency, field, data_frequency
+        )
+        if frequency == "1d" and len(assets) == 0:
+            return pd.DataFrame(None, index=index, columns=None)
+        return pd.DataFrame(_writeable(values), index=index, columns=assets)
 
     def _get_minute_window_data(self, assets, field, minutes_for_window):
         """
@@ -1034,10 +1364,17 @@ class DataPortal(object):
         Returns
         -------
         A numpy array with requested values.  Any missing slots filled with
-        nan.
+        nan. Without an extra slot, this is the array returned by the
+        history loader, which may be read-only.
 
         """
         bar_count = len(days_in_window)
+        if bar_count != 0 and not extra_slot:
+            return self._history_loader.history(assets,
+                                                days_in_window,
+                                                field,
+                                                extra_slot)
+
         # create an np.array of size bar_count
         dtype = float64 if field != 'sid' else int64
         if extra_slot:
@@ -1054,10 +1391,7 @@ class DataPortal(object):
                                                 days_in_window,
                                                 field,
                                                 extra_slot)
-            if extra_slot:
-                return_array[:len(return_array) - 1, :] = data
-            else:
-                return_array[:len(data)] = data
+            return_array[:len(return_array) - 1, :] = data
         return return_array
 
     def _get_adjustment_list(self, asset, adjustments_dict, table_name):
@@ -22,6 +22,7 @@ from numpy import (
 )
 from six import iteritems, with_metaclass
 
+from zipline.assets import Asset
 from zipline.utils.memoize import lazyval
 
 
@@ -96,10 +97,67 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_value(asset, dt, field)
 
+    def _retrieve_assets(self, sids):
+        """
+        The assets of ``sids``, which may already be assets, in which case
+        they are used as they are instead of being looked up again.
+        """
+        assets = list(sids)
+        to_retrieve = [
+            i for i, sid in enumerate(assets) if not isinstance(sid, Asset)
+        ]
+        if to_retrieve:
+            retrieved = self._asset_finder.retrieve_all(
+                [assets[i] for i in to_retrieve],
+            )
+            for i, asset in zip(to_retrieve, retrieved):
+                assets[i] = asset
+        return assets
+
+    def get_values(self, sids, dt, field):
+        asset_types = self._asset_types
+        sid_groups = {t: [] for t in asset_types}
+        out_pos = {t: [] for t in asset_types}
+
+        # The data portal passes the assets it already holds, so they only
+        # have to be looked up when given as sids.
+        assets = self._retrieve_assets(sids)
+
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            sid_groups[t].append(asset)
+            out_pos[t].append(i)
+
+        out = self._make_raw_array_out(field, len(assets))
+        for t in asset_types:
+            if sid_groups[t]:
+                out[out_pos[t]] = self._readers[t].get_values(
+                    sid_groups[t], dt, field,
+                )
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
 
+    def get_last_traded_dts(self, assets, dt):
+        assets = list(assets)
+        asset_groups = {t: [] for t in self._asset_types}
+        out_pos = {t: [] for t in self._asset_types}
+
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            asset_groups[t].append(asset)
+            out_pos[t].append(i)
+
+        out = [None] * len(assets)
+        for t, group in asset_groups.items():
+            if group:
+                dts = self._readers[t].get_last_traded_dts(group, dt)
+                for i, last_traded in zip(out_pos[t], dts):
+                    out[i] = last_traded
+        return out
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         asset_types = self._asset_types
         sid_groups = {t: [] for t in asset_types}
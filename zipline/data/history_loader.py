@@ -18,25 +18,33 @@ from abc import (
     abstractproperty,
 )
 
-from numpy import concatenate
+from collections import OrderedDict, defaultdict
+
 from lru import LRU
-from pandas import isnull
+from numpy import empty
+from pandas import DatetimeIndex, isnull
 from pandas.tslib import normalize_date
 from toolz import sliding_window
 
-from six import with_metaclass
+from six import iteritems, with_metaclass
 
 from zipline.assets import Equity, Future
 from zipline.assets.continuous_futures import ContinuousFuture
+from zipline.data.history_prefetch import (
+    FixedPrefetchLength,
+    PrefetchPolicy,
+)
 from zipline.lib._int64window import AdjustedArrayWindow as Int64Window
 from zipline.lib._float64window import AdjustedArrayWindow as Float64Window
 from zipline.lib.adjustment import Float64Multiply, Float64Add
 from zipline.utils.cache import ExpiringCache
 from zipline.utils.math_utils import number_of_decimal_places
 from zipline.utils.memoize import lazyval
-from zipline.utils.numpy_utils import float64_dtype
+from zipline.utils.numpy_utils import float64_dtype, int64_dtype
 from zipline.utils.pandas_utils import find_in_sorted_index
 
+NANOSECONDS_PER_SECOND = 1000000000
+
 # Default number of decimal places used for rounding asset prices.
 DEFAULT_ASSET_PRICE_DECIMALS = 3
 
@@ -97,47 +105,14 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
         end = normalize_date(dts[-1])
         adjs = {}
         if field != 'volume':
-            mergers = self._adjustments_reader.get_adjustments_for_sid(
-                'mergers', sid)
-            for m in mergers:
-                dt = m[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           m[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-            divs = self._adjustments_reader.get_adjustments_for_sid(
-                'dividends', sid)
-            for d in divs:
-                dt = d[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           d[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-        splits = self._adjustments_reader.get_adjustments_for_sid(
-            'splits', sid)
-        for s in splits:
-            dt = s[0]
-            if start < dt <= end:
+            tables = ('mergers', 'dividends', 'splits')
+        else:
+            tables = ('splits',)
+        for table_name in tables:
+            for dt, ratio in self._get_adjustments_for_sid_in_range(
+                    table_name, sid, start, end):
                 if field == 'volume':
-                    ratio = 1.0 / s[1]
-                else:
-                    ratio = s[1]
+                    ratio = 1.0 / ratio
                 end_loc = dts.searchsorted(dt)
                 adj_loc = end_loc
                 mult = Float64Multiply(0,
@@ -151,6 +126,35 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
                     adjs[adj_loc] = [mult]
         return adjs
 
+    def _get_adjustments_for_sid_in_range(self, table_name, sid, start, end):
+        """
+        Get the (effective date, ratio) pairs of the adjustments of ``sid`` in
+        ``table_name`` which are effective after ``start``, up to and
+        including ``end``.
+
+        When the adjustment reader has an AdjustmentIndex, the adjustments
+        are found by binary search instead of querying the database.
+        """
+        index = getattr(self._adjustments_reader, 'adjustment_index', None)
+        if index is None:
+            return [
+                (dt, ratio)
+                for dt, ratio in self._adjustments_reader.
+                get_adjustments_for_sid(table_name, sid)
+                if start < dt <= end
+            ]
+
+        _, ratios, effective_dates = index.get_adjustments(
+            table_name,
+            [sid],
+            start.value // NANOSECONDS_PER_SECOND + 1,
+            end.value // NANOSECONDS_PER_SECOND,
+        )
+        return zip(
+            DatetimeIndex(effective_dates * NANOSECONDS_PER_SECOND, tz='UTC'),
+            ratios,
+        )
+
 
 class ContinuousFutureAdjustmentReader(object):
     """
@@ -266,16 +270,19 @@ class SlidingWindow(object):
     window : AdjustedArrayWindow
        Window of pricing data with prefetched values beyond the current
        simulation dt.
+    size : int
+       The number of bars in the window.
     cal_start : int
        Index in the overall calendar at which the window starts.
     """
 
     def __init__(self, window, size, cal_start, offset):
         self.window = window
+        self.size = size
         self.cal_start = cal_start
         self.current = next(window)
         self.offset = offset
-        self.most_recent_ix = self.cal_start + size
+        self.most_recent_ix = self.cal_start + offset + size - 1
 
     def get(self, end_ix):
         """
@@ -306,6 +313,10 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
         Reader for adjustment data.
+    prefetch_length : int or PrefetchPolicy, optional
+        The number of bars loaded beyond the end of a requested window, or a
+        policy which chooses it for each field, e.g. an
+        :class:`~zipline.data.history_prefetch.AdaptivePrefetchLength`.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume', 'sid')
 
@@ -333,7 +344,9 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             field: ExpiringCache(LRU(sid_cache_size))
             for field in self.FIELDS
         }
-        self._prefetch_length = prefetch_length
+        if not isinstance(prefetch_length, PrefetchPolicy):
+            prefetch_length = FixedPrefetchLength(prefetch_length)
+        self.prefetch_policy = prefetch_length
 
     @abstractproperty
     def _frequency(self):
@@ -362,16 +375,52 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
+    def _block_adjustments(self, assets, adj_dts, field):
+        """
+        Load the adjustments of ``field`` for a window block over ``assets``,
+        with each asset's adjustments applied to its column of the block.
+        """
+        adjs = {}
+        for i, asset in enumerate(assets):
+            try:
+                adj_reader = self._adjustment_readers[type(asset)]
+            except KeyError:
+                continue
+            asset_adjs = adj_reader.load_adjustments(
+                [field], adj_dts, [asset])[0]
+            for loc, loc_adjs in iteritems(asset_adjs):
+                adjs.setdefault(loc, []).extend(
+                    type(adj)(adj.first_row,
+                              adj.last_row,
+                              adj.first_col + i,
+                              adj.last_col + i,
+                              adj.value)
+                    for adj in loc_adjs
+                )
+        return adjs
+
     def _ensure_sliding_windows(self, assets, dts, field,
                                 is_perspective_after):
         """
-        Ensure that there is a Float64Multiply window for each asset that can
-        provide data for the given parameters.
-        If the corresponding window for the (assets, len(dts), field) does not
+        Ensure that there is a window block for each asset that can provide
+        data for the given parameters.
+        If the corresponding window for the (assets, field) does not
         exist, then create a new one.
-        If a corresponding window does exist for (assets, len(dts), field), but
-        can not provide data for the current dts range, then create a new
-        one and replace the expired window.
+        If a corresponding window does exist for (assets, field), but
+        can not provide data for the current dts range, for example because
+        it is shorter than len(dts), then create a new one and replace the
+        expired window.
+
+        Windows are cached by asset and field only, so a window can serve
+        requests of any size up to its own, and only the longest window
+        requested for an asset is kept.
+
+        The assets which need a new window share 2-D window blocks, one for
+        each number of decimal places to which their prices are rounded, so
+        that a block is only created and advanced once for all of its assets.
+        The blocks are cached per asset, so assets which are added to or
+        removed from the requested assets don't cause the windows of the
+        other assets to be recreated.
 
         Parameters
         ----------
@@ -388,9 +437,11 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         Returns
         -------
-        out : list of Float64Window with sufficient data so that each asset's
-        window can provide `get` for the index corresponding with the last
-        value in `dts`
+        out : list of (SlidingWindow, int)
+            For each asset, the window block with sufficient data to provide
+            `get` for the index corresponding with the last value in `dts`,
+            and the asset's column in the block. The windows may be longer
+            than `dts`.
         """
         end = dts[-1]
         size = len(dts)
@@ -402,25 +453,40 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         end_ix = find_in_sorted_index(cal, end)
 
         for asset in assets:
+            if asset in asset_windows:
+                continue
             try:
-                window = self._window_blocks[field].get(
-                    (asset, size, is_perspective_after), end)
+                window, column = self._window_blocks[field].get(
+                    (asset, is_perspective_after), end)
             except KeyError:
                 needed_assets.append(asset)
+                asset_windows[asset] = None
             else:
-                if end_ix < window.most_recent_ix:
+                if end_ix < window.most_recent_ix or window.size < size:
                     # Window needs reset. Requested end index occurs before the
-                    # end index from the previous history call for this window.
+                    # end index from the previous history call for this window,
+                    # or the window is too short for the requested size.
                     # Grab new window instead of rewinding adjustments.
                     needed_assets.append(asset)
+                    asset_windows[asset] = None
                 else:
-                    asset_windows[asset] = window
+                    asset_windows[asset] = window, column
+
+        self.prefetch_policy.record(
+            field,
+            end,
+            [asset for asset in asset_windows if asset_windows[asset]],
+            needed_assets,
+        )
 
         if needed_assets:
             offset = 0
             start_ix = find_in_sorted_index(cal, dts[0])
 
-            prefetch_end_ix = min(end_ix + self._prefetch_length, len(cal) - 1)
+            prefetch_end_ix = min(
+                end_ix + self.prefetch_policy.length(field),
+                len(cal) - 1,
+            )
             prefetch_end = cal[prefetch_end_ix]
             prefetch_dts = cal[start_ix:prefetch_end_ix + 1]
             if is_perspective_after:
@@ -428,7 +494,6 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                 adj_dts = cal[start_ix:adj_end_ix + 1]
             else:
                 adj_dts = prefetch_dts
-            prefetch_len = len(prefetch_dts)
             array = self._array(prefetch_dts, needed_assets, field)
 
             if field == 'sid':
@@ -440,32 +505,29 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             if field == 'volume':
                 array = array.astype(float64_dtype)
 
+            columns_by_places = defaultdict(list)
             for i, asset in enumerate(needed_assets):
-                adj_reader = None
-                try:
-                    adj_reader = self._adjustment_readers[type(asset)]
-                except KeyError:
-                    adj_reader = None
-                if adj_reader is not None:
-                    adjs = adj_reader.load_adjustments(
-                        [field], adj_dts, [asset])[0]
-                else:
-                    adjs = {}
+                places = self._decimal_places_for_asset(asset, dts[-1])
+                columns_by_places[places].append(i)
+
+            for places, columns in iteritems(columns_by_places):
+                block_assets = [needed_assets[i] for i in columns]
                 window = window_type(
-                    array[:, i].reshape(prefetch_len, 1),
+                    array[:, columns],
                     view_kwargs,
-                    adjs,
+                    self._block_adjustments(block_assets, adj_dts, field),
                     offset,
                     size,
                     int(is_perspective_after),
-                    self._decimal_places_for_asset(asset, dts[-1]),
+                    places,
                 )
                 sliding_window = SlidingWindow(window, size, start_ix, offset)
-                asset_windows[asset] = sliding_window
-                self._window_blocks[field].set(
-                    (asset, size, is_perspective_after),
-                    sliding_window,
-                    prefetch_end)
+                for column, asset in enumerate(block_assets):
+                    asset_windows[asset] = sliding_window, column
+                    self._window_blocks[field].set(
+                        (asset, is_perspective_after),
+                        (sliding_window, column),
+                        prefetch_end)
 
         return [asset_windows[asset] for asset in assets]
 
@@ -543,6 +605,9 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Returns
         -------
         out : np.ndarray with shape(len(days between start, end), len(assets))
+            When the window of a single block is requested as it is, this is
+            the read-only array of the block's window, otherwise it is a new
+            array.
         """
         block = self._ensure_sliding_windows(assets,
                                              dts,
@@ -550,10 +615,32 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                                              is_perspective_after)
         end_ix = self._calendar.searchsorted(dts[-1])
 
-        return concatenate(
-            [window.get(end_ix) for window in block],
-            axis=1,
+        # Advance each window block once, and gather the columns of the
+        # requested assets from it.
+        out_columns = OrderedDict()
+        for i, (window, column) in enumerate(block):
+            try:
+                out_columns[window][0].append(i)
+                out_columns[window][1].append(column)
+            except KeyError:
+                out_columns[window] = [i], [column]
+
+        if len(out_columns) == 1:
+            window, (_, columns) = next(iteritems(out_columns))
+            values = window.get(end_ix)
+            if values.shape == (len(dts), len(columns)) and \
+                    columns == list(range(len(columns))):
+                # The whole window of the block is requested, in its order.
+                return values
+
+        out = empty(
+            (len(dts), len(block)),
+            dtype=int64_dtype if field == 'sid' else float64_dtype,
         )
+        for window, (out_ix, columns) in iteritems(out_columns):
+            # Windows longer than the request are served by their tail.
+            out[:, out_ix] = window.get(end_ix)[-len(dts):, columns]
+        return out
 
 
 class DailyHistoryLoader(HistoryLoader):
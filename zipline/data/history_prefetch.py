@@ -0,0 +1,283 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Policies for the number of bars prefetched by a HistoryLoader beyond the end
+of a requested window.
+"""
+from collections import defaultdict, namedtuple
+
+import pandas as pd
+
+PrefetchDecision = namedtuple(
+    'PrefetchDecision',
+    ['dt', 'field', 'old_length', 'new_length', 'reason'],
+)
+PrefetchDecision.__doc__ = """\
+A change of the prefetch length of a field by an AdaptivePrefetchLength.
+
+Attributes
+----------
+dt : pd.Timestamp
+    The end of the requested window which triggered the change.
+field : str
+    The field whose prefetch length changed.
+old_length, new_length : int
+    The prefetch length before and after the change.
+reason : str
+    ``'refetch'`` if the length grew because windows were read again too
+    often, or ``'churn'`` if it shrank because too many assets left the
+    requested assets.
+"""
+
+
+class _FieldStats(object):
+    """The window accesses of one field seen by a prefetch policy.
+    """
+    def __init__(self):
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+        self.refetches = 0
+        self.churned = 0
+
+    def add(self, hits, misses, refetches):
+        self.requests += 1
+        self.hits += hits
+        self.misses += misses
+        self.refetches += refetches
+
+
+class PrefetchPolicy(object):
+    """The number of bars a HistoryLoader prefetches beyond the end of the
+    windows it loads, for each field.
+
+    The loader reports the window accesses of each history request to
+    :meth:`record` before asking for :meth:`length`, so that a policy can
+    adapt its lengths to the way the windows are used.
+
+    Parameters
+    ----------
+    length : int
+        The prefetch length of every field.
+
+    Notes
+    -----
+    A miss is counted as a refetch if the asset's window was loaded or
+    requested during the current or the previous interval of
+    ``_seen_interval`` requests of the field, so that the assets remembered
+    for each field are bounded by the recently requested assets instead of
+    growing for the whole simulation.
+    """
+    _stats_columns = ['requests', 'hits', 'misses', 'refetches']
+    _seen_interval = 50
+
+    def __init__(self, length):
+        self._default_length = length
+        self._lengths = {}
+        self._stats = defaultdict(_FieldStats)
+        # The assets loaded or requested for each field during the current
+        # and the previous interval of ``_seen_interval`` requests.
+        self._seen = defaultdict(lambda: (set(), set()))
+
+    def length(self, field):
+        """The number of bars to prefetch for a window of ``field``.
+        """
+        return self._lengths.get(field, self._default_length)
+
+    def record(self, field, dt, hits, misses):
+        """Record the window accesses of a history request.
+
+        Parameters
+        ----------
+        field : str
+            The requested field.
+        dt : pd.Timestamp
+            The end of the requested window.
+        hits : list[Asset]
+            The assets whose cached windows served the request.
+        misses : list[Asset]
+            The assets whose windows had to be loaded.
+        """
+        seen, previous_seen = self._seen[field]
+        refetches = sum(
+            asset in seen or asset in previous_seen for asset in misses
+        )
+        seen.update(hits)
+        seen.update(misses)
+
+        stats = self._stats[field]
+        stats.add(len(hits), len(misses), refetches)
+        if stats.requests % self._seen_interval == 0:
+            self._seen[field] = set(), seen
+
+        self._update(field, dt, hits, misses, refetches)
+
+    def _update(self, field, dt, hits, misses, refetches):
+        """Hook called by :meth:`record` after the totals were updated.
+        """
+
+    def stats(self):
+        """The window accesses recorded for each field.
+
+        Returns
+        -------
+        stats : pd.DataFrame
+            A frame indexed by field, with the current prefetch length and
+            the numbers of requests, of window hits and misses, and of misses
+            of assets whose windows had been loaded before.
+        """
+        return pd.DataFrame.from_records(
+            [
+                [field, self.length(field)] + [
+                    getattr(stats, column) for column in self._stats_columns
+                ]
+                for field, stats in sorted(self._stats.items())
+            ],
+            columns=['field', 'prefetch_length'] + self._stats_columns,
+            index='field',
+        )
+
+
+class FixedPrefetchLength(PrefetchPolicy):
+    """A prefetch policy with the same, fixed, length for every field.
+
+    This is the policy used by a HistoryLoader when it is given an integer
+    prefetch length.
+
+    Parameters
+    ----------
+    length : int
+        The prefetch length of every field.
+    """
+
+
+class AdaptivePrefetchLength(PrefetchPolicy):
+    """A prefetch policy which adapts the length of each field to the way its
+    windows are used.
+
+    Every ``interval`` requests of a field, the policy looks at the requests
+    since its last decision:
+
+    - if the share of window accesses which loaded again the window of an
+      asset that had already been loaded is above ``max_refetch_rate``, the
+      prefetch length doubles, so that windows are loaded less often.
+    - otherwise, if the share of the assets requested during the previous
+      interval which were not requested any more is above
+      ``max_churn_rate``, the prefetch length halves, so that less data is
+      held for assets which drop out of the requested assets.
+
+    Parameters
+    ----------
+    initial_length : int
+        The prefetch length of each field before any decision.
+    min_length : int, optional
+        The shortest prefetch length.
+    max_length : int, optional
+        The longest prefetch length. Defaults to 16 times ``initial_length``.
+    interval : int, optional
+        The number of requests of a field between two decisions, which is
+        also the interval after which loaded windows are forgotten when
+        counting refetches.
+    max_refetch_rate : float, optional
+        The share of refetched windows above which the length grows.
+    max_churn_rate : float, optional
+        The share of churned assets above which the length shrinks.
+
+    Attributes
+    ----------
+    decisions : list[PrefetchDecision]
+        The changes of prefetch length made by the policy, in order.
+
+    Notes
+    -----
+    :meth:`stats` also reports the number of assets which left the requested
+    assets of each field, in a ``churned`` column.
+    """
+    _stats_columns = PrefetchPolicy._stats_columns + ['churned']
+
+    def __init__(self,
+                 initial_length,
+                 min_length=0,
+                 max_length=None,
+                 interval=50,
+                 max_refetch_rate=0.02,
+                 max_churn_rate=0.25):
+        if max_length is None:
+            max_length = 16 * max(initial_length, 1)
+        if not min_length <= initial_length <= max_length:
+            raise ValueError(
+                'initial_length must be in the range [min_length, max_length],'
+                ' got: initial_length=%s min_length=%s max_length=%s' % (
+                    initial_length,
+                    min_length,
+                    max_length,
+                ),
+            )
+        if interval < 1:
+            raise ValueError('interval must be positive, got: %s' % interval)
+
+        super(AdaptivePrefetchLength, self).__init__(initial_length)
+        self._seen_interval = interval
+        self._min_length = min_length
+        self._max_length = max_length
+        self._interval = interval
+        self._max_refetch_rate = max_refetch_rate
+        self._max_churn_rate = max_churn_rate
+
+        # The window accesses of each field since its last decision.
+        self._interval_stats = defaultdict(_FieldStats)
+        # The assets requested for each field during the current and the
+        # previous interval.
+        self._interval_assets = defaultdict(set)
+        self._previous_assets = {}
+        self.decisions = []
+
+    def _update(self, field, dt, hits, misses, refetches):
+        stats = self._interval_stats[field]
+        stats.add(len(hits), len(misses), refetches)
+        assets = self._interval_assets[field]
+        assets.update(hits)
+        assets.update(misses)
+
+        if stats.requests >= self._interval:
+            self._decide(field, dt)
+
+    def _decide(self, field, dt):
+        stats = self._interval_stats.pop(field)
+        assets = self._interval_assets.pop(field)
+        previous_assets = self._previous_assets.get(field)
+        self._previous_assets[field] = assets
+
+        churned = 0
+        if previous_assets:
+            churned = len(previous_assets - assets)
+            self._stats[field].churned += churned
+
+        old_length = self.length(field)
+        accesses = stats.hits + stats.misses
+        if accesses and stats.refetches > self._max_refetch_rate * accesses:
+            new_length = min(max(2 * old_length, 1), self._max_length)
+            reason = 'refetch'
+        elif previous_assets and \
+                churned > self._max_churn_rate * len(previous_assets):
+            new_length = max(old_length // 2, self._min_length)
+            reason = 'churn'
+        else:
+            return
+
+        if new_length != old_length:
+            self._lengths[field] = new_length
+            self.decisions.append(
+                PrefetchDecision(dt, field, old_length, new_length, reason),
+            )
@@ -0,0 +1,438 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Bar readers which serve OHLCV data held in memory.
+
+Each field is stored as a single read-only array of shape (sids, dts), so
+that the bars of a sid are contiguous. The readers are built once from any
+other reader with ``from_reader`` and then never decompress or read files.
+Because the arrays are never written, processes forked after they have been
+built share their pages with the parent instead of copying them.
+"""
+import numpy as np
+import pandas as pd
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.minute_bars import MinuteBarReader
+from zipline.data.session_bars import SessionBarReader
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# The number of sids read from the source reader at a time.
+DEFAULT_LOAD_CHUNKSIZE = 256
+
+# The number of bars searched, backwards, at once for the last trade.
+_LAST_TRADED_SEARCH_SIZE = 390
+
+
+def _missing_value(field):
+    return 0 if field == 'volume' else np.nan
+
+
+def _last_nonzero(values, stop):
+    """The position of the last nonzero value in ``values[:stop]``, or -1.
+
+    The values are searched backwards in blocks of growing size, so that
+    recent trades are found without scanning the whole history.
+    """
+    size = _LAST_TRADED_SEARCH_SIZE
+    while stop > 0:
+        start = max(stop - size, 0)
+        nonzero = np.flatnonzero(values[start:stop])
+        if len(nonzero):
+            return start + nonzero[-1]
+        stop = start
+        size *= 2
+    return -1
+
+
+def load_sid_major_arrays(reader, start_dt, end_dt, num_dts, sids,
+                          chunksize=DEFAULT_LOAD_CHUNKSIZE):
+    """Read all the bars of ``sids`` from ``reader`` into read-only arrays of
+    shape (sids, dts).
+
+    Parameters
+    ----------
+    reader : BarReader
+        The reader to read the bars from.
+    start_dt, end_dt : pd.Timestamp
+        The first and last dt to read.
+    num_dts : int
+        The number of dts ``reader.load_raw_arrays`` returns from
+        ``start_dt`` to ``end_dt``.
+    sids : list[int]
+        The sids to read.
+    chunksize : int, optional
+        The number of sids to read at a time, which bounds the memory used by
+        the intermediate arrays.
+
+    Returns
+    -------
+    arrays : dict[str -> np.ndarray]
+        A map from each of ``FIELDS`` to its bars.
+    """
+    arrays = {}
+    for first in range(0, len(sids), chunksize):
+        chunk = sids[first:first + chunksize]
+        raw = reader.load_raw_arrays(FIELDS, start_dt, end_dt, chunk)
+        for field, values in zip(FIELDS, raw):
+            try:
+                out = arrays[field]
+            except KeyError:
+                out = arrays[field] = np.empty(
+                    (len(sids), num_dts),
+                    dtype=values.dtype,
+                )
+            out[first:first + len(chunk)] = values.T
+
+    for field in FIELDS:
+        if field not in arrays:
+            arrays[field] = np.empty(
+                (0, num_dts),
+                dtype=np.uint32 if field == 'volume' else np.float64,
+            )
+        arrays[field].flags.writeable = False
+    return arrays
+
+
+class _InMemoryBarReader(object):
+    """Implementation shared by the in-memory session and minute bar readers.
+
+    Parameters
+    ----------
+    trading_calendar : TradingCalendar
+        The calendar of the bars.
+    dts : pd.DatetimeIndex
+        The sessions or minutes of the bars.
+    sids : iterable[int]
+        The sids of the bars.
+    arrays : dict[str -> np.ndarray]
+        A map from each of ``FIELDS`` to an array of shape (sids, dts) with
+        the bars, as returned by the source reader's ``load_raw_arrays``:
+        float64 prices which are nan where there are no trades, and integer
+        volumes.
+    """
+    trading_calendar = None
+
+    def __init__(self, trading_calendar, dts, sids, arrays):
+        self.trading_calendar = trading_calendar
+        self._dts = dts
+        self._sids = pd.Index(sids)
+        self._arrays = arrays
+
+    def _dt_loc(self, dt):
+        try:
+            return self._dts.get_loc(dt)
+        except KeyError:
+            raise NoDataOnDate(
+                'No bars on {dt} in {dts[0]} to {dts[-1]}.'.format(
+                    dt=dt,
+                    dts=self._dts,
+                ),
+            )
+
+    def _sid_loc(self, sid):
+        try:
+            return self._sids.get_loc(sid)
+        except KeyError:
+            raise NoDataForSid('No bars for sid {}.'.format(sid))
+
+    def _sid_locs(self, sids):
+        locs = self._sids.get_indexer(sids)
+        if (locs == -1).any():
+            raise NoDataForSid(
+                'No bars for sids {}.'.format(
+                    list(np.asarray(sids)[locs == -1]),
+                ),
+            )
+        return locs
+
+    def _in_range(self, sid_locs, dt_loc):
+        """Which of ``sid_locs`` may have a bar at ``dt_loc``.
+        """
+        return np.ones(len(sid_locs), dtype=bool)
+
+    def _check_range(self, sid, sid_loc, dt_loc, dt):
+        pass
+
+    @property
+    def first_trading_day(self):
+        return self.trading_calendar.minute_to_session_label(self._dts[0])
+
+    @property
+    def last_available_dt(self):
+        return self._dts[-1]
+
+    def load_raw_arrays(self, columns, start_dt, end_dt, assets):
+        start = self._dt_loc(start_dt)
+        stop = self._dt_loc(end_dt) + 1
+        locs = self._sid_locs(assets)
+        return [
+            np.ascontiguousarray(self._arrays[column][locs, start:stop].T)
+            for column in columns
+        ]
+
+    def get_value(self, sid, dt, field):
+        dt_loc = self._dt_loc(dt)
+        sid_loc = self._sid_loc(sid)
+        self._check_range(sid, sid_loc, dt_loc, dt)
+        return self._arrays[field][sid_loc, dt_loc]
+
+    def get_values(self, sids, dt, field):
+        array = self._arrays[field]
+        sids = list(sids)
+        dt_loc = self._dt_loc(dt)
+
+        out = np.full(len(sids), _missing_value(field), dtype=array.dtype)
+        sid_locs = self._sids.get_indexer([int(sid) for sid in sids])
+        valid = sid_locs != -1
+        valid[valid] = self._in_range(sid_locs[valid], dt_loc)
+        out[valid] = array[sid_locs[valid], dt_loc]
+        return out
+
+    def get_last_traded_dt(self, asset, dt):
+        try:
+            sid_loc = self._sids.get_loc(int(asset))
+        except KeyError:
+            return pd.NaT
+        stop = self._dts.searchsorted(dt, side='right')
+        loc = _last_nonzero(self._arrays['volume'][sid_loc], stop)
+        if loc == -1:
+            return pd.NaT
+        return self._dts[loc]
+
+    def get_last_traded_dts(self, assets, dt):
+        volumes = self._arrays['volume']
+        sid_locs = self._sids.get_indexer([int(asset) for asset in assets])
+        stop = self._dts.searchsorted(dt, side='right')
+
+        # Most assets trade in the last bar, so only the others are searched.
+        locs = np.full(len(sid_locs), -1, dtype=np.intp)
+        valid = sid_locs != -1
+        if stop:
+            traded = valid.copy()
+            traded[valid] = volumes[sid_locs[valid], stop - 1] != 0
+            locs[traded] = stop - 1
+            valid &= ~traded
+        for i in np.flatnonzero(valid):
+            locs[i] = _last_nonzero(volumes[sid_locs[i]], stop)
+
+        return [pd.NaT if loc == -1 else self._dts[loc] for loc in locs]
+
+
+class InMemorySessionBarReader(_InMemoryBarReader, SessionBarReader):
+    """A session bar reader serving bars held in memory.
+
+    Parameters
+    ----------
+    trading_calendar : TradingCalendar
+        The calendar of the bars.
+    sessions : pd.DatetimeIndex
+        The sessions of the bars.
+    sids : iterable[int]
+        The sids of the bars.
+    arrays : dict[str -> np.ndarray]
+        A map from each of 'open', 'high', 'low', 'close' and 'volume' to an
+        array of shape (sids, sessions) with the bars.
+    start_dates, end_dates : iterable[pd.Timestamp], optional
+        The first and last session of each sid's bars. ``get_value`` raises
+        ``NoDataBeforeDate`` or ``NoDataAfterDate`` outside of them. By
+        default the bars of each sid span all of ``sessions``.
+
+    See Also
+    --------
+    zipline.data.bundles.InMemoryBundle
+    """
+    def __init__(self,
+                 trading_calendar,
+                 sessions,
+                 sids,
+                 arrays,
+                 start_dates=None,
+                 end_dates=None):
+        super(InMemorySessionBarReader, self).__init__(
+            trading_calendar,
+            sessions,
+            sids,
+            arrays,
+        )
+        if start_dates is None:
+            self._first_locs = np.zeros(len(self._sids), dtype=np.intp)
+        else:
+            self._first_locs = sessions.searchsorted(
+                pd.DatetimeIndex(start_dates, tz='UTC'),
+                side='left',
+            )
+        if end_dates is None:
+            self._last_locs = np.full(
+                len(self._sids),
+                len(sessions) - 1,
+                dtype=np.intp,
+            )
+        else:
+            self._last_locs = sessions.searchsorted(
+                pd.DatetimeIndex(end_dates, tz='UTC'),
+                side='right',
+            ) - 1
+
+    @classmethod
+    def from_reader(cls,
+                    reader,
+                    sids,
+                    start_session=None,
+                    end_session=None,
+                    start_dates=None,
+                    end_dates=None,
+                    chunksize=DEFAULT_LOAD_CHUNKSIZE):
+        """Read the bars of ``sids`` from another session bar reader.
+
+        Parameters
+        ----------
+        reader : SessionBarReader
+            The reader to read the bars from.
+        sids : iterable[int]
+            The sids to read.
+        start_session, end_session : pd.Timestamp, optional
+            The first and last session to read. By default all of the
+            reader's sessions are read.
+        start_dates, end_dates : iterable[pd.Timestamp], optional
+            The first and last session of each sid's bars.
+        chunksize : int, optional
+            The number of sids to read at a time.
+
+        Returns
+        -------
+        reader : InMemorySessionBarReader
+        """
+        sessions = reader.sessions
+        sessions = sessions[sessions.slice_indexer(start_session, end_session)]
+        sids = list(sids)
+        return cls(
+            reader.trading_calendar,
+            sessions,
+            sids,
+            load_sid_major_arrays(
+                reader,
+                sessions[0],
+                sessions[-1],
+                len(sessions),
+                sids,
+                chunksize,
+            ),
+            start_dates=start_dates,
+            end_dates=end_dates,
+        )
+
+    @property
+    def sessions(self):
+        return self._dts
+
+    def _in_range(self, sid_locs, dt_loc):
+        return (
+            (self._first_locs[sid_locs] <= dt_loc) &
+            (dt_loc <= self._last_locs[sid_locs])
+        )
+
+    def _check_range(self, sid, sid_loc, dt_loc, dt):
+        if dt_loc < self._first_locs[sid_loc]:
+            raise NoDataBeforeDate(
+                'No data on or before day={0} for sid={1}'.format(dt, sid),
+            )
+        if dt_loc > self._last_locs[sid_loc]:
+            raise NoDataAfterDate(
+                'No data on or after day={0} for sid={1}'.format(dt, sid),
+            )
+
+
+class InMemoryMinuteBarReader(_InMemoryBarReader, MinuteBarReader):
+    """A minute bar reader serving bars held in memory.
+
+    Parameters
+    ----------
+    trading_calendar : TradingCalendar
+        The calendar of the bars.
+    minutes : pd.DatetimeIndex
+        The minutes of the bars, which are all of the trading minutes of
+        their sessions.
+    sids : iterable[int]
+        The sids of the bars.
+    arrays : dict[str -> np.ndarray]
+        A map from each of 'open', 'high', 'low', 'close' and 'volume' to an
+        array of shape (sids, minutes) with the bars.
+
+    See Also
+    --------
+    zipline.data.bundles.InMemoryBundle
+    """
+    @classmethod
+    def from_reader(cls,
+                    reader,
+                    sids,
+                    start_session=None,
+                    end_session=None,
+                    chunksize=DEFAULT_LOAD_CHUNKSIZE):
+        """Read the bars of ``sids`` from another minute bar reader.
+
+        Parameters
+        ----------
+        reader : MinuteBarReader
+            The reader to read the bars from.
+        sids : iterable[int]
+            The sids to read.
+        start_session, end_session : pd.Timestamp, optional
+            The first and last session to read. By default all of the
+            reader's sessions are read.
+        chunksize : int, optional
+            The number of sids to read at a time.
+
+        Returns
+        -------
+        reader : InMemoryMinuteBarReader
+        """
+        calendar = reader.trading_calendar
+        first_session = reader.first_trading_day
+        last_session = calendar.minute_to_session_label(
+            reader.last_available_dt,
+        )
+        if start_session is None or start_session < first_session:
+            start_session = first_session
+        if end_session is None or end_session > last_session:
+            end_session = last_session
+        minutes = calendar.minutes_for_sessions_in_range(
+            start_session,
+            end_session,
+        )
+        sids = list(sids)
+        return cls(
+            calendar,
+            minutes,
+            sids,
+            load_sid_major_arrays(
+                reader,
+                minutes[0],
+                minutes[-1],
+                len(minutes),
+                sids,
+                chunksize,
+            ),
+        )
+
+    @property
+    def calendar(self):
+        return self.trading_calendar
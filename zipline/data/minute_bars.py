@@ -15,10 +15,10 @@ from abc import ABCMeta, abstractmethod
 import json
 import os
 from glob import glob
+from multiprocessing.pool import ThreadPool
 from os.path import join
 from textwrap import dedent
 
-from lru import LRU
 import bcolz
 from bcolz import ctable
 from intervaltree import IntervalTree
@@ -41,8 +41,10 @@ from zipline.gens.sim_engine import NANOS_IN_MINUTE
 from zipline.data.bar_reader import BarReader, NoDataForSid, NoDataOnDate
 from zipline.data.us_equity_pricing import check_uint32_safe
 from zipline.utils.calendars import get_calendar
+from zipline.utils.cache import ByteLimitedLRU
 from zipline.utils.cli import maybe_show_progress
 from zipline.utils.memoize import lazyval
+from zipline.utils.paths import copy_linked_files
 
 
 logger = logbook.Logger('MinuteBars')
@@ -601,6 +603,8 @@ class BcolzMinuteBarWriter(object):
         sidpath = self.sidpath(sid)
         if not os.path.exists(sidpath):
             return self._init_ctable(sidpath)
+        # The table's files may be shared with other ingestions.
+        copy_linked_files(sidpath)
         return bcolz.ctable(rootdir=sidpath, mode='a')
 
     def _zerofill(self, table, numdays):
@@ -864,7 +868,7 @@ class BcolzMinuteBarWriter(object):
             file_name = os.path.basename(sid_path)
 
             try:
-                table = bcolz.open(rootdir=sid_path)
+                table = bcolz.open(rootdir=sid_path, mode='r')
             except IOError:
                 continue
             if table.len <= truncate_slice_end:
@@ -875,6 +879,9 @@ class BcolzMinuteBarWriter(object):
                 "Truncating {0} at end_date={1}", file_name, date.date()
             )
 
+            # The table's files may be shared with other ingestions.
+            copy_linked_files(sid_path)
+            table = bcolz.open(rootdir=sid_path, mode='a')
             table.resize(truncate_slice_end)
 
         # Update end session in metadata.
@@ -892,6 +899,20 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    sid_cache_size : int, optional
+        The number of carrays to keep open per field. Ignored if
+        ``carray_cache_bytes`` is provided.
+    read_workers : int, optional
+        The number of threads used by ``load_raw_arrays`` to read sids
+        concurrently. Decompression releases the GIL, so reads of many sids
+        scale with the number of cores. By default, all reads happen on the
+        calling thread. Call ``close``, or use the reader as a context
+        manager, to stop the threads.
+    carray_cache_bytes : int, optional
+        Bound the open carrays by their size on disk instead of by count.
+        The budget is split evenly between the fields, and each field evicts
+        its least recently used carrays independently. See
+        ``carray_cache_stats`` for sizing the budget.
 
     See Also
     --------
@@ -899,8 +920,14 @@ class BcolzMinuteBarReader(MinuteBarReader):
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
-    def __init__(self, rootdir, sid_cache_size=1550):
+    def __init__(self,
+                 rootdir,
+                 sid_cache_size=1550,
+                 read_workers=None,
+                 carray_cache_bytes=None):
         self._rootdir = rootdir
+        self._read_workers = read_workers
+        self._pool = None
 
         metadata = self._get_metadata()
 
@@ -930,8 +957,14 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         self._minutes_per_day = metadata.minutes_per_day
 
+        if carray_cache_bytes is not None:
+            cache_bounds = {
+                'maxbytes': carray_cache_bytes // len(self.FIELDS),
+            }
+        else:
+            cache_bounds = {'maxsize': sid_cache_size}
         self._carrays = {
-            field: LRU(sid_cache_size)
+            field: ByteLimitedLRU(sizeof=self._carray_nbytes, **cache_bounds)
             for field in self.FIELDS
         }
 
@@ -953,6 +986,29 @@ class BcolzMinuteBarReader(MinuteBarReader):
     def trading_calendar(self):
         return self.calendar
 
+    @property
+    def _read_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPool(self._read_workers)
+        return self._pool
+
+    def close(self):
+        """Stop the threads used by ``load_raw_arrays``, if any were started.
+
+        The reader can still be used after it is closed, and starts a new pool
+        if it reads on threads again.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @lazyval
     def last_available_dt(self):
         _, close = self.calendar.open_and_close_for_session(self._end_session)
@@ -1051,6 +1107,41 @@ class BcolzMinuteBarReader(MinuteBarReader):
         # carrays are subdirectories of the sid's rootdir
         return os.path.join(self._rootdir, sid_subdir, field)
 
+    @staticmethod
+    def _carray_nbytes(carray):
+        """The size charged against the carray cache for an open carray.
+        """
+        return carray.cbytes
+
+    @property
+    def carray_cache_stats(self):
+        """
+        The state of the open carray cache for each field.
+
+        Returns
+        -------
+        stats : pd.DataFrame
+            A frame indexed by field with the columns: ``size``, the number of
+            open carrays; ``nbytes``, their total size; and ``hits``,
+            ``misses`` and ``evictions``, the counts since the reader was
+            created.
+        """
+        columns = ['size', 'nbytes', 'hits', 'misses', 'evictions']
+        return pd.DataFrame.from_records(
+            [
+                (
+                    len(cache),
+                    cache.nbytes,
+                    cache.hits,
+                    cache.misses,
+                    cache.evictions,
+                )
+                for cache in (self._carrays[f] for f in self.FIELDS)
+            ],
+            index=self.FIELDS,
+            columns=columns,
+        )
+
     def _open_minute_file(self, field, sid):
         sid = int(sid)
 
@@ -1133,6 +1224,49 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for the given sids, dt, and field.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            Asset identifiers.
+        dt : datetime-like
+            The datetime at which the trades occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : np.ndarray
+
+        An array with an entry per sid. Sids which did not trade at dt are
+        nan for OHLC and 0 for volume.
+
+        Raises
+        ------
+        NoDataOnDate
+            If dt is not a minute in this reader's calendar, as with
+            ``get_value``.
+        """
+        sids = list(sids)
+        try:
+            minute_pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate('dt={0} is not a market minute.'.format(dt))
+
+        raw = self._gather_raw(field, minute_pos, minute_pos, sids)[0]
+        if field == 'volume':
+            return raw
+
+        out = raw * np.array([
+            self._ohlc_ratio_inverse_for_sid(sid) for sid in sids
+        ])
+        out[raw == 0] = np.nan
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
@@ -1235,46 +1369,73 @@ class BcolzMinuteBarReader(MinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        num_minutes = (end_idx - start_idx + 1)
-
-        results = []
+        num_raw_minutes = end_idx - start_idx + 1
 
+        # Compute the positions to keep once for the whole request, rather
+        # than deleting the early close ranges from each sid's values.
         indices_to_exclude = self._exclusion_indices_for_range(
             start_idx, end_idx)
         if indices_to_exclude is not None:
+            keep = np.ones(num_raw_minutes, dtype=bool)
             for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
+                keep[excl_start - start_idx:excl_stop - start_idx + 1] = False
+        else:
+            keep = None
 
-        shape = num_minutes, len(sids)
+        ohlc_inverses = None
+        results = []
 
         for field in fields:
+            raw = self._gather_raw(field, start_idx, end_idx, sids)
+            if keep is not None:
+                raw = raw[keep]
+
             if field != 'volume':
-                out = np.full(shape, np.nan)
+                if ohlc_inverses is None:
+                    ohlc_inverses = np.array([
+                        self._ohlc_ratio_inverse_for_sid(sid) for sid in sids
+                    ])
+                out = raw * ohlc_inverses
+                out[raw == 0] = np.nan
             else:
-                out = np.zeros(shape, dtype=np.uint32)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
+                out = raw
 
             results.append(out)
         return results
 
+    def _gather_raw(self, field, start_idx, end_idx, sids):
+        """
+        Read the raw uint32 values at the minute positions in
+        [start_idx, end_idx] for each sid into a single array.
+
+        Returns
+        -------
+        out : np.ndarray[uint32]
+            An array of shape (end_idx - start_idx + 1, len(sids)). Positions
+            beyond the data written for a sid are 0.
+        """
+        out = np.zeros((end_idx - start_idx + 1, len(sids)), dtype=np.uint32)
+
+        def read_columns(columns):
+            for i in columns:
+                values = self._open_minute_file(
+                    field, sids[i],
+                )[start_idx:end_idx + 1]
+                # The sid may not have data written for all the minutes
+                # requested.
+                out[:len(values), i] = values
+
+        num_workers = self._read_workers
+        if num_workers is None or num_workers <= 1 or len(sids) <= 1:
+            read_columns(range(len(sids)))
+        else:
+            # Each worker fills a disjoint set of columns of ``out``.
+            self._read_pool.map(
+                read_columns,
+                np.array_split(np.arange(len(sids)), num_workers),
+            )
+        return out
+
 
 class MinuteBarUpdateReader(with_metaclass(ABCMeta, object)):
     """
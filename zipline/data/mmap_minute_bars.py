@@ -0,0 +1,345 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Uncompressed, memory-mapped storage for minute bars.
+
+The layout mirrors the bcolz minute bar format: a ``metadata.json`` file
+at the root, written by ``BcolzMinuteBarMetadata``, and one directory per
+sid, nested with the same two levels of subdirectories. Instead of a bcolz
+ctable, each sid directory contains one flat file of little-endian uint32
+values per OHLCV field, indexed by the same fixed-stride minute positions
+that the bcolz format uses. Reads are served from ``np.memmap`` views of
+those files, so they only touch the page cache and never decompress.
+"""
+import json
+import os
+from glob import glob
+from os.path import join
+
+import logbook
+import numpy as np
+import pandas as pd
+
+from zipline.data.bar_reader import NoDataForSid
+from zipline.data.minute_bars import (
+    BcolzMinuteBarMetadata,
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+)
+
+logger = logbook.Logger('MmapMinuteBars')
+
+MMAP_DTYPE = np.dtype('<u4')
+
+ATTRS_FILENAME = 'attrs.json'
+
+
+def _mmap_sid_subdir_path(sid):
+    """
+    Format subdir path to limit the number directories in any given
+    subdirectory to 100.
+
+    Parameters
+    ----------
+    sid : int
+        Asset identifier.
+
+    Returns
+    -------
+    out : string
+        A path for the sid's directory, including subdirectory prefixes based
+        on the padded string representation of the given sid.
+
+        e.g. 1 is formatted as 00/00/000001.mmap
+
+    See Also
+    --------
+    zipline.data.minute_bars._sid_subdir_path
+    """
+    padded_sid = format(sid, '06')
+    return os.path.join(
+        padded_sid[0:2],
+        padded_sid[2:4],
+        "{0}.mmap".format(str(padded_sid))
+    )
+
+
+class _MmapSidAttrs(object):
+    """
+    Mapping of user attributes for a sid directory, persisted as json.
+    """
+    def __init__(self, rootdir):
+        self._path = join(rootdir, ATTRS_FILENAME)
+
+    def _read(self):
+        try:
+            with open(self._path) as fp:
+                return json.load(fp)
+        except (IOError, OSError):
+            return {}
+
+    def __getitem__(self, key):
+        return self._read()[key]
+
+    def __setitem__(self, key, value):
+        attrs = self._read()
+        attrs[key] = value
+        with open(self._path, 'w') as fp:
+            json.dump(attrs, fp)
+
+
+class MmapSidTable(object):
+    """
+    The flat per-field files backing a single sid.
+
+    Provides the subset of the ``bcolz.ctable`` interface used by
+    ``BcolzMinuteBarWriter`` so that the writer's padding and append logic
+    can be shared between the two formats.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the field files for the sid.
+    """
+    COL_NAMES = BcolzMinuteBarWriter.COL_NAMES
+
+    def __init__(self, rootdir):
+        self.rootdir = rootdir
+        self.attrs = _MmapSidAttrs(rootdir)
+
+    @classmethod
+    def create(cls, rootdir):
+        """
+        Create the directory and empty field files for a new sid.
+        """
+        if not os.path.exists(rootdir):
+            os.makedirs(rootdir)
+        for name in cls.COL_NAMES:
+            open(join(rootdir, name), 'wb').close()
+        return cls(rootdir)
+
+    def field_path(self, field):
+        return join(self.rootdir, field)
+
+    def __len__(self):
+        return os.path.getsize(self.field_path('close')) // MMAP_DTYPE.itemsize
+
+    @property
+    def size(self):
+        return len(self)
+
+    def append(self, cols):
+        for name, col in zip(self.COL_NAMES, cols):
+            with open(self.field_path(name), 'ab') as f:
+                np.asarray(col, dtype=MMAP_DTYPE).tofile(f)
+
+    def flush(self):
+        # Appends are written through on ``append``.
+        pass
+
+    def resize(self, length):
+        nbytes = length * MMAP_DTYPE.itemsize
+        for name in self.COL_NAMES:
+            with open(self.field_path(name), 'r+b') as f:
+                f.truncate(nbytes)
+
+
+class MmapMinuteBarWriter(BcolzMinuteBarWriter):
+    """
+    Class capable of writing minute OHLCV data to disk as flat, uncompressed
+    files which can be memory-mapped by ``MmapMinuteBarReader``.
+
+    Takes the same parameters as ``BcolzMinuteBarWriter``; ``expectedlen`` is
+    accepted for compatibility but ignored, since the files are not chunked.
+
+    Notes
+    -----
+    Each sid is stored in a directory containing one file per field:
+    (open, high, low, close, volume). Every file is a flat array of
+    little-endian uint32 values with one entry per position in the minute
+    'index' described in ``BcolzMinuteBarWriter``, i.e. ``minutes_per_day``
+    entries per session starting from the first session in the data set.
+
+    The values are scaled in the same way as the bcolz format, using the
+    ohlc ratios stored in the metadata.
+
+    See Also
+    --------
+    zipline.data.minute_bars.BcolzMinuteBarWriter
+    zipline.data.mmap_minute_bars.MmapMinuteBarReader
+    """
+
+    @classmethod
+    def open(cls, rootdir, end_session=None):
+        """
+        Open an existing ``rootdir`` for writing.
+
+        Parameters
+        ----------
+        end_session : Timestamp (optional)
+            When appending, the intended new ``end_session``.
+        """
+        metadata = BcolzMinuteBarMetadata.read(rootdir)
+        return cls(
+            rootdir,
+            metadata.calendar,
+            metadata.start_session,
+            end_session if end_session is not None else metadata.end_session,
+            metadata.minutes_per_day,
+            metadata.default_ohlc_ratio,
+            metadata.ohlc_ratios_per_sid,
+            write_metadata=end_session is not None
+        )
+
+    def sidpath(self, sid):
+        """
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+
+        Returns
+        -------
+        out : string
+            Full path to the directory holding the given sid's field files.
+        """
+        return join(self._rootdir, _mmap_sid_subdir_path(sid))
+
+    def last_date_in_output_for_sid(self, sid):
+        """
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+
+        Returns
+        -------
+        out : pd.Timestamp
+            The midnight of the last date written in to the output for the
+            given sid.
+        """
+        sidpath = self.sidpath(sid)
+        if not os.path.exists(sidpath):
+            return pd.NaT
+        num_days = len(MmapSidTable(sidpath)) // self._minutes_per_day
+        if num_days == 0:
+            # empty container
+            return pd.NaT
+        return self._session_labels[num_days - 1]
+
+    def _init_ctable(self, path):
+        """
+        Create the empty field files for the given path.
+
+        Parameters
+        ----------
+        path : string
+            The path to the new sid directory.
+        """
+        return MmapSidTable.create(path)
+
+    def _ensure_ctable(self, sid):
+        """Ensure that the field files exist for ``sid``, then return them."""
+        sidpath = self.sidpath(sid)
+        if not os.path.exists(sidpath):
+            return self._init_ctable(sidpath)
+        return MmapSidTable(sidpath)
+
+    def truncate(self, date):
+        """Truncate data beyond this date in all sid directories."""
+        truncate_slice_end = self.data_len_for_day(date)
+
+        glob_path = os.path.join(self._rootdir, "*", "*", "*.mmap")
+        sid_paths = sorted(glob(glob_path))
+
+        for sid_path in sid_paths:
+            file_name = os.path.basename(sid_path)
+            table = MmapSidTable(sid_path)
+
+            if len(table) <= truncate_slice_end:
+                logger.info("{0} not past truncate date={1}.", file_name, date)
+                continue
+
+            logger.info(
+                "Truncating {0} at end_date={1}", file_name, date.date()
+            )
+
+            table.resize(truncate_slice_end)
+
+        # Update end session in metadata.
+        metadata = BcolzMinuteBarMetadata.read(self._rootdir)
+        metadata.end_session = date
+        metadata.write(self._rootdir)
+
+
+class MmapMinuteBarReader(BcolzMinuteBarReader):
+    """
+    Reader for data written by MmapMinuteBarWriter.
+
+    The position arithmetic, early close handling and last traded search are
+    shared with ``BcolzMinuteBarReader``; only the storage access differs.
+    Each field file is mapped read-only on first access and the mapping is
+    kept in the same per-field LRU that the bcolz reader uses for carrays.
+
+    Parameters
+    ----------
+    rootdir : string
+        The root directory containing the metadata and asset directories.
+    sid_cache_size : int, optional
+        The number of mapped files to keep open per field.
+    read_workers : int, optional
+        The number of threads used by ``load_raw_arrays`` to read sids
+        concurrently. By default, all reads happen on the calling thread.
+    carray_cache_bytes : int, optional
+        Bound the mapped files by their total size instead of by count.
+
+    See Also
+    --------
+    zipline.data.mmap_minute_bars.MmapMinuteBarWriter
+    """
+
+    def _get_carray_path(self, sid, field):
+        return os.path.join(self._rootdir, _mmap_sid_subdir_path(sid), field)
+
+    @staticmethod
+    def _carray_nbytes(carray):
+        return carray.nbytes
+
+    def _open_minute_file(self, field, sid):
+        sid = int(sid)
+
+        try:
+            carray = self._carrays[field][sid]
+        except KeyError:
+            path = self._get_carray_path(sid, field)
+            try:
+                size = os.path.getsize(path)
+            except (IOError, OSError):
+                raise NoDataForSid('No minute data for sid {}.'.format(sid))
+
+            if size == 0:
+                # Empty files cannot be mapped.
+                carray = np.empty(0, dtype=MMAP_DTYPE)
+            else:
+                carray = np.memmap(path, dtype=MMAP_DTYPE, mode='r')
+            self._carrays[field][sid] = carray
+
+        return carray
+
+    def get_sid_attr(self, sid, name):
+        sid_path = os.path.join(self._rootdir, _mmap_sid_subdir_path(sid))
+        try:
+            return _MmapSidAttrs(sid_path)[name]
+        except KeyError:
+            return None
@@ -0,0 +1,672 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Columnar storage for daily bars, partitioned by year, in Parquet files.
+
+The root directory contains a ``_metadata.json`` file and one Parquet file
+per calendar year of data, at ``year=<year>/data.parquet``. Each file holds
+the rows for the sessions in that year sorted by sid and then by day, with
+the same uint32 columns as the bcolz daily bar format: ``open``, ``high``,
+``low``, ``close`` and ``volume``, scaled in the same way, plus ``id`` and
+``day``, as seconds since the epoch.
+
+Because the files are sorted by sid, the min/max statistics that Parquet
+keeps for every row group let ``ParquetDailyBarReader.load_raw_arrays`` skip
+all of the row groups, and all of the years, which do not contain data for
+the requested sids and dates.
+
+The files can be read offline with any Parquet implementation, for example
+``pyarrow.parquet.read_table(rootdir)``.
+"""
+from functools import partial
+import json
+import os
+
+import logbook
+import numpy as np
+import pandas as pd
+from six import iteritems, viewkeys
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.session_bars import SessionBarReader
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarWriter,
+    OHLC,
+    US_EQUITY_PRICING_BCOLZ_COLUMNS,
+    check_uint32_safe,
+    winsorise_uint32,
+)
+from zipline.utils.calendars import get_calendar
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.input_validation import expect_element
+from zipline.utils.memoize import lazyval
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+logger = logbook.Logger('ParquetDailyBars')
+
+# Prefixed with an underscore so that Parquet readers skip it when reading
+# the root directory as a dataset.
+METADATA_FILENAME = '_metadata.json'
+DATA_FILENAME = 'data.parquet'
+
+#: The default number of rows in each Parquet row group. Row groups are the
+#: unit that reads skip, so smaller groups make narrow reads cheaper at the
+#: cost of more statistics to check.
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+PRICE_ADJUSTMENT_FACTOR = 0.001
+
+
+def _require_pyarrow():
+    if pq is None:
+        raise ImportError(
+            'pyarrow is required for the parquet daily bar format, install'
+            ' it with: pip install zipline[parquet]',
+        )
+
+
+def _year_path(rootdir, year):
+    return os.path.join(rootdir, 'year=%d' % year, DATA_FILENAME)
+
+
+def _to_seconds(dts):
+    return dts.values.astype('datetime64[s]').view(np.int64)
+
+
+class ParquetDailyBarMetadata(object):
+    """
+    Metadata for the data in a parquet daily bar directory.
+
+    Parameters
+    ----------
+    calendar_name : str
+        The name of the trading calendar the data is aligned to.
+    start_session : pd.Timestamp
+        The first session of the data set.
+    end_session : pd.Timestamp
+        The last session of the data set.
+    asset_days : dict[int -> (int, int)]
+        Map from sid to the first and last day, as seconds since the epoch,
+        with data for that sid.
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, calendar_name, start_session, end_session, asset_days):
+        self.calendar_name = calendar_name
+        self.start_session = start_session
+        self.end_session = end_session
+        self.asset_days = asset_days
+
+    @classmethod
+    def metadata_path(cls, rootdir):
+        return os.path.join(rootdir, METADATA_FILENAME)
+
+    @classmethod
+    def read(cls, rootdir):
+        with open(cls.metadata_path(rootdir)) as fp:
+            raw_data = json.load(fp)
+
+        version = raw_data['version']
+        if version != cls.FORMAT_VERSION:
+            raise ValueError(
+                'Unsupported parquet daily bar format version %r' % version,
+            )
+        return cls(
+            raw_data['calendar_name'],
+            pd.Timestamp(raw_data['start_session'], unit='s', tz='UTC'),
+            pd.Timestamp(raw_data['end_session'], unit='s', tz='UTC'),
+            {
+                int(sid): tuple(days)
+                for sid, days in iteritems(raw_data['asset_days'])
+            },
+        )
+
+    def write(self, rootdir):
+        metadata = {
+            'version': self.FORMAT_VERSION,
+            'calendar_name': self.calendar_name,
+            'start_session': self.start_session.value // 10 ** 9,
+            'end_session': self.end_session.value // 10 ** 9,
+            'asset_days': {
+                str(sid): [int(first), int(last)]
+                for sid, (first, last) in iteritems(self.asset_days)
+            },
+        }
+        with open(self.metadata_path(rootdir), 'w') as fp:
+            json.dump(metadata, fp)
+
+
+class ParquetDailyBarWriter(object):
+    """
+    Class capable of writing daily OHLCV data to disk as year partitioned
+    Parquet files which can be read by ``ParquetDailyBarReader``.
+
+    Takes the same parameters and data as ``BcolzDailyBarWriter``.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory to write the data into.
+    calendar : zipline.utils.calendar.trading_calendar
+        Calendar the data is aligned to.
+    start_session: pd.Timestamp
+        Midnight UTC session label.
+    end_session: pd.Timestamp
+        Midnight UTC session label.
+    row_group_size : int, optional
+        The maximum number of rows in each Parquet row group.
+
+    Notes
+    -----
+    All of the data is buffered in memory, as uint32 columns, until the end of
+    ``write`` because each year's file must be sorted by sid.
+
+    See Also
+    --------
+    zipline.data.parquet_daily_bars.ParquetDailyBarReader
+    zipline.data.us_equity_pricing.BcolzDailyBarWriter
+    """
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        _require_pyarrow()
+
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._row_group_size = row_group_size
+
+    @property
+    def progress_bar_message(self):
+        return "Merging daily equity files:"
+
+    def progress_bar_item_show_func(self, value):
+        return value if value is None else str(value[0])
+
+    def write(self,
+              data,
+              assets=None,
+              show_progress=False,
+              invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and the data for that asset.
+        assets : set[int], optional
+            The assets that should be in ``data``. If this is provided
+            we will check ``data`` against the assets and provide better
+            progress information.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        """
+        ctx = maybe_show_progress(
+            (
+                (sid, self.to_uint32_frame(df, invalid_data_behavior))
+                for sid, df in data
+            ),
+            show_progress=show_progress,
+            item_show_func=self.progress_bar_item_show_func,
+            label=self.progress_bar_message,
+            length=len(assets) if assets is not None else None,
+        )
+        with ctx as it:
+            return self._write_internal(it, assets)
+
+    def write_csvs(self,
+                   asset_map,
+                   show_progress=False,
+                   invalid_data_behavior='warn'):
+        """Read CSVs as DataFrames from our asset map.
+
+        Parameters
+        ----------
+        asset_map : dict[int -> str]
+            A mapping from asset id to file path with the CSV data for that
+            asset
+        show_progress : bool
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        """
+        read = partial(
+            pd.read_csv,
+            parse_dates=['day'],
+            index_col='day',
+            dtype=BcolzDailyBarWriter._csv_dtypes,
+        )
+        return self.write(
+            ((asset, read(path)) for asset, path in iteritems(asset_map)),
+            assets=viewkeys(asset_map),
+            show_progress=show_progress,
+            invalid_data_behavior=invalid_data_behavior,
+        )
+
+    def _write_internal(self, iterator, assets):
+        if not os.path.exists(self._rootdir):
+            os.makedirs(self._rootdir)
+
+        sessions = self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+        session_seconds = _to_seconds(sessions)
+
+        if assets is not None:
+            assets = set(assets)
+
+        # Map from year to the list of frames for that year.
+        years = {}
+        asset_days = {}
+        for asset_id, frame in iterator:
+            if assets is not None and asset_id not in assets:
+                raise ValueError('unknown asset id %r' % asset_id)
+            if not len(frame):
+                continue
+
+            days = frame['day'].values.astype(np.int64)
+            locs = np.searchsorted(session_seconds, days)
+            invalid = (locs == len(session_seconds))
+            invalid[~invalid] = session_seconds[locs[~invalid]] != \
+                days[~invalid]
+            if invalid.any():
+                raise ValueError(
+                    'Got rows for sid %d on days which are not sessions'
+                    ' between %s and %s: %s' % (
+                        asset_id,
+                        self._start_session.date(),
+                        self._end_session.date(),
+                        pd.to_datetime(days[invalid], unit='s').tolist(),
+                    ),
+                )
+
+            frame = frame.assign(id=np.uint32(asset_id))
+            asset_days[asset_id] = (days.min(), days.max())
+
+            frame_years = sessions[locs].year
+            for year, year_frame in frame.groupby(frame_years.values):
+                years.setdefault(year, []).append(year_frame)
+
+        for year, frames in iteritems(years):
+            self._write_year(year, pd.concat(frames, ignore_index=True))
+
+        ParquetDailyBarMetadata(
+            self._calendar.name,
+            self._start_session,
+            self._end_session,
+            asset_days,
+        ).write(self._rootdir)
+
+    def _write_year(self, year, frame):
+        frame = frame.sort_values(['id', 'day'])[
+            list(US_EQUITY_PRICING_BCOLZ_COLUMNS)
+        ]
+
+        path = _year_path(self._rootdir, year)
+        dirname = os.path.dirname(path)
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        logger.debug('Writing {0} rows for {1}', len(frame), year)
+        pq.write_table(
+            pa.Table.from_pandas(frame, preserve_index=False),
+            path,
+            row_group_size=self._row_group_size,
+        )
+
+    @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
+    def to_uint32_frame(self, raw_data, invalid_data_behavior):
+        """
+        Convert a frame of OHLCV data, indexed by day, into the uint32 columns
+        which are written to disk.
+        """
+        winsorise_uint32(raw_data, invalid_data_behavior, 'volume', *OHLC)
+        processed = (raw_data[list(OHLC)] * 1000).astype('uint32')
+        dates = raw_data.index.values.astype('datetime64[s]')
+        if len(dates):
+            check_uint32_safe(dates.max().view(np.int64), 'day')
+        processed['day'] = dates.astype('uint32')
+        processed['volume'] = raw_data.volume.astype('uint32')
+        return processed.reset_index(drop=True)
+
+
+class ParquetDailyBarReader(SessionBarReader):
+    """
+    Reader for raw pricing data written by ``ParquetDailyBarWriter``.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the metadata and the Parquet files.
+
+    Notes
+    -----
+    ``load_raw_arrays`` only reads the years which overlap the requested
+    sessions and, within those files, the row groups whose sid and day
+    statistics overlap the request.
+
+    ``get_value`` and ``get_last_traded_dt`` read and cache a whole year of a
+    column at a time, like ``BcolzDailyBarReader`` does for whole columns.
+
+    See Also
+    --------
+    zipline.data.parquet_daily_bars.ParquetDailyBarWriter
+    zipline.data.us_equity_pricing.BcolzDailyBarReader
+    """
+    def __init__(self, rootdir):
+        _require_pyarrow()
+
+        self._rootdir = rootdir
+        self._files = {}
+        self._spot_cols = {}
+
+    @lazyval
+    def _metadata(self):
+        return ParquetDailyBarMetadata.read(self._rootdir)
+
+    @lazyval
+    def trading_calendar(self):
+        return get_calendar(self._metadata.calendar_name)
+
+    @lazyval
+    def sessions(self):
+        return self.trading_calendar.sessions_in_range(
+            self._metadata.start_session,
+            self._metadata.end_session,
+        )
+
+    @lazyval
+    def _session_seconds(self):
+        return _to_seconds(self.sessions)
+
+    @lazyval
+    def first_trading_day(self):
+        asset_days = self._metadata.asset_days
+        if not asset_days:
+            return None
+        return pd.Timestamp(
+            min(first for first, _ in asset_days.values()),
+            unit='s',
+            tz='UTC',
+        )
+
+    @property
+    def last_available_dt(self):
+        return self.sessions[-1]
+
+    def _file(self, year):
+        """
+        The ``ParquetFile`` for the given year, or None if there is no data
+        for that year.
+        """
+        try:
+            return self._files[year]
+        except KeyError:
+            path = _year_path(self._rootdir, year)
+            pf = self._files[year] = (
+                pq.ParquetFile(path) if os.path.exists(path) else None
+            )
+            return pf
+
+    def _row_groups(self, pf, sorted_sids, start_day, end_day):
+        """
+        The indices of the row groups in ``pf`` which may contain data for
+        any of ``sorted_sids`` between ``start_day`` and ``end_day``.
+        """
+        metadata = pf.metadata
+        out = []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            stats = {}
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if column.path_in_schema in ('id', 'day'):
+                    stats[column.path_in_schema] = column.statistics
+
+            id_stats = stats.get('id')
+            if id_stats is not None and id_stats.has_min_max:
+                # Check that at least one of the sids falls within the row
+                # group's range, not just that the ranges overlap.
+                lo = np.searchsorted(sorted_sids, id_stats.min, 'left')
+                hi = np.searchsorted(sorted_sids, id_stats.max, 'right')
+                if lo == hi:
+                    continue
+
+            day_stats = stats.get('day')
+            if day_stats is not None and day_stats.has_min_max:
+                if day_stats.max < start_day or day_stats.min > end_day:
+                    continue
+
+            out.append(i)
+        return out
+
+    def _read_frame(self, year, columns, row_groups):
+        pf = self._file(year)
+        return pa.concat_tables([
+            pf.read_row_group(i, columns=columns) for i in row_groups
+        ]).to_pandas()
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        start_idx = self.sessions.get_loc(start_date)
+        end_idx = self.sessions.get_loc(end_date)
+        session_seconds = self._session_seconds[start_idx:end_idx + 1]
+        start_day = session_seconds[0]
+        end_day = session_seconds[-1]
+
+        columns = list(columns)
+        # Read into one column per unique sid, then expand to the requested
+        # order, which may repeat sids, at the end.
+        unique_assets, asset_locs = np.unique(
+            np.asarray(assets, dtype=np.int64),
+            return_inverse=True,
+        )
+        shape = (len(session_seconds), len(unique_assets))
+        bufs = [np.zeros(shape, dtype=np.uint32) for _ in columns]
+
+        for year in range(self.sessions[start_idx].year,
+                          self.sessions[end_idx].year + 1):
+            pf = self._file(year)
+            if pf is None:
+                continue
+            row_groups = self._row_groups(
+                pf,
+                unique_assets,
+                start_day,
+                end_day,
+            )
+            if not row_groups:
+                continue
+
+            frame = self._read_frame(year, ['id', 'day'] + columns, row_groups)
+            ids = frame['id'].values.astype(np.int64)
+            days = frame['day'].values.astype(np.int64)
+
+            cols = np.searchsorted(unique_assets, ids)
+            cols[cols == len(unique_assets)] = 0
+            mask = (
+                (unique_assets[cols] == ids) &
+                (days >= start_day) &
+                (days <= end_day)
+            )
+            if not mask.any():
+                continue
+
+            rows = np.searchsorted(session_seconds, days[mask])
+            cols = cols[mask]
+            for buf, column in zip(bufs, columns):
+                buf[rows, cols] = frame[column].values[mask]
+
+        bufs = [buf[:, asset_locs] for buf in bufs]
+
+        results = []
+        for buf, column in zip(bufs, columns):
+            if column in OHLC:
+                out = buf * PRICE_ADJUSTMENT_FACTOR
+                out[buf == 0] = np.nan
+                results.append(out)
+            else:
+                results.append(buf)
+        return results
+
+    def _spot_col(self, year, field):
+        """
+        Get the sorted ``id << 32 | day`` keys and the values of ``field``
+        for a year of data, reading all of it into memory and caching the
+        result.
+        """
+        try:
+            return self._spot_cols[year, field]
+        except KeyError:
+            pass
+
+        try:
+            keys = self._spot_cols[year, 'key']
+        except KeyError:
+            keys = None
+
+        if self._file(year) is None:
+            keys = values = np.array([], dtype=np.uint64)
+        else:
+            pf = self._file(year)
+            columns = [field] if keys is not None else ['id', 'day', field]
+            frame = self._read_frame(
+                year,
+                columns,
+                range(pf.metadata.num_row_groups),
+            )
+            if keys is None:
+                keys = (
+                    (frame['id'].values.astype(np.uint64) << np.uint64(32)) |
+                    frame['day'].values.astype(np.uint64)
+                )
+            values = frame[field].values
+
+        self._spot_cols[year, 'key'] = keys
+        self._spot_cols[year, field] = out = (keys, values)
+        return out
+
+    def _asset_days(self, sid):
+        try:
+            return self._metadata.asset_days[sid]
+        except KeyError:
+            raise NoDataForSid('No daily data for sid {}.'.format(sid))
+
+    def get_value(self, sid, dt, field):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        float
+            The spot price for colname of the given sid on the given day.
+            Raises a NoDataOnDate exception if the given day and sid is before
+            or after the date range of the equity.
+            Returns nan if the day is within the date range, but the price is
+            0.
+        """
+        sid = int(sid)
+        try:
+            day_loc = self.sessions.get_loc(dt)
+        except KeyError:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                dt, self.sessions))
+
+        day = self._session_seconds[day_loc]
+        first_day, last_day = self._asset_days(sid)
+        if day < first_day:
+            raise NoDataBeforeDate(
+                "No data on or before day={0} for sid={1}".format(dt, sid))
+        if day > last_day:
+            raise NoDataAfterDate(
+                "No data on or after day={0} for sid={1}".format(dt, sid))
+
+        keys, values = self._spot_col(self.sessions[day_loc].year, field)
+        key = np.uint64((sid << 32) | int(day))
+        ix = np.searchsorted(keys, key)
+        if ix < len(keys) and keys[ix] == key:
+            value = values[ix]
+        else:
+            value = 0
+
+        if field != 'volume':
+            if value == 0:
+                return np.nan
+            return value * PRICE_ADJUSTMENT_FACTOR
+        return value
+
+    def get_last_traded_dt(self, asset, day):
+        sid = int(asset)
+        try:
+            first_day, last_day = self._asset_days(sid)
+        except NoDataForSid:
+            return pd.NaT
+
+        day_loc = self.sessions.searchsorted(day, side='right') - 1
+        if day_loc < 0:
+            return pd.NaT
+        search_day = min(int(self._session_seconds[day_loc]), last_day)
+        if search_day < first_day:
+            return pd.NaT
+
+        first_year = pd.Timestamp(first_day, unit='s').year
+        for year in range(pd.Timestamp(search_day, unit='s').year,
+                          first_year - 1,
+                          -1):
+            keys, volumes = self._spot_col(year, 'volume')
+            lo = np.searchsorted(keys, np.uint64(sid << 32), 'left')
+            hi = np.searchsorted(
+                keys,
+                np.uint64((sid << 32) | search_day),
+                'right',
+            )
+            traded = np.flatnonzero(volumes[lo:hi])
+            if len(traded):
+                return pd.Timestamp(
+                    int(keys[lo + traded[-1]]) & 0xffffffff,
+                    unit='s',
+                    tz='UTC',
+                )
+        return pd.NaT
+
+
+def is_parquet_daily_bar_dir(path):
+    """Does ``path`` contain daily bars written by ``ParquetDailyBarWriter``?
+    """
+    return os.path.exists(ParquetDailyBarMetadata.metadata_path(path))
@@ -13,7 +13,15 @@
 # limitations under the License.
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
-
+import errno
+import hashlib
+import json
+from operator import attrgetter
+import os
+import shutil
+import tempfile
+
+import bcolz
 import numpy as np
 import pandas as pd
 from six import with_metaclass
@@ -26,9 +34,21 @@ from zipline.data._resample import (
     _minute_to_session_volume,
 )
 from zipline.data.bar_reader import NoDataOnDate
-from zipline.data.minute_bars import MinuteBarReader
+from zipline.data.minute_bars import BcolzMinuteBarMetadata, MinuteBarReader
 from zipline.data.session_bars import SessionBarReader
+from zipline.utils.cache import ByteLimitedLRU, working_file
 from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory
+
+OHLCV = ('open', 'high', 'low', 'close', 'volume')
+
+# The version of the layout of MinuteResampleSessionBarReader's cache.
+RESAMPLE_CACHE_VERSION = 2
+RESAMPLE_CACHE_METADATA_FILENAME = 'metadata.json'
+# The number of sids, and of sessions, resampled at once when filling the
+# cache.
+RESAMPLE_CACHE_SIDS_PER_BLOCK = 32
+RESAMPLE_CACHE_SESSIONS_PER_BLOCK = 63
 
 _MINUTE_TO_SESSION_OHCLV_HOW = OrderedDict((
     ('open', 'first'),
@@ -152,6 +172,48 @@ def minute_to_session(column, close_locs, data, out):
     return out
 
 
+def _running_open(window, opens):
+    """
+    The first non-nan value of each column of ``window``, or ``opens`` where
+    a column is all nan.
+    """
+    valid = ~np.isnan(window)
+    first = window[valid.argmax(axis=0), np.arange(window.shape[1])]
+    return np.where(valid.any(axis=0), first, opens)
+
+
+def _running_high(window, highs):
+    return np.fmax(highs, np.fmax.reduce(window, axis=0))
+
+
+def _running_low(window, lows):
+    return np.fmin(lows, np.fmin.reduce(window, axis=0))
+
+
+def _running_close(window, closes):
+    """
+    The last non-nan value of each column of ``window``, or ``closes`` where
+    a column is all nan.
+    """
+    valid = ~np.isnan(window)
+    last = len(window) - 1 - valid[::-1].argmax(axis=0)
+    latest = window[last, np.arange(window.shape[1])]
+    return np.where(valid.any(axis=0), latest, closes)
+
+
+def _running_volume(window, volumes):
+    return volumes + np.nansum(window, axis=0).astype(np.int64)
+
+
+_RUNNING_AGGREGATIONS = {
+    'open': (_running_open, np.float64, np.nan),
+    'high': (_running_high, np.float64, np.nan),
+    'low': (_running_low, np.float64, np.nan),
+    'close': (_running_close, np.float64, np.nan),
+    'volume': (_running_volume, np.int64, 0),
+}
+
+
 class DailyHistoryAggregator(object):
     """
     Converts minute pricing data into a daily summary, to be used for the
@@ -164,6 +226,9 @@ class DailyHistoryAggregator(object):
     Provides aggregation for `open`, `high`, `low`, `close`, and `volume`.
     The aggregation rules for each price type is documented in their respective
 
+    Each call reads the minutes which have not been aggregated yet for all of
+    the requested assets at once, so that a call on every minute of the
+    session reads a single minute per asset.
     """
 
     def __init__(self, market_opens, minute_reader, trading_calendar):
@@ -171,12 +236,15 @@ class DailyHistoryAggregator(object):
         self._minute_reader = minute_reader
         self._trading_calendar = trading_calendar
 
-        # The caches are structured as (date, market_open, entries), where
-        # entries is a dict of asset -> (last_visited_dt, value)
+        # The caches are structured as
+        # (date, market_open, sids, last_visited_dts, values), where sids is
+        # an index of the sids seen in the session, and last_visited_dts and
+        # values are arrays aligned with sids holding the dt.value (int) up to
+        # which each sid is aggregated and its aggregation value.
         #
-        # Whenever an aggregation method determines the current value,
-        # the entry for the respective asset should be overwritten with a new
-        # entry for the current dt.value (int) and aggregation value.
+        # A sid enters the cache as visited up to the minute before the
+        # market open with the value of an empty aggregation, so that the
+        # first read of a sid is the same as an incremental one.
         #
         # When the requested dt's date is different from date the cache is
         # flushed, so that the cache entries do not grow unbounded.
@@ -184,10 +252,9 @@ class DailyHistoryAggregator(object):
         # Example cache:
         # cache = (date(2016, 3, 17),
         #          pd.Timestamp('2016-03-17 13:31', tz='UTC'),
-        #          {
-        #              1: (1458221460000000000, np.nan),
-        #              2: (1458221460000000000, 42.0),
-        #         })
+        #          Int64Index([1, 2]),
+        #          np.array([1458221460000000000, 1458221460000000000]),
+        #          np.array([np.nan, 42.0]))
         self._caches = {
             'open': None,
             'high': None,
@@ -202,19 +269,90 @@ class DailyHistoryAggregator(object):
 
     def _prelude(self, dt, field):
         session = self._trading_calendar.minute_to_session_label(dt)
-        dt_value = dt.value
         cache = self._caches[field]
         if cache is None or cache[0] != session:
+            _, dtype, _ = _RUNNING_AGGREGATIONS[field]
             market_open = self._market_opens.loc[session]
-            cache = self._caches[field] = (session, market_open, {})
+            cache = self._caches[field] = (
+                session,
+                market_open.tz_localize('UTC'),
+                pd.Index([], dtype=np.int64),
+                np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=dtype),
+            )
+        return cache
 
-        _, market_open, entries = cache
-        market_open = market_open.tz_localize('UTC')
-        if dt != market_open:
-            prev_dt = dt_value - self._one_min
-        else:
-            prev_dt = None
-        return market_open, prev_dt, dt_value, entries
+    def _aggregate(self, field, assets, dt):
+        """
+        Aggregate ``field`` from the market open of ``dt``'s session up to
+        ``dt`` for each of ``assets``.
+        """
+        aggregate, dtype, missing = _RUNNING_AGGREGATIONS[field]
+        session, market_open, known, last_visited, values = self._prelude(
+            dt, field,
+        )
+        dt_value = dt.value
+        before_open = market_open.value - self._one_min
+
+        out = np.full(len(assets), missing, dtype=dtype)
+        alive = np.array(
+            [asset.is_alive_for_session(session) for asset in assets],
+            dtype=bool,
+        )
+        if not alive.any():
+            return out
+
+        alive_assets = np.array(assets, dtype=object)[alive]
+        sids = np.array([int(asset) for asset in alive_assets], dtype=np.int64)
+
+        positions = known.get_indexer(sids)
+        new = positions == -1
+        if new.any():
+            new_sids = pd.Index(pd.unique(sids[new]))
+            positions[new] = len(known) + new_sids.get_indexer(sids[new])
+            known = known.append(new_sids)
+            last_visited = np.append(
+                last_visited,
+                np.full(len(new_sids), before_open, dtype=np.int64),
+            )
+            values = np.append(
+                values,
+                np.full(len(new_sids), missing, dtype=dtype),
+            )
+            self._caches[field] = (
+                session, market_open, known, last_visited, values,
+            )
+
+        # Going back in time within a session starts the aggregation over.
+        ahead = positions[last_visited[positions] > dt_value]
+        last_visited[ahead] = before_open
+        values[ahead] = missing
+
+        visited = last_visited[positions]
+        stale = visited != dt_value
+        if field == 'open':
+            # The first non-nan open is the open for the rest of the session.
+            settled = stale & ~np.isnan(values[positions])
+            last_visited[positions[settled]] = dt_value
+            stale &= ~settled
+
+        # Read the minutes after each distinct last visited dt once for all of
+        # the sids which were last visited then; usually every sid was visited
+        # on the previous minute, which makes this a single one minute read.
+        for start_value in np.unique(visited[stale]):
+            group = stale & (visited == start_value)
+            window = self._minute_reader.load_raw_arrays(
+                [field],
+                pd.Timestamp(start_value + self._one_min, tz='UTC'),
+                dt,
+                list(alive_assets[group]),
+            )[0]
+            slots = positions[group]
+            values[slots] = aggregate(window, values[slots])
+            last_visited[slots] = dt_value
+
+        out[alive] = values[positions]
+        return out
 
     def opens(self, assets, dt):
         """
@@ -229,64 +367,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'open')
-
-        opens = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                opens.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'open')
-                entries[asset] = (dt_value, val)
-                opens.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, first_open = entries[asset]
-                    if last_visited_dt == dt_value:
-                        opens.append(first_open)
-                        continue
-                    elif not pd.isnull(first_open):
-                        opens.append(first_open)
-                        entries[asset] = (dt_value, first_open)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['open'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        nonnan = window[~pd.isnull(window)]
-                        if len(nonnan):
-                            val = nonnan[0]
-                        else:
-                            val = np.nan
-                        entries[asset] = (dt_value, val)
-                        opens.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['open'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    nonnan = window[~pd.isnull(window)]
-                    if len(nonnan):
-                        val = nonnan[0]
-                    else:
-                        val = np.nan
-                    entries[asset] = (dt_value, val)
-                    opens.append(val)
-                    continue
-        return np.array(opens)
+        return self._aggregate('open', assets, dt)
 
     def highs(self, assets, dt):
         """
@@ -298,64 +379,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'high')
-
-        highs = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                highs.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'high')
-                entries[asset] = (dt_value, val)
-                highs.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_max = entries[asset]
-                    if last_visited_dt == dt_value:
-                        highs.append(last_max)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'high')
-                        if pd.isnull(curr_val):
-                            val = last_max
-                        elif pd.isnull(last_max):
-                            val = curr_val
-                        else:
-                            val = max(last_max, curr_val)
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['high'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmax(np.append(window, last_max))
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['high'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmax(window)
-                    entries[asset] = (dt_value, val)
-                    highs.append(val)
-                    continue
-        return np.array(highs)
+        return self._aggregate('high', assets, dt)
 
     def lows(self, assets, dt):
         """
@@ -367,59 +391,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'low')
-
-        lows = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                lows.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'low')
-                entries[asset] = (dt_value, val)
-                lows.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_min = entries[asset]
-                    if last_visited_dt == dt_value:
-                        lows.append(last_min)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'low')
-                        val = np.nanmin([last_min, curr_val])
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['low'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmin(np.append(window, last_min))
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['low'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmin(window)
-                    entries[asset] = (dt_value, val)
-                    lows.append(val)
-                    continue
-        return np.array(lows)
+        return self._aggregate('low', assets, dt)
 
     def closes(self, assets, dt):
         """
@@ -433,69 +405,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'close')
-
-        closes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        def _get_filled_close(asset):
-            """
-            Returns the most recent non-nan close for the asset in this
-            session. If there has been no data in this session on or before the
-            `dt`, returns `nan`
-            """
-            window = self._minute_reader.load_raw_arrays(
-                ['close'],
-                market_open,
-                dt,
-                [asset],
-            )[0]
-            try:
-                return window[~np.isnan(window)][-1]
-            except IndexError:
-                return np.NaN
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                closes.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'close')
-                entries[asset] = (dt_value, val)
-                closes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_close = entries[asset]
-                    if last_visited_dt == dt_value:
-                        closes.append(last_close)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = last_close
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                    else:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = _get_filled_close(asset)
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                except KeyError:
-                    val = self._minute_reader.get_value(
-                        asset, dt, 'close')
-                    if pd.isnull(val):
-                        val = _get_filled_close(asset)
-                    entries[asset] = (dt_value, val)
-                    closes.append(val)
-                    continue
-        return np.array(closes)
+        return self._aggregate('close', assets, dt)
 
     def volumes(self, assets, dt):
         """
@@ -507,66 +417,48 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=int64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'volume')
-
-        volumes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                volumes.append(0)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'volume')
-                entries[asset] = (dt_value, val)
-                volumes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_total = entries[asset]
-                    if last_visited_dt == dt_value:
-                        volumes.append(last_total)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'volume')
-                        val += last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['volume'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        val = np.nansum(window) + last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['volume'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    val = np.nansum(window)
-                    entries[asset] = (dt_value, val)
-                    volumes.append(val)
-                    continue
-        return np.array(volumes)
+        return self._aggregate('volume', assets, dt)
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
+    """
+    A SessionBarReader which resamples the bars of a MinuteBarReader into
+    sessions.
 
-    def __init__(self, calendar, minute_bar_reader):
+    Parameters
+    ----------
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The calendar whose sessions the minute bars are resampled into.
+    minute_bar_reader : MinuteBarReader
+        The reader of the minute bars to resample.
+    cache_path : str, optional
+        A directory in which to persist the resampled sessions of each sid.
+        The first read of a sid resamples its whole history once, and later
+        reads, from this process or others, read the stored sessions. Each
+        version of the minute store, identified by its metadata and last
+        available minute, is cached in its own subdirectory, and a sid is
+        resampled again when its minute data grows. Stored tables are never
+        changed or removed, so the directory can be shared by processes
+        reading concurrently. By default, every read resamples the minutes.
+    sid_cache_size : int, optional
+        The number of sids whose tables of cached sessions are kept open. The
+        tables of the least recently read sids are closed when more are
+        opened. Only used with a ``cache_path``.
+    """
+
+    def __init__(self,
+                 calendar,
+                 minute_bar_reader,
+                 cache_path=None,
+                 sid_cache_size=1550):
         self._calendar = calendar
         self._minute_bar_reader = minute_bar_reader
+        self._cache_path = cache_path
+        # Map from sid -> bcolz.ctable of the sid's cached sessions.
+        self._cached_tables = ByteLimitedLRU(
+            sizeof=attrgetter('cbytes'),
+            maxsize=sid_cache_size,
+        )
 
     def _get_resampled(self, columns, start_session, end_session, assets):
         range_open = self._calendar.session_open(start_session)
@@ -617,15 +509,187 @@ class MinuteResampleSessionBarReader(SessionBarReader):
     def trading_calendar(self):
         return self._calendar
 
+    def _read(self, columns, start_session, end_session, assets):
+        if self._cache_path is None:
+            return self._get_resampled(
+                columns, start_session, end_session, assets,
+            )
+
+        sessions = self.sessions
+        start_idx = sessions.get_loc(start_session)
+        end_idx = sessions.get_loc(end_session)
+        tables = self._get_cached_tables(assets)
+
+        results = []
+        shape = (end_idx - start_idx + 1, len(assets))
+        for column in columns:
+            out = np.empty(
+                shape,
+                dtype=np.uint32 if column == 'volume' else np.float64,
+            )
+            for i, table in enumerate(tables):
+                out[:, i] = table[column][start_idx:end_idx + 1]
+            results.append(out)
+        return results
+
+    @lazyval
+    def _cache_dir(self):
+        """
+        The directory of the cache for the current version of the minute
+        store.
+
+        Each version of the minute store is cached in its own subdirectory of
+        ``cache_path``, named by a digest of its ``_cache_key``, so that a
+        process never clears tables which another process may be reading.
+        """
+        key = self._cache_key()
+        digest = hashlib.sha1(
+            json.dumps(key, sort_keys=True).encode('utf-8'),
+        ).hexdigest()
+        path = os.path.join(self._cache_path, digest)
+        ensure_directory(path)
+
+        metadata_path = os.path.join(path, RESAMPLE_CACHE_METADATA_FILENAME)
+        if not os.path.exists(metadata_path):
+            # Describe the minute store for anyone inspecting the cache.
+            with working_file(metadata_path, dir=path) as wf:
+                with open(wf.path, 'w') as fp:
+                    json.dump(key, fp)
+        return path
+
+    def _cache_key(self):
+        """
+        Describe the minute store so that a cache written from a different
+        version of it can be detected.
+        """
+        reader = self._minute_bar_reader
+        key = {
+            'version': RESAMPLE_CACHE_VERSION,
+            'calendar_name': self._calendar.name,
+            'first_trading_day': str(reader.first_trading_day),
+            'last_available_dt': str(reader.last_available_dt),
+            'metadata_sha1': None,
+        }
+        rootdir = getattr(reader, '_rootdir', None)
+        if rootdir is not None:
+            with open(BcolzMinuteBarMetadata.metadata_path(rootdir),
+                      'rb') as fp:
+                key['metadata_sha1'] = hashlib.sha1(fp.read()).hexdigest()
+        return key
+
+    def _minute_count(self, sid):
+        """
+        The number of minutes written for ``sid``, if the minute reader can
+        tell, used to detect sids whose minute data has grown.
+        """
+        table_len = getattr(self._minute_bar_reader, 'table_len', None)
+        if table_len is None:
+            return None
+        return int(table_len(sid))
+
+    def _sid_cache_path(self, sid):
+        minutes = self._minute_count(sid)
+        if minutes is None:
+            name = '{0}.bcolz'.format(sid)
+        else:
+            # A sid whose minute data grows is written to a new table, so
+            # tables are never replaced while another process reads them.
+            name = '{0}-{1}.bcolz'.format(sid, minutes)
+        return os.path.join(self._cache_dir, name)
+
+    def _open_cached_table(self, sid):
+        path = self._sid_cache_path(sid)
+        if not os.path.exists(path):
+            return None
+        return bcolz.ctable(rootdir=path, mode='r')
+
+    def _write_cached_table(self, sid, columns):
+        path = self._sid_cache_path(sid)
+        # Write beside the final path and rename into place, so that other
+        # processes never read a partially written table.
+        tmp_path = tempfile.mkdtemp(prefix='.{0}-'.format(sid),
+                                    dir=self._cache_dir)
+        table = bcolz.ctable(
+            columns=[columns[column] for column in OHLCV],
+            names=list(OHLCV),
+            rootdir=tmp_path,
+            mode='w',
+        )
+        table.flush()
+        try:
+            os.rename(tmp_path, path)
+        except OSError as e:
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                raise
+            # Another process resampled the sid first. Its table holds the
+            # same sessions, so read that one instead.
+            shutil.rmtree(tmp_path)
+        return bcolz.ctable(rootdir=path, mode='r')
+
+    def _get_cached_tables(self, assets):
+        cached = self._cached_tables
+        # The tables of this read, which may be more than the cache holds.
+        tables = {}
+        missing = []
+        for sid in map(int, assets):
+            if sid in tables or sid in missing:
+                continue
+            try:
+                tables[sid] = cached[sid]
+                continue
+            except KeyError:
+                pass
+            table = self._open_cached_table(sid)
+            if table is None:
+                missing.append(sid)
+            else:
+                tables[sid] = cached[sid] = table
+
+        # Resample the whole history of the missing sids in blocks of sids
+        # and sessions to bound the minutes held in memory at once.
+        sessions = self.sessions
+        for i in range(0, len(missing), RESAMPLE_CACHE_SIDS_PER_BLOCK):
+            sids = missing[i:i + RESAMPLE_CACHE_SIDS_PER_BLOCK]
+            blocks = [
+                self._get_resampled(
+                    OHLCV,
+                    sessions[j],
+                    sessions[min(j + RESAMPLE_CACHE_SESSIONS_PER_BLOCK,
+                                 len(sessions)) - 1],
+                    sids,
+                )
+                for j in range(0,
+                               len(sessions),
+                               RESAMPLE_CACHE_SESSIONS_PER_BLOCK)
+            ]
+            history = [
+                np.vstack([block[k] for block in blocks])
+                for k in range(len(OHLCV))
+            ]
+            for n, sid in enumerate(sids):
+                tables[sid] = cached[sid] = self._write_cached_table(
+                    sid,
+                    {
+                        column: values[:, n]
+                        for column, values in zip(OHLCV, history)
+                    },
+                )
+
+        return [tables[int(sid)] for sid in assets]
+
     def load_raw_arrays(self, columns, start_dt, end_dt, sids):
-        return self._get_resampled(columns, start_dt, end_dt, sids)
+        return self._read(columns, start_dt, end_dt, sids)
 
     def get_value(self, sid, session, colname):
-        # WARNING: This will need caching or other optimization if used in a
-        # tight loop.
+        # WARNING: Without a cache_path, this will need caching or other
+        # optimization if used in a tight loop.
         # This was developed to complete interface, but has not been tuned
         # for real world use.
-        return self._get_resampled([colname], session, session, [sid])[0][0][0]
+        return self._read([colname], session, session, [sid])[0][0][0]
+
+    def get_values(self, sids, session, colname):
+        # Resample all of the sids from a single read of the session's minutes.
+        return self._read([colname], session, session, list(sids))[0][0]
 
     @lazyval
     def sessions(self):
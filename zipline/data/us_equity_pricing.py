@@ -13,7 +13,9 @@
 # limitations under the License.
 from errno import ENOENT
 from functools import partial
+from multiprocessing.pool import ThreadPool
 from os import remove
+import shutil
 import sqlite3
 import warnings
 
@@ -53,10 +55,16 @@ from six import (
 )
 from toolz import compose
 
+from zipline.data.adjustment_index import (
+    AdjustmentIndex,
+    adjustment_index_path,
+    sqlite_db_path,
+)
 from zipline.data.session_bars import SessionBarReader
 from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
+    NoDataForSid,
     NoDataOnDate,
 )
 from zipline.utils.calendars import get_calendar
@@ -71,7 +79,10 @@ from zipline.utils.sqlite_utils import group_into_chunks, coerce_string_to_conn
 from zipline.utils.memoize import lazyval
 from zipline.utils.cli import maybe_show_progress
 from ._equities import _compute_row_slices, _read_bcolz_data
-from ._adjustments import load_adjustments_from_sqlite
+from ._adjustments import (
+    load_adjustments_from_index,
+    load_adjustments_from_sqlite,
+)
 
 
 logger = logbook.Logger('UsEquityPricing')
@@ -438,6 +449,12 @@ class BcolzDailyBarReader(SessionBarReader):
         all of the data for all assets into memory and then indexing into that
         array for each day and asset pair.  Used to tune performance of reads
         when using a small or large number of equities.
+    read_workers : int, optional
+        The number of threads used by ``load_raw_arrays`` to read columns,
+        and slices of assets within each column, concurrently. Decompression
+        releases the GIL, so large reads scale with the number of cores. By
+        default, all reads happen on the calling thread. Call ``close``, or
+        use the reader as a context manager, to stop the threads.
 
     Attributes
     ----------
@@ -494,7 +511,7 @@ class BcolzDailyBarReader(SessionBarReader):
     --------
     zipline.data.us_equity_pricing.BcolzDailyBarWriter
     """
-    def __init__(self, table, read_all_threshold=3000):
+    def __init__(self, table, read_all_threshold=3000, read_workers=None):
         self._maybe_table_rootdir = table
         # Cache of fully read np.array for the carrays in the daily bar table.
         # raw_array does not use the same cache, but it could.
@@ -503,6 +520,8 @@ class BcolzDailyBarReader(SessionBarReader):
         self._spot_cols = {}
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
         self._read_all_threshold = read_all_threshold
+        self._read_workers = read_workers
+        self._pool = None
 
     @lazyval
     def _table(self):
@@ -577,6 +596,61 @@ class BcolzDailyBarReader(SessionBarReader):
     def last_available_dt(self):
         return self.sessions[-1]
 
+    @lazyval
+    def sids(self):
+        """The sids with bars in the table, in ascending order.
+        """
+        return sorted(self._first_rows)
+
+    def sid_rows(self, sid):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+
+        Returns
+        -------
+        rows : np.ndarray
+            The rows of the sid, from its first session to its last, as a
+            structured array with a field for each column of the table.
+
+        Raises
+        ------
+        NoDataForSid
+            If the table has no bars for the sid.
+        """
+        try:
+            first_row = self._first_rows[sid]
+        except KeyError:
+            raise NoDataForSid('No daily data for sid {}.'.format(sid))
+        return self._table[first_row:self._last_rows[sid] + 1]
+
+    def last_session_for_sid(self, sid):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+
+        Returns
+        -------
+        pd.Timestamp
+            The last session with a bar for the sid.
+
+        Raises
+        ------
+        NoDataForSid
+            If the table has no bars for the sid.
+        """
+        try:
+            offset = self._calendar_offsets[sid]
+        except KeyError:
+            raise NoDataForSid('No daily data for sid {}.'.format(sid))
+        return self.sessions[
+            offset + self._last_rows[sid] - self._first_rows[sid]
+        ]
+
     def _compute_slices(self, start_idx, end_idx, assets):
         """
         Compute the raw row indices to load for each asset on a query for the
@@ -629,16 +703,112 @@ class BcolzDailyBarReader(SessionBarReader):
             assets,
         )
         read_all = len(assets) > self._read_all_threshold
-        return _read_bcolz_data(
-            self._table,
-            (end_idx - start_idx + 1, len(assets)),
+        shape = (end_idx - start_idx + 1, len(assets))
+
+        num_workers = self._read_workers
+        if num_workers is None or num_workers <= 1:
+            return _read_bcolz_data(
+                self._table,
+                shape,
+                list(columns),
+                first_rows,
+                last_rows,
+                offsets,
+                read_all,
+            )
+        return self._load_raw_arrays_threaded(
             list(columns),
+            shape,
             first_rows,
             last_rows,
             offsets,
             read_all,
         )
 
+    @property
+    def _read_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPool(self._read_workers)
+        return self._pool
+
+    def close(self):
+        """Stop the threads used by ``load_raw_arrays``, if any were started.
+
+        The reader can still be used after it is closed, and starts a new pool
+        if it reads on threads again.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load_raw_arrays_threaded(self,
+                                  columns,
+                                  shape,
+                                  first_rows,
+                                  last_rows,
+                                  offsets,
+                                  read_all):
+        """
+        Implementation of ``load_raw_arrays`` which reads each column, split
+        into slices of assets, on ``_read_pool`` and writes the results into
+        preallocated output arrays.
+        """
+        table = self._table
+        results = [
+            np.empty(
+                shape,
+                dtype=(
+                    float64
+                    if column in {'open', 'high', 'low', 'close'}
+                    else uint32
+                ),
+            )
+            for column in columns
+        ]
+
+        if read_all:
+            # Every task would read the entire column, so only split the
+            # work by column.
+            asset_slices = [slice(0, shape[1])]
+        else:
+            asset_slices = [
+                slice(chunk[0], chunk[-1] + 1)
+                for chunk in np.array_split(
+                    np.arange(shape[1]),
+                    self._read_workers,
+                )
+                if len(chunk)
+            ]
+
+        def read_slice(task):
+            out, column, assets = task
+            out[:, assets] = _read_bcolz_data(
+                table,
+                (shape[0], assets.stop - assets.start),
+                [column],
+                first_rows[assets],
+                last_rows[assets],
+                offsets[assets],
+                read_all,
+            )[0]
+
+        self._read_pool.map(
+            read_slice,
+            [
+                (out, column, assets)
+                for out, column in zip(results, columns)
+                for assets in asset_slices
+            ],
+        )
+        return results
+
     def _spot_col(self, colname):
         """
         Get the colname from daily_bar_table and read all of it into memory,
@@ -749,6 +919,56 @@ class BcolzDailyBarReader(SessionBarReader):
         else:
             return price
 
+    def get_values(self, sids, dt, field):
+        """
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        np.ndarray
+            The spot values of field for the given sids on the given day.
+            Sids outside of their date range on the given day are nan for
+            prices and 0 for volume.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the day is not a session of this reader, as with
+            ``get_value``.
+        """
+        sids = list(sids)
+        raw = np.zeros(len(sids), dtype=np.uint32)
+        try:
+            day_loc = self.sessions.get_loc(dt)
+        except KeyError:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                dt, self.sessions))
+
+        if sids:
+            first_rows, last_rows, offsets = self._compute_slices(
+                day_loc,
+                day_loc,
+                sids,
+            )
+            # A single day query yields an empty slice or an offset for sids
+            # which have no row on that day.
+            valid = (offsets == 0) & (first_rows <= last_rows)
+            if valid.any():
+                raw[valid] = self._spot_col(field)[first_rows[valid]]
+
+        if field != 'volume':
+            out = raw * 0.001
+            out[raw == 0] = nan
+            return out
+        return raw
+
 
 class PanelBarReader(SessionBarReader):
     """
@@ -881,6 +1101,13 @@ class SQLiteAdjustmentWriter(object):
         If True and conn_or_path is a string, remove any existing files at the
         given path before connecting.
 
+    Notes
+    -----
+    When the database is stored in a file, ``write`` also writes an
+    :class:`~zipline.data.adjustment_index.AdjustmentIndex` of the splits,
+    mergers and dividends next to it, which SQLiteAdjustmentReader uses to
+    load adjustments without querying the database.
+
     See Also
     --------
     zipline.data.us_equity_pricing.SQLiteAdjustmentReader
@@ -900,6 +1127,10 @@ class SQLiteAdjustmentWriter(object):
                 except OSError as e:
                     if e.errno != ENOENT:
                         raise
+                shutil.rmtree(
+                    adjustment_index_path(conn_or_path),
+                    ignore_errors=True,
+                )
             self.conn = sqlite3.connect(conn_or_path)
             self.uri = conn_or_path
         else:
@@ -1203,46 +1434,52 @@ class SQLiteAdjustmentWriter(object):
         self.write_frame('mergers', mergers)
         self.write_dividend_data(dividends, stock_dividends)
         self.conn.execute(
-            "CREATE INDEX splits_sids "
+            "CREATE INDEX IF NOT EXISTS splits_sids "
             "ON splits(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX splits_effective_date "
+            "CREATE INDEX IF NOT EXISTS splits_effective_date "
             "ON splits(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX mergers_sids "
+            "CREATE INDEX IF NOT EXISTS mergers_sids "
             "ON mergers(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX mergers_effective_date "
+            "CREATE INDEX IF NOT EXISTS mergers_effective_date "
             "ON mergers(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_sid "
+            "CREATE INDEX IF NOT EXISTS dividends_sid "
             "ON dividends(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_effective_date "
+            "CREATE INDEX IF NOT EXISTS dividends_effective_date "
             "ON dividends(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX dividend_payouts_sid "
+            "CREATE INDEX IF NOT EXISTS dividend_payouts_sid "
             "ON dividend_payouts(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_payouts_ex_date "
+            "CREATE INDEX IF NOT EXISTS dividends_payouts_ex_date "
             "ON dividend_payouts(ex_date)"
         )
         self.conn.execute(
-            "CREATE INDEX stock_dividend_payouts_sid "
+            "CREATE INDEX IF NOT EXISTS stock_dividend_payouts_sid "
             "ON stock_dividend_payouts(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX stock_dividends_payouts_ex_date "
+            "CREATE INDEX IF NOT EXISTS stock_dividends_payouts_ex_date "
             "ON stock_dividend_payouts(ex_date)"
         )
 
+        db_path = sqlite_db_path(self.conn)
+        if db_path is not None:
+            AdjustmentIndex.from_db(self.conn).write(
+                adjustment_index_path(db_path),
+            )
+
     def close(self):
         self.conn.close()
 
@@ -1275,6 +1512,13 @@ class SQLiteAdjustmentReader(object):
     conn : str or sqlite3.Connection
         Connection from which to load data.
 
+    Attributes
+    ----------
+    adjustment_index : AdjustmentIndex or None
+        The index written next to the database by SQLiteAdjustmentWriter,
+        used to load splits, mergers and dividends, or None if the database
+        has no up to date index.
+
     See Also
     --------
     :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentWriter`
@@ -1284,6 +1528,15 @@ class SQLiteAdjustmentReader(object):
     def __init__(self, conn):
         self.conn = conn
 
+        db_path = sqlite_db_path(conn)
+        if db_path is None:
+            self.adjustment_index = None
+        else:
+            self.adjustment_index = AdjustmentIndex.read(
+                adjustment_index_path(db_path),
+                conn,
+            )
+
         # Given the tables in the adjustments.db file, dict which knows which
         # col names contain dates that have been coerced into ints.
         self._datetime_int_cols = {
@@ -1297,6 +1550,13 @@ class SQLiteAdjustmentReader(object):
         }
 
     def load_adjustments(self, columns, dates, assets):
+        if self.adjustment_index is not None:
+            return load_adjustments_from_index(
+                self.adjustment_index,
+                list(columns),
+                dates,
+                assets,
+            )
         return load_adjustments_from_sqlite(
             self.conn,
             list(columns),
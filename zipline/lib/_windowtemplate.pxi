@@ -12,7 +12,9 @@ zipline.lib._intwindow
 zipline.lib._datewindow
 """
 from numpy cimport ndarray
-from numpy import asanyarray, dtype, issubdtype
+from numpy import asanyarray, dtype, empty, issubdtype
+
+from zipline.lib.rolling import rolling_windows
 
 
 class Exhausted(Exception):
@@ -115,6 +117,89 @@ cdef class AdjustedArrayWindow:
 
         return self.output
 
+    def spans(self, Py_ssize_t count):
+        """
+        Advance the window ``count`` rows, returning the rows covered by the
+        windows it passes over.
+
+        The result is a list with an array for each run of windows between
+        adjustments.  An array of ``n + window_length - 1`` rows holds ``n``
+        consecutive windows, the i-th of which is
+        ``span[i:i + window_length]``.  The last array is a read-only view
+        over the data of this window, which is only valid until the window is
+        advanced again, and the others are copies.
+        """
+        cdef:
+            Py_ssize_t i = 0, n
+            Py_ssize_t window_length = self.window_length
+            object data, span
+            list spans = []
+            dict view_kwargs = self.view_kwargs
+
+        if count < 1:
+            raise ValueError("count must be positive, but was %d." % count)
+        if self.anchor + count > self.max_anchor:
+            raise ValueError(
+                "Can't advance %r by %d rows." % (self, count)
+            )
+
+        data = asanyarray(self.data)
+        while i < count:
+            self._tick_forward(1)
+
+            # Windows anchored before the next adjustment all see the current
+            # state of our data.
+            n = min(
+                count - i,
+                self.next_adj - self.perspective_offset - self.anchor + 1,
+            )
+            span = data[self.anchor - window_length:self.anchor + n - 1]
+            if n > 1:
+                self._tick_forward(n - 1)
+            i += n
+
+            if i < count:
+                # The next adjustment will mutate our data.
+                span = span.copy()
+            if view_kwargs:
+                span = span.view(**view_kwargs)
+            if self.rounding_places is not None and \
+                    issubdtype(span.dtype, dtype('float64')):
+                span = span.round(self.rounding_places)
+            span.setflags(write=False)
+            spans.append(span)
+
+        self._update_output()
+        return spans
+
+    def stack(self, Py_ssize_t count):
+        """
+        Advance the window ``count`` rows, returning all of the windows it
+        passes over as an array of shape (count, window_length, ncolumns).
+
+        If no adjustments are applied while advancing, the result is a
+        read-only strided view over the data of this window, which is only
+        valid until the window is advanced again.  Otherwise, the windows
+        between each pair of adjustments are copied into a new array.
+        """
+        cdef:
+            Py_ssize_t i = 0, n
+            Py_ssize_t window_length = self.window_length
+            list spans = self.spans(count)
+            object span, windows
+
+        if len(spans) == 1:
+            return rolling_windows(spans[0], window_length)
+
+        span = spans[0]
+        windows = empty((count, window_length) + span.shape[1:], span.dtype)
+        for span in spans:
+            n = len(span) - window_length + 1
+            windows[i:i + n] = rolling_windows(span, window_length)
+            i += n
+        windows.setflags(write=False)
+        return windows
+
     cdef inline _tick_forward(self, int N):
         cdef:
             object adjustment
@@ -0,0 +1,232 @@
+"""
+Rolling-window kernels, which compute a statistic for every window over a
+span of rows in time proportional to the number of rows rather than to the
+number of rows times the window length.
+
+A span of ``n + window_length - 1`` rows holds ``n`` windows, the i-th of which
+is ``span[i:i + window_length]``.  The kernels return an array with a row for
+each window of their span.
+"""
+from bisect import bisect_right
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+def rolling_windows(span, window_length):
+    """
+    Get a read-only view of the windows of a span.
+
+    Parameters
+    ----------
+    span : np.ndarray
+        The rows covered by the windows.
+    window_length : int
+        The number of rows in each window.
+
+    Returns
+    -------
+    windows : np.ndarray
+        An array of shape ``(n, window_length) + span.shape[1:]`` which shares
+        memory with ``span``.
+    """
+    windows = as_strided(
+        span,
+        shape=(len(span) - window_length + 1, window_length) + span.shape[1:],
+        strides=(span.strides[0],) + span.strides,
+    )
+    windows.setflags(write=False)
+    return windows
+
+
+def aligned_spans(spans, window_length, count):
+    """
+    Split the spans of several inputs into runs of windows which lie within a
+    single span of every input.
+
+    Parameters
+    ----------
+    spans : list[list[np.ndarray]]
+        The spans of each input, as returned by ``AdjustedArrayWindow.spans``.
+        The spans of every input hold the same windows, but the inputs may be
+        split at different windows.
+    window_length : int
+        The number of rows in each window.
+    count : int
+        The number of windows held by the spans of each input.
+
+    Yields
+    ------
+    start, stop : int
+        The index of the first window of the run and one past its last.
+    arrays : list[np.ndarray]
+        The span of each input which holds the windows of the run.
+    """
+    starts = []
+    for input_spans in spans:
+        input_starts = [0]
+        for span in input_spans:
+            input_starts.append(
+                input_starts[-1] + len(span) - window_length + 1,
+            )
+        starts.append(input_starts)
+
+    boundaries = sorted(set([0, count]).union(*starts))
+    for start, stop in zip(boundaries[:-1], boundaries[1:]):
+        arrays = []
+        for input_spans, input_starts in zip(spans, starts):
+            i = bisect_right(input_starts, start) - 1
+            offset = start - input_starts[i]
+            length = stop - start + window_length - 1
+            arrays.append(input_spans[i][offset:offset + length])
+        yield start, stop, arrays
+
+
+def _rolling_sum(values, window_length):
+    """
+    Sum each window of an array without NaNs.
+    """
+    sums = values.cumsum(axis=0)
+    out = sums[window_length - 1:].copy()
+    out[1:] -= sums[:-window_length]
+    return out
+
+
+def _rolling_exponential_sum(values, window_length, decay_rate):
+    """
+    Sum each window of an array without NaNs, weighting the row ``k`` rows
+    before the end of the window by ``decay_rate ** k``.
+    """
+    num_windows = len(values) - window_length + 1
+    weights = decay_rate ** np.arange(window_length - 1, -1, -1.0)
+    oldest_weight = decay_rate ** window_length
+
+    out = np.empty((num_windows,) + values.shape[1:])
+    out[0] = weights.dot(values[:window_length])
+    for i in range(1, num_windows):
+        # Moving the window forward decays the previous sum, adds the new
+        # row, and removes the row which left the window.
+        out[i] = (
+            decay_rate * out[i - 1] +
+            values[i + window_length - 1] -
+            oldest_weight * values[i - 1]
+        )
+    return out
+
+
+def _centered(span, missing):
+    """
+    Subtract the mean of each column of ``span`` over all of its rows, and
+    fill its NaNs with zeros.
+
+    The sums of squares of the centered values are much smaller than the sums
+    of squares of the original values, so less precision is lost when
+    variances are computed from them.
+    """
+    values = np.where(missing, 0.0, span)
+    counts = (~missing).sum(axis=0)
+    shift = values.sum(axis=0) / np.maximum(counts, 1)
+    return np.where(missing, 0.0, span - shift)
+
+
+def rolling_nansum(span, window_length):
+    """
+    Compute the sum of each window of a span, ignoring NaNs.
+
+    This is equivalent to ``nansum(window, axis=0)`` for each window.
+    """
+    return _rolling_sum(np.where(np.isnan(span), 0.0, span), window_length)
+
+
+def rolling_nanmean(span, window_length):
+    """
+    Compute the mean of each window of a span, ignoring NaNs.
+
+    This is equivalent to ``nanmean(window, axis=0)`` for each window.
+    """
+    missing = np.isnan(span)
+    count = _rolling_sum(~missing, window_length)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (
+            _rolling_sum(np.where(missing, 0.0, span), window_length) / count
+        )
+
+
+def rolling_nanstd(span, window_length):
+    """
+    Compute the standard deviation of each window of a span, ignoring NaNs.
+
+    This is equivalent to ``nanstd(window, axis=0)`` for each window.
+    """
+    missing = np.isnan(span)
+    count = _rolling_sum(~missing, window_length)
+    values = _centered(span, missing)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = _rolling_sum(values, window_length) / count
+        mean_square = _rolling_sum(values ** 2, window_length) / count
+        variance = mean_square - mean ** 2
+
+    # Windows with a single value have no variance, but rounding may leave a
+    # small one.
+    variance[count == 1] = 0.0
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+def _exponential_weight_sums(window_length, decay_rate):
+    weights = decay_rate ** np.arange(window_length)
+    return weights.sum(), (weights ** 2).sum()
+
+
+def rolling_ewma(span, window_length, decay_rate):
+    """
+    Compute the exponentially-weighted mean of each window of a span.
+
+    This is equivalent to ``average(window, axis=0, weights=weights)`` for
+    each window, where ``weights`` are the powers of ``decay_rate`` which
+    increase towards the end of the window.  Windows with NaNs have a mean of
+    NaN.
+    """
+    missing = np.isnan(span)
+    total_weight, _ = _exponential_weight_sums(window_length, decay_rate)
+
+    out = _rolling_exponential_sum(
+        np.where(missing, 0.0, span),
+        window_length,
+        decay_rate,
+    ) / total_weight
+    out[_rolling_sum(missing, window_length) > 0] = np.nan
+    return out
+
+
+def rolling_ewmstd(span, window_length, decay_rate):
+    """
+    Compute the bias-corrected, exponentially-weighted standard deviation of
+    each window of a span, with the weights used by :func:`rolling_ewma`.
+
+    Windows with NaNs have a standard deviation of NaN.
+    """
+    missing = np.isnan(span)
+    total_weight, total_squared_weight = _exponential_weight_sums(
+        window_length,
+        decay_rate,
+    )
+    bias_correction = total_weight ** 2 / (
+        total_weight ** 2 - total_squared_weight
+    )
+    values = _centered(span, missing)
+
+    mean = _rolling_exponential_sum(
+        values,
+        window_length,
+        decay_rate,
+    ) / total_weight
+    variance = _rolling_exponential_sum(
+        values ** 2,
+        window_length,
+        decay_rate,
+    ) / total_weight - mean ** 2
+
+    out = np.sqrt(np.maximum(variance * bias_correction, 0.0))
+    out[_rolling_sum(missing, window_length) > 0] = np.nan
+    return out
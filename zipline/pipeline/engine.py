@@ -5,12 +5,17 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from multiprocessing.pool import ThreadPool
+from operator import attrgetter
+import sys
 from uuid import uuid4
 
 from six import (
     iteritems,
+    reraise,
     with_metaclass,
 )
+from six.moves.queue import Queue
 from numpy import array
 from pandas import DataFrame, MultiIndex
 from toolz import groupby, juxt
@@ -183,6 +188,17 @@ class SimplePipelineEngine(PipelineEngine):
         computing a pipeline. See
         :func:`zipline.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    compute_workers : int, optional
+        The number of threads used by ``compute_chunk`` to compute terms which
+        don't depend on each other concurrently. Most term computations spend
+        their time in NumPy or numexpr, which release the GIL. Loadable terms
+        are still loaded on the calling thread, because loaders aren't
+        required to be thread-safe. By default, terms are computed one at a
+        time on the calling thread.
+    term_cache : zipline.pipeline.term_cache.TermResultCache, optional
+        An on-disk cache of computed terms. Cached terms are added to the
+        initial workspace after ``populate_initial_workspace``, and the terms
+        computed by ``compute_chunk`` are written to the cache.
 
     See Also
     --------
@@ -195,16 +211,22 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_compute_workers',
+        '_term_cache',
     )
 
     def __init__(self,
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 compute_workers=None,
+                 term_cache=None):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
+        self._compute_workers = compute_workers
+        self._term_cache = term_cache
 
         self._root_mask_term = AssetExists()
         self._root_mask_dates_term = InputDates()
@@ -303,6 +325,14 @@ class SimplePipelineEngine(PipelineEngine):
             dates,
             assets,
         )
+        if self._term_cache is not None:
+            initial_workspace = self._term_cache.populate_initial_workspace(
+                initial_workspace,
+                self._root_mask_term,
+                graph,
+                dates,
+                assets,
+            )
 
         results = self.compute_chunk(
             graph,
@@ -336,6 +366,91 @@ class SimplePipelineEngine(PipelineEngine):
 
         return categorical_df_concat(chunks, inplace=True)
 
+    def run_chunked_pipeline_in_pool(self,
+                                     make_pipeline,
+                                     start_date,
+                                     end_date,
+                                     chunksize,
+                                     engine_spec,
+                                     pool):
+        """
+        Compute values for a pipeline in chunks of ``chunksize`` days, with
+        each chunk computed by a worker of ``pool``, and return the stitched
+        up result.
+
+        Parameters
+        ----------
+        make_pipeline : callable
+            A picklable function of no arguments, such as a module level
+            function, which returns the pipeline to run. Each worker builds
+            the pipeline itself, because pipelines can't be pickled.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int
+            The number of days to execute at a time.
+        engine_spec : callable
+            A picklable function of no arguments which returns the engine
+            used by the workers, such as a
+            :class:`~zipline.pipeline.engine_spec.BundleEngineSpec`. Each
+            worker process builds the engine once, and reuses it for the
+            chunks it computes.
+        pool : Pool
+            The pool used to compute the chunks. This object must support
+            ``map``, like :class:`multiprocessing.Pool` or
+            :class:`zipline.utils.pool.SequentialPool`.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            A frame of computed results, like the one returned by
+            ``run_chunked_pipeline``.
+
+        Notes
+        -----
+        The chunks are computed from this engine's calendar, so
+        ``engine_spec`` should build engines with the same calendar.
+
+        Each worker process of ``pool`` holds on to the engine of the last
+        run it computed a chunk of, along with the engine's open readers,
+        until it computes a chunk of another run or exits. Close the pool, or
+        create it with ``maxtasksperchild``, to release them.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_chunked_pipeline`
+        """
+        ranges = compute_date_range_chunks(
+            self._calendar,
+            start_date,
+            end_date,
+            chunksize,
+        )
+        # The workers cache their engine by this token rather than by
+        # ``engine_spec``, so that an engine is never reused by a later run.
+        run_token = uuid4().hex
+        try:
+            chunks = pool.map(
+                _run_pipeline_chunk,
+                [
+                    (run_token, engine_spec, make_pipeline, s, e)
+                    for s, e in ranges
+                ],
+            )
+        finally:
+            # Don't keep the last engine, and its open readers, alive in this
+            # process once the pipeline has been run, as happens when ``pool``
+            # runs the chunks in this process.
+            _last_chunk_engine[:] = None, None
+
+        if len(chunks) == 1:
+            # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
+            # if we don't have to.
+            return chunks[0]
+
+        return categorical_df_concat(chunks, inplace=True)
+
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
         Compute a lifetimes matrix from our AssetFinder, then drop columns that
@@ -466,18 +581,43 @@ class SimplePipelineEngine(PipelineEngine):
             Dictionary mapping requested results to outputs.
         """
         self._validate_compute_chunk_params(dates, assets, initial_workspace)
-        get_loader = self.get_loader
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
 
+        refcounts = graph.initial_refcounts(workspace)
+
+        num_workers = self._compute_workers
+        if num_workers is not None and num_workers > 1:
+            pool = ThreadPool(num_workers)
+            try:
+                self._compute_terms_concurrently(
+                    pool, graph, dates, assets, workspace, refcounts,
+                )
+            finally:
+                pool.terminate()
+        else:
+            self._compute_terms(graph, dates, assets, workspace, refcounts)
+
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
+    def _compute_terms(self, graph, dates, assets, workspace, refcounts):
+        """
+        Compute the terms of ``graph`` which aren't in ``workspace`` one at a
+        time, in topological order, storing the results in ``workspace``.
+        """
+        get_loader = self.get_loader
+
         # If loadable terms share the same loader and extra_rows, load them all
         # together.
         loader_group_key = juxt(get_loader, getitem(graph.extra_rows))
         loader_groups = groupby(loader_group_key, graph.loadable_terms)
 
-        refcounts = graph.initial_refcounts(workspace)
-
         for term in graph.execution_order(refcounts):
             # `term` may have been supplied in `initial_workspace`, and in the
             # future we may pre-compute loadable terms coming from the same
@@ -500,39 +640,189 @@ class SimplePipelineEngine(PipelineEngine):
                     loader_groups[loader_group_key(term)],
                     key=lambda t: t.dataset
                 )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
+                workspace.update(self._load_terms(
+                    get_loader(term), to_load, mask_dates, assets, mask,
+                ))
+            else:
+                workspace[term] = self._compute_term(
+                    term,
+                    self._inputs_for_term(term, workspace, graph),
+                    mask_dates,
+                    assets,
+                    mask,
+                )
+                self._cache_term(term, workspace[term], graph, dates, assets)
+
+                # Decref dependencies of ``term``, and clear any terms whose
+                # refcounts hit 0.
+                for garbage_term in graph.decref_dependencies(term, refcounts):
+                    del workspace[garbage_term]
+
+    def _compute_terms_concurrently(self,
+                                    pool,
+                                    graph,
+                                    dates,
+                                    assets,
+                                    workspace,
+                                    refcounts):
+        """
+        Compute the terms of ``graph`` which aren't in ``workspace`` on
+        ``pool``, storing the results in ``workspace``.
+
+        Terms are submitted as soon as all of their dependencies have been
+        computed. The inputs of each term are gathered, and ``workspace`` and
+        ``refcounts`` are updated, on the calling thread only, so terms are
+        evicted from ``workspace`` exactly as they are by ``_compute_terms``.
+        Loadable terms are loaded together if they share a loader, a number
+        of extra rows and a dataset. They are loaded on the calling thread,
+        because loaders aren't required to be thread-safe.
+        """
+        get_loader = self.get_loader
+        dag = graph.graph
+
+        pending = {
+            term for term, refcount in refcounts.items()
+            if refcount > 0 and term not in workspace
+        }
+        # The number of dependencies of each pending term which haven't been
+        # computed yet.
+        waiting = {
+            term: sum(1 for dep in dag.predecessors(term) if dep in pending)
+            for term in pending
+        }
+
+        load_group_key = juxt(
+            get_loader,
+            getitem(graph.extra_rows),
+            attrgetter('dataset'),
+        )
+        load_groups = groupby(
+            load_group_key,
+            (term for term in pending if isinstance(term, LoadableTerm)),
+        )
+
+        results = Queue()
+
+        def run(terms, f, args):
+            try:
+                results.put((terms, f(*args), None))
+            except BaseException:
+                results.put((terms, None, sys.exc_info()))
+
+        submitted = set()
+
+        def submit(term):
+            mask, mask_dates = graph.mask_and_dates_for_term(
+                term,
+                self._root_mask_term,
+                workspace,
+                dates,
+            )
+
+            if isinstance(term, LoadableTerm):
+                to_load = sorted(
+                    load_groups[load_group_key(term)],
+                    key=lambda t: t.dataset
                 )
-                assert set(loaded) == set(to_load), (
-                    'loader did not return an AdjustedArray for each column\n'
-                    'expected: %r\n'
-                    'got:      %r' % (sorted(to_load), sorted(loaded))
+                f, args = self._load_terms, (
+                    get_loader(term), to_load, mask_dates, assets, mask,
                 )
-                workspace.update(loaded)
             else:
-                workspace[term] = term._compute(
+                to_load = [term]
+                f, args = self._compute_term, (
+                    term,
                     self._inputs_for_term(term, workspace, graph),
                     mask_dates,
                     assets,
                     mask,
                 )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
+
+            submitted.update(to_load)
+            if isinstance(term, LoadableTerm):
+                # Loaders, such as the SQLite adjustment reader's connection,
+                # may only be usable on the thread which created them, so
+                # terms are loaded on the calling thread while the pool
+                # computes the terms which are ready.
+                run(to_load, f, args)
+            else:
+                pool.apply_async(run, (to_load, f, args))
+
+        def submit_ready(terms):
+            count = 0
+            for term in terms:
+                if not waiting[term] and term not in submitted:
+                    submit(term)
+                    count += 1
+            return count
+
+        outstanding = submit_ready(list(pending))
+        while outstanding:
+            terms, result, exc_info = results.get()
+            outstanding -= 1
+            if exc_info is not None:
+                reraise(*exc_info)
+
+            if isinstance(terms[0], LoadableTerm):
+                workspace.update(result)
+            else:
+                term, = terms
+                workspace[term] = result
+                self._cache_term(term, result, graph, dates, assets)
 
                 # Decref dependencies of ``term``, and clear any terms whose
                 # refcounts hit 0.
                 for garbage_term in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage_term]
 
-        out = {}
-        graph_extra_rows = graph.extra_rows
-        for name, term in iteritems(graph.outputs):
-            # Truncate off extra rows from outputs.
-            out[name] = workspace[term][graph_extra_rows[term]:]
-        return out
+            ready = []
+            for term in terms:
+                for dependent in dag.successors(term):
+                    if dependent in waiting:
+                        waiting[dependent] -= 1
+                        if not waiting[dependent]:
+                            ready.append(dependent)
+            outstanding += submit_ready(ready)
+
+    def _cache_term(self, term, result, graph, dates, assets):
+        """
+        Write the result of a computed term to the term cache, if there is
+        one.
+        """
+        if self._term_cache is not None:
+            self._term_cache.add(
+                term,
+                result,
+                self._root_mask_term,
+                graph,
+                dates,
+                assets,
+            )
+
+    @staticmethod
+    def _load_terms(loader, to_load, dates, assets, mask):
+        """
+        Load ``to_load`` with ``loader``, checking that an array was returned
+        for each term.
+        """
+        loaded = loader.load_adjusted_array(to_load, dates, assets, mask)
+        assert set(loaded) == set(to_load), (
+            'loader did not return an AdjustedArray for each column\n'
+            'expected: %r\n'
+            'got:      %r' % (sorted(to_load), sorted(loaded))
+        )
+        return loaded
+
+    @staticmethod
+    def _compute_term(term, inputs, dates, assets, mask):
+        """
+        Compute ``term`` from ``inputs``, checking the shape of the result.
+        """
+        result = term._compute(inputs, dates, assets, mask)
+        if term.ndim == 2:
+            assert result.shape == mask.shape
+        else:
+            assert result.shape == (mask.shape[0], 1)
+        return result
 
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
@@ -628,3 +918,28 @@ class SimplePipelineEngine(PipelineEngine):
                     implied=implied_shape,
                 )
             )
+
+
+# The run token and engine of the last chunk computed by
+# ``_run_pipeline_chunk`` in this process, so that a worker builds its engine
+# once per pipeline run. ``run_chunked_pipeline_in_pool`` clears it in the
+# calling process when the run finishes, but a worker process keeps its engine
+# until it computes a chunk of another run, which replaces it.
+_last_chunk_engine = [None, None]
+
+
+def _run_pipeline_chunk(args):
+    """
+    Run a chunk of a pipeline for
+    ``SimplePipelineEngine.run_chunked_pipeline_in_pool``.
+    """
+    run_token, engine_spec, make_pipeline, start_date, end_date = args
+    last_token, engine = _last_chunk_engine
+    if last_token != run_token:
+        # Drop the engine of the previous run before building the new one,
+        # so that their readers aren't open at the same time.
+        _last_chunk_engine[:] = None, None
+        del engine
+        engine = engine_spec()
+        _last_chunk_engine[:] = run_token, engine
+    return engine.run_pipeline(make_pipeline(), start_date, end_date)
@@ -0,0 +1,120 @@
+"""
+Picklable descriptions of pipeline engines, which can be sent to worker
+processes to build an engine there.
+"""
+import os
+
+import pandas as pd
+
+from zipline.data.bundles import load
+from zipline.utils.calendars import get_calendar
+
+from .data import USEquityPricing
+from .engine import SimplePipelineEngine
+from .loaders import USEquityPricingLoader
+
+
+class BundleEngineSpec(object):
+    """
+    A picklable description of a
+    :class:`~zipline.pipeline.engine.SimplePipelineEngine` which reads from an
+    ingested bundle.
+
+    Calling the spec loads the bundle and returns the engine. Only the
+    parameters below are pickled, so the spec can be passed to worker
+    processes, which build their own readers.
+
+    Parameters
+    ----------
+    bundle : str
+        The name of the bundle.
+    timestamp : datetime, optional
+        The timestamp of the bundle ingestion to read. Defaults to the time
+        at which the spec is created, so that every worker reads the same
+        ingestion.
+    environ : mapping, optional
+        The environment variables used to find the bundle. Defaults to
+        ``os.environ`` in the process which builds the engine.
+    calendar_name : str, optional
+        The name of the trading calendar whose sessions the engine computes
+        pipelines for. Defaults to 'NYSE'.
+    get_loader : callable, optional
+        A picklable function which is given a column that isn't one of
+        ``USEquityPricing``'s and returns the PipelineLoader for it. By
+        default, only ``USEquityPricing`` columns can be loaded.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine.run_chunked_pipeline_in_pool
+    """
+    def __init__(self,
+                 bundle,
+                 timestamp=None,
+                 environ=None,
+                 calendar_name='NYSE',
+                 get_loader=None):
+        if timestamp is None:
+            timestamp = pd.Timestamp.utcnow()
+
+        self.bundle = bundle
+        self.timestamp = timestamp
+        self.environ = None if environ is None else dict(environ)
+        self.calendar_name = calendar_name
+        self.get_loader = get_loader
+
+    def _key(self):
+        return (
+            self.bundle,
+            self.timestamp,
+            self.calendar_name,
+            self.get_loader,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, BundleEngineSpec):
+            return NotImplemented
+        return self._key() == other._key() and self.environ == other.environ
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return '%s(%r, timestamp=%r, calendar_name=%r)' % (
+            type(self).__name__,
+            self.bundle,
+            self.timestamp,
+            self.calendar_name,
+        )
+
+    def __call__(self):
+        bundle_data = load(
+            self.bundle,
+            os.environ if self.environ is None else self.environ,
+            self.timestamp,
+        )
+        pricing_loader = USEquityPricingLoader(
+            bundle_data.equity_daily_bar_reader,
+            bundle_data.adjustment_reader,
+        )
+        get_loader = self.get_loader
+
+        def choose_loader(column):
+            if column in USEquityPricing.columns:
+                return pricing_loader
+            if get_loader is not None:
+                return get_loader(column)
+            raise ValueError(
+                "No PipelineLoader registered for column %s." % column
+            )
+
+        return SimplePipelineEngine(
+            choose_loader,
+            get_calendar(self.calendar_name).all_sessions,
+            bundle_data.asset_finder,
+        )
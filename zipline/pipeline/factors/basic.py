@@ -9,11 +9,19 @@ from numpy import (
     full,
     isnan,
     log,
+    newaxis,
     NINF,
     sqrt,
     sum as np_sum,
 )
 
+from zipline.lib.rolling import (
+    rolling_ewma,
+    rolling_ewmstd,
+    rolling_nanmean,
+    rolling_nansum,
+    rolling_nanstd,
+)
 from zipline.pipeline.data import USEquityPricing
 from zipline.utils.input_validation import expect_types
 from zipline.utils.math_utils import (
@@ -53,6 +61,9 @@ class Returns(CustomFactor):
     def compute(self, today, assets, out, close):
         out[:] = (close[-1] - close[0]) / close[0]
 
+    def compute_batch(self, dates, assets, out, mask, close):
+        out[:] = (close[:, -1] - close[:, 0]) / close[:, 0]
+
 
 class DailyReturns(Returns):
     """
@@ -81,6 +92,12 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_batch(self, dates, assets, out, mask, data):
+        out[:] = nanmean(data, axis=1)
+
+    def compute_rolling(self, dates, assets, out, mask, data):
+        out[:] = rolling_nanmean(data, self.window_length)
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -93,6 +110,16 @@ class WeightedAverageValue(CustomFactor):
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
+    def compute_batch(self, dates, assets, out, mask, base, weight):
+        out[:] = nansum(base * weight, axis=1) / nansum(weight, axis=1)
+
+    def compute_rolling(self, dates, assets, out, mask, base, weight):
+        window_length = self.window_length
+        out[:] = (
+            rolling_nansum(base * weight, window_length) /
+            rolling_nansum(weight, window_length)
+        )
+
 
 class VWAP(WeightedAverageValue):
     """
@@ -125,6 +152,20 @@ class MaxDrawdown(CustomFactor, SingleInputMixin):
             peak = nanmax(data[:end + 1, i])
             out[i] = (peak - data[end, i]) / data[end, i]
 
+    def compute_batch(self, dates, assets, out, mask, data):
+        peaks = fmax.accumulate(data, axis=1)
+        drawdowns = peaks - data
+        drawdowns[isnan(drawdowns)] = NINF
+        drawdown_ends = nanargmax(drawdowns, axis=1)
+
+        # The running maximum at the end of the largest drawdown is the peak
+        # before it.
+        rows = arange(len(dates))[:, newaxis]
+        columns = arange(len(assets))
+        peak = peaks[rows, drawdown_ends, columns]
+        end_value = data[rows, drawdown_ends, columns]
+        out[:] = (peak - end_value) / end_value
+
 
 class AverageDollarVolume(CustomFactor):
     """
@@ -139,6 +180,13 @@ class AverageDollarVolume(CustomFactor):
     def compute(self, today, assets, out, close, volume):
         out[:] = nansum(close * volume, axis=0) / len(close)
 
+    def compute_batch(self, dates, assets, out, mask, close, volume):
+        out[:] = nansum(close * volume, axis=1) / close.shape[1]
+
+    def compute_rolling(self, dates, assets, out, mask, close, volume):
+        window_length = self.window_length
+        out[:] = rolling_nansum(close * volume, window_length) / window_length
+
 
 def exponential_weights(length, decay_rate):
     """
@@ -365,6 +413,16 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=exponential_weights(len(data), decay_rate),
         )
 
+    def compute_batch(self, dates, assets, out, mask, data, decay_rate):
+        out[:] = average(
+            data,
+            axis=1,
+            weights=exponential_weights(data.shape[1], decay_rate),
+        )
+
+    def compute_rolling(self, dates, assets, out, mask, data, decay_rate):
+        out[:] = rolling_ewma(data, self.window_length, decay_rate)
+
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
@@ -409,6 +467,25 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
         )
         out[:] = sqrt(variance * bias_correction)
 
+    def compute_batch(self, dates, assets, out, mask, data, decay_rate):
+        weights = exponential_weights(data.shape[1], decay_rate)
+
+        mean = average(data, axis=1, weights=weights)
+        variance = average(
+            (data - mean[:, newaxis]) ** 2,
+            axis=1,
+            weights=weights,
+        )
+
+        squared_weight_sum = (np_sum(weights) ** 2)
+        bias_correction = (
+            squared_weight_sum / (squared_weight_sum - np_sum(weights ** 2))
+        )
+        out[:] = sqrt(variance * bias_correction)
+
+    def compute_rolling(self, dates, assets, out, mask, data, decay_rate):
+        out[:] = rolling_ewmstd(data, self.window_length, decay_rate)
+
 
 class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
     """
@@ -438,6 +515,12 @@ class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
         # Compute weighted averages
         out[:] = nansum(weighted_data, axis=0) / normalizer
 
+    def compute_batch(self, dates, assets, out, mask, data):
+        ndays = data.shape[1]
+        weights = arange(1, ndays + 1, dtype=float64_dtype).reshape(ndays, 1)
+        normalizer = (ndays * (ndays + 1)) / 2
+        out[:] = nansum(data * weights, axis=1) / normalizer
+
 
 class AnnualizedVolatility(CustomFactor):
     """
@@ -460,6 +543,27 @@ class AnnualizedVolatility(CustomFactor):
     def compute(self, today, assets, out, returns, annualization_factor):
         out[:] = nanstd(returns, axis=0) * (annualization_factor ** .5)
 
+    def compute_batch(self,
+                      dates,
+                      assets,
+                      out,
+                      mask,
+                      returns,
+                      annualization_factor):
+        out[:] = nanstd(returns, axis=1) * (annualization_factor ** .5)
+
+    def compute_rolling(self,
+                        dates,
+                        assets,
+                        out,
+                        mask,
+                        returns,
+                        annualization_factor):
+        out[:] = (
+            rolling_nanstd(returns, self.window_length) *
+            (annualization_factor ** .5)
+        )
+
 
 # Convenience aliases
 EWMA = ExponentialWeightedMovingAverage
@@ -1472,6 +1472,62 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
     3rd, 2014, the column of input data for asset A will have 9 leading NaNs
     for the preceding days on which data was not yet available.
 
+    Factors which can be computed for many dates at once with array
+    operations may also implement a method named `compute_batch`, which is
+    called instead of `compute`:
+
+    .. code-block:: python
+
+        def compute_batch(self, dates, assets, out, mask, *inputs):
+           ...
+
+    The values passed to `compute_batch` are as follows::
+
+        dates : pd.DatetimeIndex
+            Row labels for `out` and `mask`.
+        assets : np.array[int64, ndim=1]
+            Column labels for `out`, `mask` and `inputs`.
+        out : np.array[self.dtype, ndim=2]
+            Output array of shape ``(len(dates), len(assets))``.
+        mask : np.array[bool, ndim=2]
+            Array of the same shape as `out` which is True where the output
+            will be used. Values written to `out` where `mask` is False are
+            replaced with `self.missing_value`.
+        *inputs : tuple of np.array
+            Read-only arrays of shape
+            ``(len(dates), window_length, len(assets))`` whose i-th entry is
+            the window that `compute` would receive on ``dates[i]``, without
+            masking out any assets.
+
+    Unlike `compute`, which is only passed the columns of the assets in the
+    mask on each date, `compute_batch` and `compute_rolling` see the column
+    of every asset, including assets which are masked out on some or all of
+    the dates and whose windows may be entirely NaN. They should compute
+    every column without raising, for example by not using functions like
+    ``nanargmax`` which raise on all-NaN columns, and may emit warnings for
+    columns which `compute` would never see. The outputs of masked out
+    assets are then replaced with `self.missing_value`, so results match
+    those of `compute` for the assets in the mask. Factors with ``ndim=1``,
+    whose single output column may depend on which assets are in the mask,
+    are always computed with `compute`.
+
+    Windows are stacked without copies when their data isn't adjusted.
+    `compute_batch` may be called more than once, on consecutive blocks of
+    dates, to bound the size of the stacked inputs. Subclasses which
+    override `compute`, or which set `compute_batch` to None, use `compute`.
+
+    Factors whose inputs are all floats may also implement a method named
+    `compute_rolling`, with the same signature as `compute_batch`, which is
+    called with the rows spanned by the windows instead of the stacked
+    windows: each input has ``len(dates) + window_length - 1`` rows, and the
+    window for ``dates[i]`` is ``input[i:i + window_length]``. This allows
+    statistics to be updated as the window rolls forward, with the kernels in
+    :mod:`zipline.lib.rolling`, rather than computed again for each window.
+    `compute_rolling` is called for each run of dates between adjustments to
+    the inputs, and `compute_batch` is called instead for runs whose inputs
+    contain infinite values, so factors which implement `compute_rolling`
+    must also implement `compute_batch`.
+
     Examples
     --------
 
@@ -1525,6 +1581,20 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
         median_close10 = MedianValue([USEquityPricing.close], window_length=10)
         median_low15 = MedianValue([USEquityPricing.low], window_length=15)
 
+    A CustomFactor computed for all dates at once:
+
+    .. code-block:: python
+
+        class BatchedTenDayRange(CustomFactor):
+            inputs = [USEquityPricing.high, USEquityPricing.low]
+            window_length = 10
+
+            def compute_batch(self, dates, assets, out, mask, highs, lows):
+                from numpy import nanmin, nanmax
+
+                # Reduce over the window axis of each date.
+                out[:] = nanmax(highs, axis=1) - nanmin(lows, axis=1)
+
     A CustomFactor with multiple outputs:
 
     .. code-block:: python
@@ -11,6 +11,12 @@ from numpy import (
     diff,
     dstack,
     inf,
+    isnan,
+    nan,
+    NINF,
+    PINF,
+    where,
+    zeros,
 )
 from numexpr import evaluate
 
@@ -63,6 +69,17 @@ class RSI(CustomFactor, SingleInputMixin):
             out=out,
         )
 
+    def compute_batch(self, dates, assets, out, mask, closes):
+        diffs = diff(closes, axis=1)
+        ups = nanmean(clip(diffs, 0, inf), axis=1)
+        downs = abs(nanmean(clip(diffs, -inf, 0), axis=1))
+        evaluate(
+            "100 - (100 / (1 + (ups / downs)))",
+            local_dict={'ups': ups, 'downs': downs},
+            global_dict={},
+            out=out,
+        )
+
 
 class BollingerBands(CustomFactor):
     """
@@ -92,6 +109,12 @@ class BollingerBands(CustomFactor):
         out.upper = middle + difference
         out.lower = middle - difference
 
+    def compute_batch(self, dates, assets, out, mask, close, k):
+        difference = k * nanstd(close, axis=1)
+        out.middle = middle = nanmean(close, axis=1)
+        out.upper = middle + difference
+        out.lower = middle - difference
+
 
 class Aroon(CustomFactor):
     """
@@ -131,6 +154,20 @@ class Aroon(CustomFactor):
             out=out.down,
         )
 
+    def compute_batch(self, dates, assets, out, mask, lows, highs):
+        wl = self.window_length
+
+        # Unlike nanargmax and nanargmin, argmax and argmin don't raise on
+        # the columns of assets which have no data, which aren't masked out
+        # here.  Their results are replaced with NaN.
+        high_date_index = where(isnan(highs), NINF, highs).argmax(axis=1)
+        low_date_index = where(isnan(lows), PINF, lows).argmin(axis=1)
+        no_highs = isnan(highs).all(axis=1)
+        no_lows = isnan(lows).all(axis=1)
+
+        out.up = where(no_highs, nan, (100 * high_date_index) / (wl - 1))
+        out.down = where(no_lows, nan, (100 * low_date_index) / (wl - 1))
+
 
 class FastStochasticOscillator(CustomFactor):
     """
@@ -172,6 +209,18 @@ class FastStochasticOscillator(CustomFactor):
             out=out,
         )
 
+    def compute_batch(self, dates, assets, out, mask, closes, lows, highs):
+        evaluate(
+            '((tc - ll) / (hh - ll)) * 100',
+            local_dict={
+                'tc': closes[:, -1],
+                'll': nanmin(lows, axis=1),
+                'hh': nanmax(highs, axis=1),
+            },
+            global_dict={},
+            out=out,
+        )
+
 
 class IchimokuKinkoHyo(CustomFactor):
     """Compute the various metrics for the Ichimoku Kinko Hyo (Ichimoku Cloud).
@@ -242,6 +291,30 @@ class IchimokuKinkoHyo(CustomFactor):
         out.senkou_span_b = (high.max(axis=0) + low.min(axis=0)) / 2
         out.chikou_span = close[chikou_span_length]
 
+    def compute_batch(self,
+                      dates,
+                      assets,
+                      out,
+                      mask,
+                      high,
+                      low,
+                      close,
+                      tenkan_sen_length,
+                      kijun_sen_length,
+                      chikou_span_length):
+
+        out.tenkan_sen = tenkan_sen = (
+            high[:, -tenkan_sen_length:].max(axis=1) +
+            low[:, -tenkan_sen_length:].min(axis=1)
+        ) / 2
+        out.kijun_sen = kijun_sen = (
+            high[:, -kijun_sen_length:].max(axis=1) +
+            low[:, -kijun_sen_length:].min(axis=1)
+        ) / 2
+        out.senkou_span_a = (tenkan_sen + kijun_sen) / 2
+        out.senkou_span_b = (high.max(axis=1) + low.min(axis=1)) / 2
+        out.chikou_span = close[:, chikou_span_length]
+
 
 class RateOfChangePercentage(CustomFactor):
     """
@@ -265,6 +338,16 @@ class RateOfChangePercentage(CustomFactor):
                  out=out,
                  )
 
+    def compute_batch(self, dates, assets, out, mask, close):
+        evaluate('((tc - pc) / pc) * 100',
+                 local_dict={
+                     'tc': close[:, -1],
+                     'pc': close[:, 0],
+                 },
+                 global_dict={},
+                 out=out,
+                 )
+
 
 class TrueRange(CustomFactor):
     """
@@ -298,6 +381,19 @@ class TrueRange(CustomFactor):
             2
         )
 
+    def compute_batch(self, dates, assets, out, mask, highs, lows, closes):
+        high_to_low = highs[:, -1] - lows[:, -1]
+        high_to_prev_close = abs(highs[:, -1] - closes[:, -2])
+        low_to_prev_close = abs(lows[:, -1] - closes[:, -2])
+        out[:] = nanmax(
+            dstack((
+                high_to_low,
+                high_to_prev_close,
+                low_to_prev_close,
+            )),
+            2
+        )
+
 
 class MovingAverageConvergenceDivergenceSignal(CustomFactor):
     """
@@ -371,6 +467,22 @@ class MovingAverageConvergenceDivergenceSignal(CustomFactor):
             weights=exponential_weights(length, decay_rate)
         )
 
+    def _rolling_ewma(self, data, length, count):
+        """
+        Compute the EWMAs of the last ``count`` windows of ``length`` rows
+        along the second axis of ``data``.
+
+        This sums shifted slices of ``data`` rather than restriding it, so no
+        array larger than the result is allocated.
+        """
+        decay_rate = 1.0 - (2.0 / (1.0 + length))
+        weights = exponential_weights(length, decay_rate)
+        start = data.shape[1] - length - count + 1
+        out = zeros((data.shape[0], count) + data.shape[2:])
+        for i, weight in enumerate(weights):
+            out += weight * data[:, start + i:start + i + count]
+        return out / weights.sum()
+
     def compute(self, today, assets, out, close, fast_period, slow_period,
                 signal_period):
         slow_EWMA = self._ewma(
@@ -384,6 +496,13 @@ class MovingAverageConvergenceDivergenceSignal(CustomFactor):
         macd = fast_EWMA - slow_EWMA
         out[:] = self._ewma(macd.T, signal_period)
 
+    def compute_batch(self, dates, assets, out, mask, close, fast_period,
+                      slow_period, signal_period):
+        slow_EWMA = self._rolling_ewma(close, slow_period, signal_period)
+        fast_EWMA = self._rolling_ewma(close, fast_period, signal_period)
+        macd = fast_EWMA - slow_EWMA
+        out[:] = self._rolling_ewma(macd, signal_period, 1)[:, 0]
+
 
 # Convenience aliases.
 MACDSignal = MovingAverageConvergenceDivergenceSignal
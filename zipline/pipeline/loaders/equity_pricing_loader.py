@@ -16,6 +16,10 @@ from numpy import (
     uint32,
 )
 
+from zipline.data.parquet_daily_bars import (
+    ParquetDailyBarReader,
+    is_parquet_daily_bar_dir,
+)
 from zipline.data.us_equity_pricing import (
     BcolzDailyBarReader,
     SQLiteAdjustmentReader,
@@ -48,18 +52,23 @@ class USEquityPricingLoader(PipelineLoader):
     @classmethod
     def from_files(cls, pricing_path, adjustments_path):
         """
-        Create a loader from a bcolz equity pricing dir and a SQLite
-        adjustments path.
+        Create a loader from a bcolz or parquet equity pricing dir and a
+        SQLite adjustments path.
 
         Parameters
         ----------
         pricing_path : str
-            Path to a bcolz directory written by a BcolzDailyBarWriter.
+            Path to a bcolz directory written by a BcolzDailyBarWriter, or to a
+            directory written by a ParquetDailyBarWriter.
         adjusments_path : str
             Path to an adjusments db written by a SQLiteAdjustmentWriter.
         """
+        if is_parquet_daily_bar_dir(pricing_path):
+            raw_price_loader = ParquetDailyBarReader(pricing_path)
+        else:
+            raw_price_loader = BcolzDailyBarReader(pricing_path)
         return cls(
-            BcolzDailyBarReader(pricing_path),
+            raw_price_loader,
             SQLiteAdjustmentReader(adjustments_path)
         )
 
@@ -6,6 +6,7 @@ from textwrap import dedent
 from numpy import (
     array,
     full,
+    isinf,
     recarray,
     vstack,
 )
@@ -16,8 +17,10 @@ from zipline.errors import (
     UnsupportedDataType,
     NoFurtherDataError,
 )
+from zipline.lib.rolling import aligned_spans, rolling_windows
 from zipline.utils.context_tricks import nop_context
 from zipline.utils.input_validation import expect_types
+from zipline.utils.numpy_utils import float64_dtype, object_dtype
 from zipline.utils.sharedoc import (
     format_docstring,
     PIPELINE_ALIAS_NAME_DOC,
@@ -104,6 +107,11 @@ class CustomTermMixin(object):
     Implements `_compute` in terms of a user-defined `compute` function, which
     is mapped over the input windows.
 
+    Terms may also define a `compute_batch` function, which is called with
+    the stacked windows of many dates at once, and a `compute_rolling`
+    function, which is called with the rows spanned by the windows of many
+    dates.
+
     Used by CustomFactor, CustomFilter, CustomClassifier, etc.
     """
     ctx = nop_context
@@ -146,6 +154,39 @@ class CustomTermMixin(object):
         """
         raise NotImplementedError()
 
+    # Subclasses may define ``compute_batch(dates, assets, out, mask,
+    # *arrays)`` and ``compute_rolling(dates, assets, out, mask, *spans)``.
+    # See CustomFactor for details.
+    #
+    # The largest number of input values to stack for one call to
+    # ``compute_batch``.
+    _max_batch_size = 2 ** 24
+
+    # The ways a term can be computed, from slowest to fastest.
+    _compute_methods = ('compute', 'compute_batch', 'compute_rolling')
+
+    @classmethod
+    def _compute_method(cls):
+        """
+        Get the name of the method which computes this term.
+
+        This is the method defined by the most derived class, preferring the
+        fastest method if a class defines several.  Setting a method to None
+        disables it and any faster method defined by a base class.
+        """
+        methods = list(cls._compute_methods)
+        for type_ in cls.__mro__:
+            attrs = vars(type_)
+            for i in reversed(range(len(methods))):
+                name = methods[i]
+                if name not in attrs:
+                    continue
+                if attrs[name] is None:
+                    del methods[i:]
+                    continue
+                return name
+        return 'compute'
+
     def _allocate_output(self, windows, shape):
         """
         Allocate an output array whose rows should be passed to `self.compute`.
@@ -191,6 +232,24 @@ class CustomTermMixin(object):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        method = self._compute_method()
+        batched = (
+            method != 'compute' and
+            self.windowed and
+            # The batched methods see the columns of every asset, so terms
+            # with a single output column, which may depend on which assets
+            # are masked out, are computed one date at a time.
+            self.ndim != 1 and
+            # Windows of strings are LabelArrays, which can't be stacked.
+            not any(input_.dtype == object_dtype for input_ in self.inputs)
+        )
+        if batched:
+            # The rolling kernels work on floats.
+            rolling = method == 'compute_rolling' and all(
+                input_.dtype == float64_dtype for input_ in self.inputs
+            )
+            return self._compute_spans(windows, dates, assets, mask, rolling)
+
         format_inputs = self._format_inputs
         compute = self.compute
         params = self.params
@@ -215,6 +274,68 @@ class CustomTermMixin(object):
                 out[idx][out_mask] = out_row
         return out
 
+    def _compute_spans(self, windows, dates, assets, mask, rolling):
+        """
+        Call the term's `compute_rolling` or `compute_batch` function on the
+        rows spanned by the windows between adjustments, with a pre-built
+        output array.
+
+        Unlike `compute`, these are passed the columns of every asset, and
+        the outputs of the assets which are masked out are replaced with the
+        missing value afterwards.
+        """
+        params = self.params
+        window_length = self.window_length
+
+        out = self._allocate_output(windows, mask.shape)
+
+        # The windows are advanced one block of dates at a time, so that the
+        # spans copied where adjustments change the data, and the windows
+        # stacked for ``compute_batch``, are bounded by ``_max_batch_size``
+        # values for each block instead of growing with the number of dates.
+        block_size = max(
+            1,
+            self._max_batch_size // max(
+                window_length * len(assets) * len(windows), 1,
+            ),
+        )
+
+        num_dates = len(dates)
+        with self.ctx:
+            for block_start in range(0, num_dates, block_size):
+                count = min(block_size, num_dates - block_start)
+                spans = [window.spans(count) for window in windows]
+                pieces = aligned_spans(spans, window_length, count)
+                for start, stop, arrays in pieces:
+                    start += block_start
+                    stop += block_start
+                    # Infinities don't cancel out of the running sums of the
+                    # rolling kernels.
+                    if rolling and not any(isinf(a).any() for a in arrays):
+                        self.compute_rolling(
+                            dates[start:stop],
+                            assets,
+                            out[start:stop],
+                            mask[start:stop],
+                            *arrays,
+                            **params
+                        )
+                    else:
+                        self.compute_batch(
+                            dates[start:stop],
+                            assets,
+                            out[start:stop],
+                            mask[start:stop],
+                            *[
+                                rolling_windows(a, window_length)
+                                for a in arrays
+                            ],
+                            **params
+                        )
+
+        out[~mask] = self.missing_value
+        return out
+
     def short_repr(self):
         """Short repr to use when rendering Pipeline graphs."""
         return type(self).__name__ + '(%d)' % self.window_length
@@ -130,6 +130,9 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Keep the identity so that results of the term can be cached
+            # across processes. See zipline.pipeline.term_cache.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
@@ -0,0 +1,396 @@
+"""
+An on-disk cache of computed pipeline terms, shared across pipeline runs and
+processes.
+"""
+import errno
+from hashlib import sha1
+import os
+from threading import Lock
+from types import CodeType, FunctionType
+
+import numpy as np
+import pandas as pd
+from six import PY2
+
+from zipline.utils.cache import working_file
+from zipline.utils.paths import ensure_directory
+
+from .term import ComputableTerm, Term
+
+_SUFFIX = '.npy'
+
+
+def _code_digest(code, hasher):
+    hasher.update(code.co_code)
+    # The bytecode refers to the globals, attributes and variables it uses by
+    # their index in these tuples, so the names are part of the code.
+    for names in (code.co_names, code.co_varnames, code.co_freevars):
+        hasher.update(repr(names).encode('utf-8'))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _code_digest(const, hasher)
+        else:
+            hasher.update(repr(const).encode('utf-8'))
+
+
+def _function_digest(function, hasher):
+    _code_digest(function.__code__, hasher)
+    for cell in function.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            # The cell is empty.
+            hasher.update(b'<empty cell>')
+            continue
+        if isinstance(value, FunctionType):
+            _code_digest(value.__code__, hasher)
+        elif callable(value) and hasattr(value, '__name__'):
+            # Builtins and ufuncs, whose reprs may include their address.
+            hasher.update(
+                ('%s.%s' % (
+                    getattr(value, '__module__', None),
+                    value.__name__,
+                )).encode('utf-8'),
+            )
+        else:
+            hasher.update(_identity_repr(value, {}).encode('utf-8'))
+
+
+def _identity_repr(value, digests):
+    """
+    Build a representation of a term identity component which is the same in
+    every process.
+    """
+    if isinstance(value, Term):
+        return term_digest(value, digests)
+    if isinstance(value, type):
+        return '%s.%s' % (value.__module__, value.__name__)
+    if isinstance(value, np.dtype):
+        return str(value)
+    if isinstance(value, (tuple, list, frozenset)):
+        if isinstance(value, frozenset):
+            value = sorted(value, key=repr)
+        return '(%s)' % ', '.join(_identity_repr(v, digests) for v in value)
+    return repr(value)
+
+
+def term_digest(term, digests=None):
+    """
+    Compute a digest of a term's identity.
+
+    The digest covers the term's type, the code, names and closure values of
+    its ``compute``, ``compute_batch`` and ``compute_rolling`` methods, and
+    the parameters which determine its identity, including the digests of
+    its inputs and mask. Terms that compare equal in one process have the
+    same digest in another.
+
+    Parameters
+    ----------
+    term : zipline.pipeline.term.Term
+        The term to digest.
+    digests : dict[Term -> str], optional
+        Digests of terms which have already been computed, which is updated
+        with the digest of ``term`` and its dependencies.
+
+    Returns
+    -------
+    digest : str or None
+        The hex digest of the term, or None if the term has no identity.
+    """
+    if digests is None:
+        digests = {}
+    try:
+        return digests[term]
+    except KeyError:
+        pass
+
+    identity = getattr(term, '_identity', None)
+    if identity is None:
+        digests[term] = None
+        return None
+
+    hasher = sha1(_identity_repr(identity, digests).encode('utf-8'))
+    for name in ('compute', 'compute_batch', 'compute_rolling'):
+        compute = getattr(type(term), name, None)
+        if PY2:
+            compute = getattr(compute, '__func__', compute)
+        if isinstance(compute, FunctionType):
+            _function_digest(compute, hasher)
+
+    digest = digests[term] = hasher.hexdigest()
+    return digest
+
+
+class TermResultCache(object):
+    """
+    A least recently used, size-bounded, on-disk cache of computed pipeline
+    terms.
+
+    Entries are keyed by the identity of the term, the dates and assets it was
+    computed for, and the ingestion timestamp of the data it was computed
+    from, so the cache can be shared by pipelines which are run again in
+    other processes.
+
+    Parameters
+    ----------
+    path : str
+        The directory where the entries are stored.
+    ingestion_timestamp : pd.Timestamp
+        The timestamp of the bundle ingestion that the engine's loaders read
+        from. Entries computed from other ingestions are never used.
+    max_bytes : int, optional
+        The total size of the entries to keep. When an entry takes the cache
+        over this size, the least recently used entries are removed until it
+        fits again. If not provided, the size is unbounded.
+
+    Attributes
+    ----------
+    hits : int
+        The number of terms which were read from the cache.
+    misses : int
+        The number of cacheable terms which were not in the cache.
+    writes : int
+        The number of terms which were written to the cache.
+    evictions : int
+        The number of entries removed to stay within ``max_bytes``.
+
+    Notes
+    -----
+    Windowed terms, such as custom factors, and the outputs of a pipeline are
+    cached. Terms whose results are not plain ndarrays of numbers, booleans or
+    datetimes, such as string classifiers, are not cached.
+
+    The cache assumes that a term's results only depend on its identity and
+    on the data of the ingestion. Changes to code called by a custom term's
+    ``compute``, rather than to ``compute`` itself, are not detected.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine
+    """
+    def __init__(self, path, ingestion_timestamp, max_bytes=None):
+        self.path = path
+        self.ingestion_timestamp = pd.Timestamp(ingestion_timestamp)
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        ensure_directory(path)
+
+    @staticmethod
+    def _should_cache(term, execution_plan):
+        return isinstance(term, ComputableTerm) and (
+            term.windowed or term in execution_plan.outputs.values()
+        )
+
+    def _entry_path(self, term, root_mask_term, execution_plan, dates,
+                    assets, digests):
+        digest = term_digest(term, digests)
+        if digest is None:
+            return None
+
+        extra_rows = execution_plan.extra_rows
+        term_dates = dates[extra_rows[root_mask_term] - extra_rows[term]:]
+        key = sha1(
+            '|'.join((
+                digest,
+                str(self.ingestion_timestamp.value),
+                str(term_dates[0].value),
+                str(term_dates[-1].value),
+                str(len(term_dates)),
+            )).encode('utf-8'),
+        )
+        key.update(np.asarray(assets, dtype='int64').tobytes())
+        return os.path.join(self.path, key.hexdigest() + _SUFFIX)
+
+    def populate_initial_workspace(self,
+                                   initial_workspace,
+                                   root_mask_term,
+                                   execution_plan,
+                                   dates,
+                                   assets):
+        """
+        Add the cached results of the terms of ``execution_plan`` to
+        ``initial_workspace``.
+
+        This has the same signature as
+        :func:`zipline.pipeline.engine.default_populate_initial_workspace`.
+
+        Returns
+        -------
+        populated_initial_workspace : dict[term, array-like]
+            A copy of ``initial_workspace`` with the cached terms.
+        """
+        workspace = initial_workspace.copy()
+        graph = execution_plan.graph
+        outputs = set(execution_plan.outputs.values())
+        digests = {}
+
+        # Walk the terms from the outputs to the loadable terms, so that the
+        # inputs of terms which were found in the cache aren't read.
+        to_compute = set()
+        for term in reversed(list(execution_plan.ordered())):
+            if term in workspace:
+                continue
+            if term not in outputs and not any(
+                    dependent in to_compute
+                    for dependent in graph.successors(term)):
+                continue
+
+            if self._should_cache(term, execution_plan):
+                value = self._read(
+                    term,
+                    root_mask_term,
+                    execution_plan,
+                    dates,
+                    assets,
+                    digests,
+                )
+                if value is not None:
+                    workspace[term] = value
+                    continue
+
+            to_compute.add(term)
+
+        return workspace
+
+    def _read(self, term, root_mask_term, execution_plan, dates, assets,
+              digests):
+        path = self._entry_path(
+            term, root_mask_term, execution_plan, dates, assets, digests,
+        )
+        if path is None:
+            return None
+
+        try:
+            value = np.load(path)
+        except IOError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Mark the entry as recently used.
+        os.utime(path, None)
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def add(self,
+            term,
+            value,
+            root_mask_term,
+            execution_plan,
+            dates,
+            assets):
+        """
+        Write the result of a term to the cache, if it should be cached.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The computed term.
+        value : np.ndarray
+            The result of ``term``.
+        root_mask_term : Term
+            The root mask term of ``execution_plan``.
+        execution_plan : ExecutionPlan
+            The execution plan that ``term`` was computed for.
+        dates : pd.DatetimeIndex
+            All of the dates of the pipeline run, including extra rows.
+        assets : pd.Int64Index
+            All of the assets of the pipeline run.
+        """
+        if type(value) is not np.ndarray or value.dtype.hasobject:
+            return
+        if not self._should_cache(term, execution_plan):
+            return
+
+        path = self._entry_path(
+            term, root_mask_term, execution_plan, dates, assets, {},
+        )
+        if path is None:
+            return
+
+        with working_file(path, dir=self.path, suffix='.tmp') as f:
+            with open(f.path, 'wb') as out:
+                np.save(out, value)
+
+        with self._lock:
+            self.writes += 1
+            if self.max_bytes is not None:
+                self._evict(keep=path)
+
+    def _entries(self):
+        """
+        Return (mtime, size, path) for each entry, least recently used first.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                # Another process may have removed the entry.
+                if e.errno != errno.ENOENT:
+                    raise
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def _evict(self, keep):
+        entries = self._entries()
+        nbytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if nbytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            nbytes -= size
+            self.evictions += 1
+
+    @property
+    def nbytes(self):
+        """The total size of the entries in the cache.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self):
+        return len(self._entries())
+
+    def clear(self):
+        """Remove all of the entries in the cache.
+        """
+        for _, _, path in self._entries():
+            os.remove(path)
+
+    def reset_stats(self):
+        """Reset the hit, miss, write and eviction counters to zero.
+        """
+        self.hits = self.misses = self.writes = self.evictions = 0
+
+    def __repr__(self):
+        return (
+            '<%s: path=%r, max_bytes=%s, hits=%d, misses=%d, writes=%d,'
+            ' evictions=%d>' % (
+                type(self).__name__,
+                self.path,
+                self.max_bytes,
+                self.hits,
+                self.misses,
+                self.writes,
+                self.evictions,
+            )
+        )
@@ -947,6 +947,9 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
         If this flag is set, use the value as the `read_all_threshold`
         parameter to BcolzDailyBarReader, otherwise use the default
         value.
+    BCOLZ_DAILY_BAR_READ_WORKERS : int
+        If this flag is set, use the value as the `read_workers` parameter to
+        BcolzDailyBarReader, otherwise read on the calling thread.
     EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE : bool
         If this flag is set, `make_equity_daily_bar_data` will read data from
         the minute bar reader defined by a `WithBcolzEquityMinuteBarReader`.
@@ -966,6 +969,7 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
     """
     BCOLZ_DAILY_BAR_PATH = 'daily_equity_pricing.bcolz'
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = None
+    BCOLZ_DAILY_BAR_READ_WORKERS = None
     EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE = False
     # allows WithBcolzEquityDailyBarReaderFromCSVs to call the
     # `write_csvs`method without needing to reimplement `init_class_fixtures`
@@ -996,9 +1000,16 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
 
         if cls.BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD is not None:
             cls.bcolz_equity_daily_bar_reader = BcolzDailyBarReader(
-                t, cls.BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD)
+                t,
+                cls.BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD,
+                read_workers=cls.BCOLZ_DAILY_BAR_READ_WORKERS,
+            )
         else:
-            cls.bcolz_equity_daily_bar_reader = BcolzDailyBarReader(t)
+            cls.bcolz_equity_daily_bar_reader = BcolzDailyBarReader(
+                t,
+                read_workers=cls.BCOLZ_DAILY_BAR_READ_WORKERS,
+            )
+        cls.add_class_callback(cls.bcolz_equity_daily_bar_reader.close)
 
 
 class WithBcolzFutureDailyBarReader(WithFutureDailyBarData, WithTmpDir):
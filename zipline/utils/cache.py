@@ -1,13 +1,14 @@
 """
 Caching utilities for zipline
 """
-from collections import MutableMapping
+from collections import MutableMapping, OrderedDict
 import errno
 import os
 import pickle
 from distutils import dir_util
 from shutil import rmtree, move
 from tempfile import mkdtemp, NamedTemporaryFile
+from threading import Lock
 
 import pandas as pd
 
@@ -170,6 +171,133 @@ class ExpiringCache(object):
         self._cache[key] = CachedObject(value, expiration_dt)
 
 
+class ByteLimitedLRU(MutableMapping):
+    """
+    A least recently used cache bounded by the total size of its values.
+
+    Parameters
+    ----------
+    maxbytes : int, optional
+        The total size of the values to hold. When an insertion takes the
+        cache over this size, the least recently used values are evicted
+        until it fits again. A single value larger than ``maxbytes`` is still
+        held, on its own. If not provided, the size is unbounded.
+    sizeof : callable, optional
+        A function which takes a value and returns its size in bytes.
+        Defaults to reading ``value.nbytes``.
+    maxsize : int, optional
+        An additional bound on the number of values held.
+
+    Attributes
+    ----------
+    nbytes : int
+        The total size of the values currently held.
+    hits : int
+        The number of lookups which found a value.
+    misses : int
+        The number of lookups which raised a ``KeyError``.
+    evictions : int
+        The number of values evicted to stay within the bounds.
+
+    Examples
+    --------
+    >>> cache = ByteLimitedLRU(maxbytes=10, sizeof=len)
+    >>> cache['a'] = 'aaaa'
+    >>> cache['b'] = 'bbbb'
+    >>> cache['a']
+    'aaaa'
+    >>> cache['c'] = 'cccc'
+    >>> sorted(cache)
+    ['a', 'c']
+    >>> cache.hits, cache.misses, cache.evictions, cache.nbytes
+    (1, 0, 1, 8)
+    """
+    def __init__(self, maxbytes=None, sizeof=None, maxsize=None):
+        self.maxbytes = maxbytes
+        self.maxsize = maxsize
+        self._sizeof = sizeof if sizeof is not None else _nbytes
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = Lock()
+
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            # Move the key to the most recently used position.
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            self._evict()
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def _remove(self, key):
+        del self._data[key]
+        self.nbytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        maxbytes = self.maxbytes
+        maxsize = self.maxsize
+        # Never evict the value which was just inserted.
+        while len(self._data) > 1 and (
+                (maxbytes is not None and self.nbytes > maxbytes) or
+                (maxsize is not None and len(self._data) > maxsize)):
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+    def reset_stats(self):
+        """Reset the hit, miss and eviction counters to zero.
+        """
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return (
+            '<%s: len=%d, nbytes=%d, maxbytes=%s, hits=%d, misses=%d,'
+            ' evictions=%d>' % (
+                type(self).__name__,
+                len(self),
+                self.nbytes,
+                self.maxbytes,
+                self.hits,
+                self.misses,
+                self.evictions,
+            )
+        )
+
+
+def _nbytes(value):
+    return value.nbytes
+
+
 class dataframe_cache(MutableMapping):
     """A disk-backed cache for dataframes.
 
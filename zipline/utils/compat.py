@@ -6,6 +6,8 @@ import sys
 if PY2:
     from ctypes import py_object, pythonapi
 
+    from funcsigs import signature
+
     mappingproxy = pythonapi.PyDictProxy_New
     mappingproxy.argtypes = [py_object]
     mappingproxy.restype = py_object
@@ -49,6 +51,7 @@ if PY2:
                                  assigned=assigned, updated=updated)
 
 else:
+    from inspect import signature
     from types import MappingProxyType as mappingproxy
 
     def exc_clear():
@@ -64,5 +67,6 @@ unicode = type(u'')
 
 __all__ = [
     'mappingproxy',
+    'signature',
     'unicode',
 ]
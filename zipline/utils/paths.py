@@ -7,6 +7,8 @@ Otherwise default to expanduser(~/.zipline)
 from errno import EEXIST
 import os
 from os.path import exists, expanduser, join
+import shutil
+import stat
 
 import pandas as pd
 
@@ -59,6 +61,32 @@ def ensure_file(path):
     open(path, 'a+').close()  # touch the file
 
 
+def copy_linked_files(path):
+    """
+    Make the files under the directory ``path`` safe to write to in place.
+
+    Each file which is hard-linked elsewhere is replaced with a copy of
+    itself, so that writing to it can't change the other links, and each
+    read-only file is made writable.
+
+    Parameters
+    ----------
+    path : str
+        The directory whose files are about to be written to.
+    """
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            file_path = join(dirpath, filename)
+            st = os.stat(file_path)
+            if st.st_nlink > 1:
+                tmp_path = file_path + '.copy'
+                # copyfile doesn't copy the read-only mode of the link.
+                shutil.copyfile(file_path, tmp_path)
+                os.rename(tmp_path, file_path)
+            elif not st.st_mode & stat.S_IWUSR:
+                os.chmod(file_path, st.st_mode | stat.S_IWUSR)
+
+
 def update_modified_time(path, times=None):
     """
     Updates the modified time of an existing file. This will create any